@@ -0,0 +1,100 @@
+"""Benchmark of encrypting asyncio streams.
+
+Many concurrent clients send data to a loopback server which encrypts it
+back with thread and process pool executors. Prints throughput and the
+longest stall of event loop measured by a ticking task. Process workers
+get the key by pool initializer.
+
+Usage:
+    PYTHONPATH=src/ python benchmarks/asyncio_streams.py [connections] [mode]
+"""
+
+import asyncio
+import multiprocessing
+import secrets
+import sys
+import time
+
+from concurrent import futures
+
+from aes import modes
+from aes import streams
+from aes.key import Key
+
+_TICK = 0.001
+
+
+async def _tick(stalls):
+    """Records the longest delay of ticks."""
+    while True:
+        start = time.perf_counter()
+        await asyncio.sleep(_TICK)
+        stalls.append(time.perf_counter() - start - _TICK)
+
+
+async def _serve(executor, key, connections, size, mode):
+    """Returns time of encrypting data of all connections and stalls."""
+    iv = secrets.token_bytes(modes.get(mode).IV_SIZE)
+    data = secrets.token_bytes(size)
+
+    async def handle(reader, writer):
+        await streams.encrypt_stream(
+            reader, writer, key, executor=executor, mode=mode, iv=iv)
+        writer.close()
+        await writer.wait_closed()
+
+    async def request(port):
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+        writer.write(data)
+        writer.write_eof()
+        await reader.read()
+        writer.close()
+        await writer.wait_closed()
+
+    stalls = []
+    ticker = asyncio.create_task(_tick(stalls))
+
+    server = await asyncio.start_server(handle, '127.0.0.1', 0)
+    async with server:
+        port = server.sockets[0].getsockname()[1]
+
+        start = time.perf_counter()
+        await asyncio.gather(*(request(port) for _ in range(connections)))
+        elapsed = time.perf_counter() - start
+
+    ticker.cancel()
+
+    return elapsed, max(stalls, default=0)
+
+
+def main(connections=32, mode='ctr', size=1 << 20):
+    """Prints throughput and loop stalls of executors."""
+    key = Key(secrets.token_bytes(16))
+    workers = multiprocessing.cpu_count()
+    # Workers must not inherit open sockets, fork is not safe.
+    method = (
+        'forkserver'
+        if 'forkserver' in multiprocessing.get_all_start_methods()
+        else 'spawn'
+    )
+    context = multiprocessing.get_context(method)
+
+    for title, executor in (
+            ('threads', futures.ThreadPoolExecutor(workers)),
+            ('processes', futures.ProcessPoolExecutor(
+                workers, mp_context=context,
+                initializer=streams.initialize, initargs=(key,)))
+    ):
+        with executor:
+            elapsed, stall = asyncio.run(
+                _serve(executor, key, connections, size, mode))
+
+        print(
+            f'{title:>9}: {connections} {mode} connections, '
+            f'{connections * size / elapsed / (1 << 20):.2f} MiB/s, '
+            f'longest loop stall {1000 * stall:.1f}ms'
+        )
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:2]), *sys.argv[2:3])
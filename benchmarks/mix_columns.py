@@ -0,0 +1,77 @@
+"""Benchmark of table-driven MixColumns.
+
+Compares decrypt/encrypt speed ratio of the step-by-step cipher using
+multiplication tables against the former chains of xtime calls.
+
+Usage:
+    PYTHONPATH=src/ python benchmarks/mix_columns.py
+"""
+# pylint: disable=protected-access
+
+import secrets
+import timeit
+
+from unittest import mock
+
+import aes
+
+from aes import constants
+from aes import utils
+from aes.key import Key
+from aes.state import State
+
+
+class _Chain:  # pylint: disable=too-few-public-methods
+    """Looks multiplication up by calling chain of xtime calls."""
+
+    def __init__(self, operation):
+        self.operation = operation
+
+    def __getitem__(self, number):
+        return self.operation(number)
+
+
+def _chains():
+    """Returns MixColumns rows backed by xtime calls instead of tables."""
+    operations = utils._MUL_OPS_MAPPING
+
+    return {
+        inverse: tuple(
+            tuple(_Chain(operations[multiplier]) for multiplier in row)
+            for row in matrix
+        )
+        for inverse, matrix in (
+            (False, constants.FORWARD_MIX_COLUMNS),
+            (True, constants.INVERSE_MIX_COLUMNS)
+        )
+    }
+
+
+def _measure(number):
+    """Returns encrypt and decrypt timings."""
+    key = Key(secrets.token_bytes(constants.DEFAULT_KEY_SIZE >> 3))
+    data = bytearray(secrets.token_bytes(4 * constants.NB))
+
+    encrypt = timeit.timeit(
+        lambda: aes.encrypt(State.load(data, 0), key), number=number)
+    decrypt = timeit.timeit(
+        lambda: aes.decrypt(State.load(data, 0), key), number=number)
+
+    return encrypt, decrypt
+
+
+def main(number=2000):
+    """Prints timings with and without multiplication tables."""
+    with mock.patch.dict(utils._MIX_COLUMNS_TABLES, _chains()):
+        before = _measure(number)
+    after = _measure(number)
+
+    for title, (encrypt, decrypt) in (('xtime', before), ('tables', after)):
+        print(
+            f'{title:>6}: encrypt {encrypt:.3f}s, decrypt {decrypt:.3f}s, '
+            f'ratio {decrypt / encrypt:.2f}'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -15,7 +15,13 @@ core.setup(
     author='Pavel Tsialnou',
     author_email='paveltsialnou@icloud.com',
     url='https://github.com/paveltsialnou/PyAES',
-    packages=['pyaes', 'pyaes.aes', 'pyaes.tool'],
+    packages=['pyaes', 'pyaes.aes', 'pyaes.aes.engines',
+              'pyaes.aes.modes', 'pyaes.tool'],
     package_dir={
-        'pyaes': 'src/', 'pyaes.aes': 'src/aes/', 'pyaes.tool': 'src/tool/'},
+        'pyaes': 'src/',
+        'pyaes.aes': 'src/aes/',
+        'pyaes.aes.engines': 'src/aes/engines/',
+        'pyaes.aes.modes': 'src/aes/modes/',
+        'pyaes.tool': 'src/tool/'
+    },
 )
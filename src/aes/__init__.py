@@ -1,27 +1,56 @@
 """AES decrypt/encrypt functions."""
 
 from aes import constants
+from aes import engines
 from aes import steps
+from aes.block import Block
 
+# Steps act over State only, blocks go through this engine by default.
+BLOCK_ENGINE = 'table'
+
+
+def decrypt(state, key, *, engine=None):
+    """Decrypts state.
+
+    Runs the step-by-step equivalent inverse cipher (FIPS 197, 5.3.5)
+    unless engine name is given or state is Block.
+    """
+    if engine is None and isinstance(state, Block):
+        engine = BLOCK_ENGINE
+
+    if engine is not None:
+        engines.get(engine).decrypt(state, key)
+        return
 
-def decrypt(state, key):
-    """Decrypts state."""
     rounds = constants.ROUNDS[key.size]
-    steps.add_round_key(state, key.schedule, current_round=rounds)
+    schedule = key.decryption_schedule
+
+    steps.add_round_key(state, schedule, current_round=rounds)
 
     for current_round in range(rounds - 1, 0, -1):
-        steps.shift_rows(state, inverse=True)
         steps.sub_bytes(state, inverse=True)
-        steps.add_round_key(state, key.schedule, current_round=current_round)
+        steps.shift_rows(state, inverse=True)
         steps.mix_columns(state, inverse=True)
+        steps.add_round_key(state, schedule, current_round=current_round)
 
-    steps.shift_rows(state, inverse=True)
     steps.sub_bytes(state, inverse=True)
-    steps.add_round_key(state, key.schedule, current_round=0)
+    steps.shift_rows(state, inverse=True)
+    steps.add_round_key(state, schedule, current_round=0)
+
+
+def encrypt(state, key, *, engine=None):
+    """Encrypts state.
+
+    Runs the step-by-step cipher unless engine name is given or state
+    is Block.
+    """
+    if engine is None and isinstance(state, Block):
+        engine = BLOCK_ENGINE
 
+    if engine is not None:
+        engines.get(engine).encrypt(state, key)
+        return
 
-def encrypt(state, key):
-    """Encrypts state."""
     rounds = constants.ROUNDS[key.size]
 
     steps.add_round_key(state, key.schedule, current_round=0)
@@ -37,4 +66,4 @@ def encrypt(state, key):
     steps.add_round_key(state, key.schedule, current_round=rounds)
 
 
-__all__ = ('decrypt', 'encrypt')
+__all__ = ('BLOCK_ENGINE', 'decrypt', 'encrypt')
@@ -0,0 +1,93 @@
+"""Compact state objects."""
+
+import functools
+import pathlib
+
+from aes import constants
+from aes import errors
+
+_WORD_MASK = 0xFFFFFFFF
+
+
+class Block:
+    """Represents state packed into a single 128-bit integer."""
+
+    __slots__ = ('value',)
+
+    def __init__(self, data):
+        if len(data) != 4 * constants.NB:
+            raise errors.StateSizeError()
+
+        self.value = int.from_bytes(data, 'big')
+
+    def __bytes__(self):
+        return self.value.to_bytes(4 * constants.NB, 'big')
+
+    def __eq__(self, other):
+        return self.value == other.value
+
+    __hash__ = None
+
+    def __ixor__(self, round_key):
+        """The AddRoundKey step."""
+        self.value ^= round_key
+        return self
+
+    @property
+    def words(self):
+        """Block columns as 32-bit words."""
+        value = self.value
+        return (
+            value >> 96,
+            value >> 64 & _WORD_MASK,
+            value >> 32 & _WORD_MASK,
+            value & _WORD_MASK
+        )
+
+    @words.setter
+    def words(self, words):
+        word0, word1, word2, word3 = words
+        self.value = word0 << 96 | word1 << 64 | word2 << 32 | word3
+
+    @functools.singledispatchmethod
+    def dump(self, data, offset):
+        """Writes block to data."""
+        raise NotImplementedError()
+
+    @dump.register(bytearray)
+    def _(self, data, offset):
+        data[offset:offset + 4 * constants.NB] = bytes(self)
+
+    @dump.register(pathlib.Path)
+    def _(self, file_path, offset):
+        """Writes block to file."""
+        with open(file_path, 'rb+') as file:
+            file.seek(offset)
+            file.write(bytes(self))
+
+    @functools.singledispatchmethod
+    @classmethod
+    def load(cls, data, offset):
+        """Loads block from data."""
+        raise NotImplementedError()
+
+    @load.register(bytearray)
+    @classmethod
+    def _(cls, data, offset=0):
+        data = data[offset:offset + 4 * constants.NB]
+        if data:
+            return cls(data)
+
+        return None
+
+    @load.register(pathlib.Path)
+    @classmethod
+    def _(cls, file_path, offset=0):
+        with open(file_path, 'rb') as file:
+            file.seek(offset)
+
+            data = file.read(4 * constants.NB)
+            if data:
+                return cls(data)
+
+        return None
@@ -0,0 +1,80 @@
+"""Incremental AES cipher."""
+
+import padding
+
+from aes import engines
+from aes import errors
+from aes import modes
+from aes.key import Key
+
+
+class Cipher:
+    """AES cipher bound to key, mode of operation and initialization vector.
+
+    Contexts made by decryptor()/encryptor() accept data of any length
+    through update()/update_into() and finish with finalize(). Key may
+    be loaded by load_key() or be its data. Options specific to the mode
+    are passed to contexts.
+    """
+
+    def __init__(
+            self,
+            key,
+            mode='ecb',
+            iv=None,
+            *,
+            engine=None,
+            scheme=None,
+            **options
+    ):
+        if scheme not in (None, *padding.SCHEMES):
+            raise ValueError(f'unknown padding scheme: {scheme}')
+
+        self.__engine = engines.get(engine)
+        self.__mode = modes.get(mode)
+        self.__key = load_key(key, mode)
+        self.__options = options
+        self.__scheme = scheme
+
+        if iv is not None:
+            iv = bytes(iv)
+
+        if (None if iv is None else len(iv)) != self.__mode.IV_SIZE:
+            raise errors.IVSizeError()
+
+        self.__iv = iv
+
+    def decryptor(self):
+        """Returns decryption context."""
+        return self.__mode.Decryptor(
+            self.__key,
+            self.__iv,
+            self.__engine,
+            scheme=self.__scheme,
+            **self.__options
+        )
+
+    def encryptor(self):
+        """Returns encryption context."""
+        return self.__mode.Encryptor(
+            self.__key,
+            self.__iv,
+            self.__engine,
+            scheme=self.__scheme,
+            **self.__options
+        )
+
+
+def load_key(key, mode='ecb', *, cached=False):
+    """Returns key loaded from data or file for mode.
+
+    Cached keys are shared through the process-wide key cache.
+    """
+    load_mode_key = getattr(modes.get(mode), 'load_key', None)
+    if load_mode_key is not None:
+        return load_mode_key(key, cached=cached)
+
+    if isinstance(key, Key):
+        return key
+
+    return Key.load(key, cached=cached)
@@ -2,6 +2,8 @@
 
 ALLOWED_KEY_SIZES = {128, 192, 256}
 DEFAULT_KEY_SIZE = min(ALLOWED_KEY_SIZES)
+# XTS keys are pairs of AES-128 or AES-256 keys (IEEE 1619, 5.1).
+XTS_KEY_SIZES = {2 * size for size in (128, 256)}
 
 FORWARD_MIX_COLUMNS = (
     (0x02, 0x03, 0x01, 0x01),
@@ -0,0 +1,46 @@
+"""Interchangeable AES engines.
+
+Every engine is a module providing the same functions:
+
+* ``decrypt(state, key)``/``encrypt(state, key)`` act over a single state
+  in place;
+* ``decrypt_blocks(data, key)``/``encrypt_blocks(data, key)`` act over a
+  buffer of whole 16-byte blocks and return the result as bytes.
+
+Engines which dependencies are not installed are not available.
+"""
+
+import importlib
+
+from aes import errors
+
+PREFERENCE = ('vector', 'swar', 'table', 'bitslice')
+
+
+def _load(name):
+    """Imports engine or returns None if its dependencies are missing."""
+    try:
+        return importlib.import_module(f'{__name__}.{name}')
+    except ImportError:
+        return None
+
+
+ENGINES = {
+    name: engine
+    for name, engine in zip(PREFERENCE, map(_load, PREFERENCE))
+    if engine is not None
+}
+
+
+def get(name=None):
+    """Returns engine by name or the fastest available one."""
+    if name is None:
+        name = next(iter(ENGINES))
+
+    try:
+        return ENGINES[name]
+    except KeyError:
+        raise errors.EngineError(name) from None
+
+
+__all__ = ('ENGINES', 'PREFERENCE', 'get')
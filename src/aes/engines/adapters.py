@@ -0,0 +1,41 @@
+"""Adapters between engine interfaces."""
+
+import functools
+
+from aes import constants
+from aes.block import Block
+from aes.state import State
+
+
+def chunks(length, chunk_size, round_keys, shorten):
+    """Yields offset, size and round keys of every chunk of data.
+
+    Masks of engines are periodic, so only round keys of the last short
+    chunk need to be shortened by shorten(round_key, size).
+    """
+    for offset in range(0, length, chunk_size):
+        size = min(chunk_size, length - offset)
+        if size < chunk_size:
+            round_keys = [shorten(round_key, size) for round_key in round_keys]
+
+        yield offset, size, round_keys
+
+
+def from_blocks(process):
+    """Makes function acting over a single state from blocks function."""
+    @functools.singledispatch
+    def function(state, key):
+        """Acts over a single state in place."""
+        raise NotImplementedError()
+
+    @function.register(Block)
+    def _(block, key):
+        block.value = int.from_bytes(process(bytes(block), key), 'big')
+
+    @function.register(State)
+    def _(state, key):
+        data = bytearray(4 * constants.NB)
+        state.dump(data, 0)
+        state[:] = State(process(data, key))
+
+    return function
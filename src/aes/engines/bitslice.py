@@ -0,0 +1,412 @@
+"""Bitsliced engine.
+
+Groups of blocks are transposed into eight bit planes, one Python integer
+per bit of every byte, so the cipher runs without any lookups indexed by
+secret data. SubBytes is the Boolean circuit by Boyar and Peralta, while
+ShiftRows and MixColumns are rotations and XORs of the planes.
+
+Within a plane every block takes 16 bits: byte of row r and column c is
+at bit 4 * r + c, so rows are nibbles and ShiftRows rotates them.
+"""
+
+from aes import constants
+from aes import errors
+from aes.engines import adapters
+
+# Must be a power of two.
+GROUP_BLOCKS = 1024
+
+_BLOCK_SIZE = 4 * constants.NB
+_GROUP_SIZE = GROUP_BLOCKS * _BLOCK_SIZE
+
+# Block byte i (row i % 4, column i // 4) goes to bit 4 * (i % 4) + i // 4.
+_ORDER = tuple(4 * (idx % 4) + idx // 4 for idx in range(_BLOCK_SIZE))
+
+
+def _repeat(pattern, bits, total):
+    """Repeats pattern of bits over total bits."""
+    return pattern * (((1 << total) - 1) // ((1 << bits) - 1))
+
+
+def _transposition():
+    """Returns shifts and masks to gather every eighth bit together."""
+    total = 8 * _GROUP_SIZE
+    masks = [_repeat(0x01, 8, total)]
+    shifts = []
+
+    while 1 << len(shifts) < _GROUP_SIZE:
+        width = 1 << len(shifts)
+        shifts.append(7 * width)
+        masks.append(_repeat((1 << 2 * width) - 1, 16 * width, total))
+
+    return tuple(shifts), tuple(masks)
+
+
+_SHIFTS, _MASKS = _transposition()
+
+_PLANE_BITS = _BLOCK_SIZE * GROUP_BLOCKS
+
+
+def _rotation(down, down_pattern, up, up_pattern):
+    """Returns shifts and masks moving bits of every block in a plane."""
+    return (
+        down,
+        _repeat(down_pattern & 0xFFFF, _BLOCK_SIZE, _PLANE_BITS),
+        up,
+        _repeat(up_pattern & 0xFFFF, _BLOCK_SIZE, _PLANE_BITS)
+    )
+
+
+_FIRST_ROW = _repeat(0x000F, _BLOCK_SIZE, _PLANE_BITS)
+_FORWARD_SHIFTS = tuple(
+    _rotation(
+        row_idx, (0xF >> row_idx) << 4 * row_idx,
+        4 - row_idx, (0xF << 4 - row_idx & 0xF) << 4 * row_idx
+    )
+    for row_idx in range(1, 4)
+)
+_INVERSE_SHIFTS = tuple(
+    _rotation(
+        4 - row_idx, (0xF >> 4 - row_idx) << 4 * row_idx,
+        row_idx, (0xF << row_idx & 0xF) << 4 * row_idx
+    )
+    for row_idx in range(1, 4)
+)
+_ROTATIONS = tuple(
+    _rotation(4 * times, 0xFFFF >> 4 * times, 16 - 4 * times,
+              0xFFFF << 16 - 4 * times)
+    for times in range(4)
+)
+
+
+def _forward_sbox(planes, ones):
+    """Applies S-box circuit (Boyar and Peralta, 2009) to planes."""
+    # pylint: disable=too-many-locals,too-many-statements
+    u7, u6, u5, u4, u3, u2, u1, u0 = planes
+
+    # Top linear transformation.
+    t1 = u0 ^ u3
+    t2 = u0 ^ u5
+    t3 = u0 ^ u6
+    t4 = u3 ^ u5
+    t5 = u4 ^ u6
+    t6 = t1 ^ t5
+    t7 = u1 ^ u2
+    t8 = u7 ^ t6
+    t9 = u7 ^ t7
+    t10 = t6 ^ t7
+    t11 = u1 ^ u5
+    t12 = u2 ^ u5
+    t13 = t3 ^ t4
+    t14 = t6 ^ t11
+    t15 = t5 ^ t11
+    t16 = t5 ^ t12
+    t17 = t9 ^ t16
+    t18 = u3 ^ u7
+    t19 = t7 ^ t18
+    t20 = t1 ^ t19
+    t21 = u6 ^ u7
+    t22 = t7 ^ t21
+    t23 = t2 ^ t22
+    t24 = t2 ^ t10
+    t25 = t20 ^ t17
+    t26 = t3 ^ t16
+    t27 = t1 ^ t12
+
+    # Shared non-linear middle part.
+    m1 = t13 & t6
+    m2 = t23 & t8
+    m3 = t14 ^ m1
+    m4 = t19 & u7
+    m5 = m4 ^ m1
+    m6 = t3 & t16
+    m7 = t22 & t9
+    m8 = t26 ^ m6
+    m9 = t20 & t17
+    m10 = m9 ^ m6
+    m11 = t1 & t15
+    m12 = t4 & t27
+    m13 = m12 ^ m11
+    m14 = t2 & t10
+    m15 = m14 ^ m11
+    m16 = m3 ^ m2
+    m17 = m5 ^ t24
+    m18 = m8 ^ m7
+    m19 = m10 ^ m15
+    m20 = m16 ^ m13
+    m21 = m17 ^ m15
+    m22 = m18 ^ m13
+    m23 = m19 ^ t25
+    m24 = m22 ^ m23
+    m25 = m22 & m20
+    m26 = m21 ^ m25
+    m27 = m20 ^ m21
+    m28 = m23 ^ m25
+    m29 = m28 & m27
+    m30 = m26 & m24
+    m31 = m20 & m23
+    m32 = m27 & m31
+    m33 = m27 ^ m25
+    m34 = m21 & m22
+    m35 = m24 & m34
+    m36 = m24 ^ m25
+    m37 = m21 ^ m29
+    m38 = m32 ^ m33
+    m39 = m23 ^ m30
+    m40 = m35 ^ m36
+    m41 = m38 ^ m40
+    m42 = m37 ^ m39
+    m43 = m37 ^ m38
+    m44 = m39 ^ m40
+    m45 = m42 ^ m41
+    m46 = m44 & t6
+    m47 = m40 & t8
+    m48 = m39 & u7
+    m49 = m43 & t16
+    m50 = m38 & t9
+    m51 = m37 & t17
+    m52 = m42 & t15
+    m53 = m45 & t27
+    m54 = m41 & t10
+    m55 = m44 & t13
+    m56 = m40 & t23
+    m57 = m39 & t19
+    m58 = m43 & t3
+    m59 = m38 & t22
+    m60 = m37 & t20
+    m61 = m42 & t1
+    m62 = m45 & t4
+    m63 = m41 & t2
+
+    # Bottom linear transformation.
+    l0 = m61 ^ m62
+    l1 = m50 ^ m56
+    l2 = m46 ^ m48
+    l3 = m47 ^ m55
+    l4 = m54 ^ m58
+    l5 = m49 ^ m61
+    l6 = m62 ^ l5
+    l7 = m46 ^ l3
+    l8 = m51 ^ m59
+    l9 = m52 ^ m53
+    l10 = m53 ^ l4
+    l11 = m60 ^ l2
+    l12 = m48 ^ m51
+    l13 = m50 ^ l0
+    l14 = m52 ^ m61
+    l15 = m55 ^ l1
+    l16 = m56 ^ l0
+    l17 = m57 ^ l1
+    l18 = m58 ^ l8
+    l19 = m63 ^ l4
+    l20 = l0 ^ l1
+    l21 = l1 ^ l7
+    l22 = l3 ^ l12
+    l23 = l18 ^ l2
+    l24 = l15 ^ l9
+    l25 = l6 ^ l10
+    l26 = l7 ^ l9
+    l27 = l8 ^ l10
+    l28 = l11 ^ l14
+    l29 = l11 ^ l17
+
+    return [
+        l6 ^ l23 ^ ones,
+        l13 ^ l27 ^ ones,
+        l25 ^ l29,
+        l20 ^ l22,
+        l6 ^ l21,
+        l19 ^ l28 ^ ones,
+        l16 ^ l26 ^ ones,
+        l6 ^ l24,
+    ]
+
+
+def _inverse_affine(planes):
+    """Applies inverse of the S-box affine map without its constant."""
+    return [
+        planes[(bit + 2) % 8] ^ planes[(bit + 5) % 8] ^ planes[(bit + 7) % 8]
+        for bit in range(8)
+    ]
+
+
+def _inverse_sbox(planes, ones):
+    """Applies inverse S-box through the forward circuit.
+
+    As S(x) = A(x^-1) ^ 0x63, inverse S-box of y is
+    A^-1(S(A^-1(y) ^ 0x05)) ^ 0x05 with 0x05 = A^-1(0x63).
+    """
+    planes = _inverse_affine(planes)
+    planes[0] ^= ones
+    planes[2] ^= ones
+
+    planes = _inverse_affine(_forward_sbox(planes, ones))
+    planes[0] ^= ones
+    planes[2] ^= ones
+
+    return planes
+
+
+def _to_planes(data):
+    """Transposes bytes of group into eight bit planes."""
+    value = int.from_bytes(data, 'little')
+    planes = []
+
+    for bit in range(8):
+        plane = value >> bit & _MASKS[0]
+        for shift, mask in zip(_SHIFTS, _MASKS[1:]):
+            plane = (plane | plane >> shift) & mask
+        planes.append(plane)
+
+    return planes
+
+
+def _from_planes(planes, size):
+    """Transposes eight bit planes back into size bytes."""
+    value = 0
+
+    for bit, plane in enumerate(planes):
+        for shift, mask in zip(reversed(_SHIFTS), reversed(_MASKS[:-1])):
+            plane = (plane | plane << shift) & mask
+        value |= plane << bit
+
+    return value.to_bytes(size, 'little')
+
+
+def _rotate(plane, rotation):
+    """Moves bits of plane by rotation within their nibbles or lanes."""
+    down, down_mask, up, up_mask = rotation
+    return plane >> down & down_mask | plane << up & up_mask
+
+
+def _shift_rows(planes, shifts):
+    """The ShiftRows step."""
+    return [
+        plane & _FIRST_ROW | _rotate(plane, shifts[0])
+        | _rotate(plane, shifts[1]) | _rotate(plane, shifts[2])
+        for plane in planes
+    ]
+
+
+def _xtime(planes):
+    """Multiplies every byte by 0x02."""
+    carry = planes[7]
+    return [
+        carry, planes[0] ^ carry, planes[1], planes[2] ^ carry,
+        planes[3] ^ carry, planes[4], planes[5], planes[6]
+    ]
+
+
+def _mix_columns(planes):
+    """The MixColumns step."""
+    rotated = [_rotate(plane, _ROTATIONS[1]) for plane in planes]
+    pairs = [plane ^ other for plane, other in zip(planes, rotated)]
+
+    return [
+        doubled ^ other ^ _rotate(pair, _ROTATIONS[2])
+        for doubled, other, pair in zip(_xtime(pairs), rotated, pairs)
+    ]
+
+
+def _inverse_mix_columns(planes):
+    """The InvMixColumns step."""
+    pairs = [plane ^ _rotate(plane, _ROTATIONS[2]) for plane in planes]
+
+    return _mix_columns([
+        plane ^ quadrupled
+        for plane, quadrupled in zip(planes, _xtime(_xtime(pairs)))
+    ])
+
+
+def _reorder(data, *, inverse=False):
+    """Moves bytes of every block between column- and row-major order."""
+    result = bytearray(len(data))
+
+    for idx, order in enumerate(_ORDER):
+        if inverse:
+            result[idx::_BLOCK_SIZE] = data[order::_BLOCK_SIZE]
+        else:
+            result[order::_BLOCK_SIZE] = data[idx::_BLOCK_SIZE]
+
+    return result
+
+
+def _round_keys(schedule, blocks):
+    """Returns round keys as planes for the number of blocks."""
+    return [
+        [
+            _repeat(pattern, _BLOCK_SIZE, _BLOCK_SIZE * blocks)
+            for pattern in _to_planes(
+                _reorder(round_key.to_bytes(_BLOCK_SIZE, 'big')))
+        ]
+        for round_key in schedule.round_keys
+    ]
+
+
+def _add_round_key(planes, round_key):
+    """The AddRoundKey step."""
+    return [plane ^ key_plane for plane, key_plane in zip(planes, round_key)]
+
+
+def _shorten(round_key, size):
+    """Returns round key for group of given size."""
+    ones = (1 << size) - 1
+    return [plane & ones for plane in round_key]
+
+
+def _decrypt_group(planes, round_keys, ones):
+    """Decrypts planes with equivalent inverse cipher keys."""
+    planes = _add_round_key(planes, round_keys[-1])
+
+    for round_key in reversed(round_keys[1:-1]):
+        planes = _inverse_sbox(_shift_rows(planes, _INVERSE_SHIFTS), ones)
+        planes = _add_round_key(_inverse_mix_columns(planes), round_key)
+
+    planes = _inverse_sbox(_shift_rows(planes, _INVERSE_SHIFTS), ones)
+    return _add_round_key(planes, round_keys[0])
+
+
+def _encrypt_group(planes, round_keys, ones):
+    """Encrypts planes."""
+    planes = _add_round_key(planes, round_keys[0])
+
+    for round_key in round_keys[1:-1]:
+        planes = _forward_sbox(_shift_rows(planes, _FORWARD_SHIFTS), ones)
+        planes = _add_round_key(_mix_columns(planes), round_key)
+
+    planes = _forward_sbox(_shift_rows(planes, _FORWARD_SHIFTS), ones)
+    return _add_round_key(planes, round_keys[-1])
+
+
+def _process_blocks(data, schedule, process):
+    """Applies process to data group by group."""
+    if len(data) % _BLOCK_SIZE:
+        raise errors.StateSizeError()
+
+    reordered = _reorder(data)
+    round_keys = _round_keys(
+        schedule, min(GROUP_BLOCKS, len(data) // _BLOCK_SIZE))
+
+    for offset, size, keys in adapters.chunks(
+            len(data), _GROUP_SIZE, round_keys, _shorten
+    ):
+        planes = process(
+            _to_planes(reordered[offset:offset + size]), keys,
+            (1 << size) - 1)
+        reordered[offset:offset + size] = _from_planes(planes, size)
+
+    return bytes(_reorder(reordered, inverse=True))
+
+
+def decrypt_blocks(data, key):
+    """Decrypts blocks of data."""
+    return _process_blocks(data, key.decryption_schedule, _decrypt_group)
+
+
+def encrypt_blocks(data, key):
+    """Encrypts blocks of data."""
+    return _process_blocks(data, key.schedule, _encrypt_group)
+
+
+decrypt = adapters.from_blocks(decrypt_blocks)
+encrypt = adapters.from_blocks(encrypt_blocks)
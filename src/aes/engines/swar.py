@@ -0,0 +1,181 @@
+"""SWAR engine.
+
+SIMD within a register: lanes of many blocks are packed into Python
+integers, so every step is a handful of operations over all of them.
+SubBytes translates packed bytes, while ShiftRows, MixColumns and
+AddRoundKey are shifts, masks and XORs over every byte in parallel.
+Masks span the whole lane, so a single state goes through the T-table
+engine.
+"""
+
+from aes import constants
+from aes import errors
+from aes.engines import adapters
+from aes.engines import table
+
+LANE_BLOCKS = 1024
+
+_BLOCK_SIZE = 4 * constants.NB
+_LANE_SIZE = LANE_BLOCKS * _BLOCK_SIZE
+
+_FORWARD_SBOX = bytes(constants.FORWARD_SBOX)
+_INVERSE_SBOX = bytes(constants.INVERSE_SBOX)
+
+
+def _repeat(pattern, size):
+    """Repeats pattern of size bytes over the whole lane."""
+    return int.from_bytes(
+        pattern.to_bytes(size, 'little') * (_LANE_SIZE // size), 'little')
+
+
+def _columns(row_idx, columns):
+    """Returns mask of row bytes in given columns of every block."""
+    return _repeat(
+        sum(0xFF << 32 * column_idx + 8 * row_idx for column_idx in columns),
+        _BLOCK_SIZE
+    )
+
+
+# Byte i of a block is in row i % 4 and column i // 4, packed little-endian.
+_LOW_BITS = _repeat(0x7F, 1)
+_HIGH_BITS = _repeat(0x01, 1)
+_ROTATIONS = tuple(
+    (8 * times,
+     _repeat(0xFFFFFFFF >> 8 * times, 4),
+     8 * (4 - times),
+     _repeat(0xFFFFFFFF << 8 * (4 - times) & 0xFFFFFFFF, 4))
+    for times in range(4)
+)
+_FORWARD_SHIFTS = tuple(
+    (32 * row_idx,
+     _columns(row_idx, range(4 - row_idx)),
+     32 * (4 - row_idx),
+     _columns(row_idx, range(4 - row_idx, 4)))
+    for row_idx in range(1, 4)
+)
+_INVERSE_SHIFTS = tuple(
+    (32 * (4 - row_idx),
+     _columns(row_idx, range(row_idx)),
+     32 * row_idx,
+     _columns(row_idx, range(row_idx, 4)))
+    for row_idx in range(1, 4)
+)
+_FIRST_ROW = _columns(0, range(4))
+
+
+def _xtime(lane):
+    """Multiplies every byte by 0x02."""
+    return (lane & _LOW_BITS) << 1 ^ (lane >> 7 & _HIGH_BITS) * 0x1B
+
+
+def _rotate(lane, times):
+    """Rotates every column up by times rows."""
+    down, down_mask, up, up_mask = _ROTATIONS[times]
+    return lane >> down & down_mask | lane << up & up_mask
+
+
+def _shift_rows(lane, shifts):
+    """The ShiftRows step."""
+    result = lane & _FIRST_ROW
+
+    for down, down_mask, up, up_mask in shifts:
+        result |= lane >> down & down_mask | lane << up & up_mask
+
+    return result
+
+
+def _sub_bytes(lane, sbox, size):
+    """The SubBytes step."""
+    data = lane.to_bytes(size, 'little').translate(sbox)
+    return int.from_bytes(data, 'little')
+
+
+def _mix_columns(lane):
+    """The MixColumns step."""
+    rotated = _rotate(lane, 1)
+    pairs = lane ^ rotated
+
+    return _xtime(pairs) ^ rotated ^ _rotate(pairs, 2)
+
+
+def _inverse_mix_columns(lane):
+    """The InvMixColumns step."""
+    return _mix_columns(lane ^ _xtime(_xtime(lane ^ _rotate(lane, 2))))
+
+
+def _round_keys(schedule, blocks):
+    """Returns round keys repeated for the number of blocks."""
+    return [
+        int.from_bytes(
+            round_key.to_bytes(_BLOCK_SIZE, 'big') * blocks, 'little')
+        for round_key in schedule.round_keys
+    ]
+
+
+def _shorten(round_key, size):
+    """Returns round key for lane of given size."""
+    return round_key & (1 << 8 * size) - 1
+
+
+def _decrypt_lane(lane, round_keys, size):
+    """Decrypts lane of size bytes with equivalent inverse cipher keys."""
+    lane ^= round_keys[-1]
+
+    for round_key in reversed(round_keys[1:-1]):
+        lane = _sub_bytes(lane, _INVERSE_SBOX, size)
+        lane = _shift_rows(lane, _INVERSE_SHIFTS)
+        lane = _inverse_mix_columns(lane)
+        lane ^= round_key
+
+    lane = _sub_bytes(lane, _INVERSE_SBOX, size)
+    lane = _shift_rows(lane, _INVERSE_SHIFTS)
+    return lane ^ round_keys[0]
+
+
+def _encrypt_lane(lane, round_keys, size):
+    """Encrypts lane of size bytes."""
+    lane ^= round_keys[0]
+
+    for round_key in round_keys[1:-1]:
+        lane = _sub_bytes(lane, _FORWARD_SBOX, size)
+        lane = _shift_rows(lane, _FORWARD_SHIFTS)
+        lane = _mix_columns(lane)
+        lane ^= round_key
+
+    lane = _sub_bytes(lane, _FORWARD_SBOX, size)
+    lane = _shift_rows(lane, _FORWARD_SHIFTS)
+    return lane ^ round_keys[-1]
+
+
+def _process_blocks(data, schedule, process):
+    """Applies process to data lane by lane."""
+    if len(data) % _BLOCK_SIZE:
+        raise errors.StateSizeError()
+
+    data = memoryview(data).cast('B')
+    result = bytearray(len(data))
+    round_keys = _round_keys(
+        schedule, min(LANE_BLOCKS, len(data) // _BLOCK_SIZE))
+
+    for offset, size, keys in adapters.chunks(
+            len(data), _LANE_SIZE, round_keys, _shorten
+    ):
+        lane = process(
+            int.from_bytes(data[offset:offset + size], 'little'), keys, size)
+        result[offset:offset + size] = lane.to_bytes(size, 'little')
+
+    return bytes(result)
+
+
+def decrypt_blocks(data, key):
+    """Decrypts blocks of data."""
+    return _process_blocks(data, key.decryption_schedule, _decrypt_lane)
+
+
+def encrypt_blocks(data, key):
+    """Encrypts blocks of data."""
+    return _process_blocks(data, key.schedule, _encrypt_lane)
+
+
+decrypt = table.decrypt
+encrypt = table.encrypt
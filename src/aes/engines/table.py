@@ -0,0 +1,191 @@
+"""T-table engine.
+
+Each round is computed over four 32-bit column words with sixteen lookups
+into tables combining SubBytes, ShiftRows and MixColumns (FIPS 197, 5.2.1).
+"""
+
+import functools
+import struct
+
+from aes import constants
+from aes import errors
+from aes import utils
+from aes.block import Block
+from aes.state import State
+
+_BLOCK = struct.Struct('>4I')
+
+
+def _table(sbox, row_idx, *, inverse=False):
+    """Builds table of MixColumns applied to substituted bytes of row."""
+    table = []
+
+    for number in sbox:
+        vector = [0x00] * 4
+        vector[row_idx] = number
+        table.append(int.from_bytes(
+            bytes(utils.galois_mul(vector, inverse=inverse)), 'big'))
+
+    return tuple(table)
+
+
+def _tables(sbox, *, inverse=False):
+    """Builds tables for all four rows."""
+    return tuple(_table(sbox, row_idx, inverse=inverse) for row_idx in range(4))
+
+
+_TE = _tables(constants.FORWARD_SBOX)
+_TD = _tables(constants.INVERSE_SBOX, inverse=True)
+
+
+def _decrypt_words(block, words, rounds):
+    """Decrypts four column words with equivalent inverse cipher keys."""
+    # pylint: disable=too-many-locals
+    td0, td1, td2, td3 = _TD
+    sbox = constants.INVERSE_SBOX
+
+    idx = 4 * rounds
+    s0, s1, s2, s3 = block
+    s0 ^= words[idx]
+    s1 ^= words[idx + 1]
+    s2 ^= words[idx + 2]
+    s3 ^= words[idx + 3]
+
+    for idx in range(idx - 4, 0, -4):
+        t0 = (td0[s0 >> 24] ^ td1[s3 >> 16 & 0xFF] ^ td2[s2 >> 8 & 0xFF]
+              ^ td3[s1 & 0xFF] ^ words[idx])
+        t1 = (td0[s1 >> 24] ^ td1[s0 >> 16 & 0xFF] ^ td2[s3 >> 8 & 0xFF]
+              ^ td3[s2 & 0xFF] ^ words[idx + 1])
+        t2 = (td0[s2 >> 24] ^ td1[s1 >> 16 & 0xFF] ^ td2[s0 >> 8 & 0xFF]
+              ^ td3[s3 & 0xFF] ^ words[idx + 2])
+        s3 = (td0[s3 >> 24] ^ td1[s2 >> 16 & 0xFF] ^ td2[s1 >> 8 & 0xFF]
+              ^ td3[s0 & 0xFF] ^ words[idx + 3])
+        s0, s1, s2 = t0, t1, t2
+
+    return (
+        (sbox[s0 >> 24] << 24 | sbox[s3 >> 16 & 0xFF] << 16
+         | sbox[s2 >> 8 & 0xFF] << 8 | sbox[s1 & 0xFF]) ^ words[0],
+        (sbox[s1 >> 24] << 24 | sbox[s0 >> 16 & 0xFF] << 16
+         | sbox[s3 >> 8 & 0xFF] << 8 | sbox[s2 & 0xFF]) ^ words[1],
+        (sbox[s2 >> 24] << 24 | sbox[s1 >> 16 & 0xFF] << 16
+         | sbox[s0 >> 8 & 0xFF] << 8 | sbox[s3 & 0xFF]) ^ words[2],
+        (sbox[s3 >> 24] << 24 | sbox[s2 >> 16 & 0xFF] << 16
+         | sbox[s1 >> 8 & 0xFF] << 8 | sbox[s0 & 0xFF]) ^ words[3],
+    )
+
+
+def _encrypt_words(block, words, rounds):
+    """Encrypts four column words."""
+    # pylint: disable=too-many-locals
+    te0, te1, te2, te3 = _TE
+    sbox = constants.FORWARD_SBOX
+
+    s0, s1, s2, s3 = block
+    s0 ^= words[0]
+    s1 ^= words[1]
+    s2 ^= words[2]
+    s3 ^= words[3]
+
+    for idx in range(4, 4 * rounds, 4):
+        t0 = (te0[s0 >> 24] ^ te1[s1 >> 16 & 0xFF] ^ te2[s2 >> 8 & 0xFF]
+              ^ te3[s3 & 0xFF] ^ words[idx])
+        t1 = (te0[s1 >> 24] ^ te1[s2 >> 16 & 0xFF] ^ te2[s3 >> 8 & 0xFF]
+              ^ te3[s0 & 0xFF] ^ words[idx + 1])
+        t2 = (te0[s2 >> 24] ^ te1[s3 >> 16 & 0xFF] ^ te2[s0 >> 8 & 0xFF]
+              ^ te3[s1 & 0xFF] ^ words[idx + 2])
+        s3 = (te0[s3 >> 24] ^ te1[s0 >> 16 & 0xFF] ^ te2[s1 >> 8 & 0xFF]
+              ^ te3[s2 & 0xFF] ^ words[idx + 3])
+        s0, s1, s2 = t0, t1, t2
+
+    idx = 4 * rounds
+    return (
+        (sbox[s0 >> 24] << 24 | sbox[s1 >> 16 & 0xFF] << 16
+         | sbox[s2 >> 8 & 0xFF] << 8 | sbox[s3 & 0xFF]) ^ words[idx],
+        (sbox[s1 >> 24] << 24 | sbox[s2 >> 16 & 0xFF] << 16
+         | sbox[s3 >> 8 & 0xFF] << 8 | sbox[s0 & 0xFF]) ^ words[idx + 1],
+        (sbox[s2 >> 24] << 24 | sbox[s3 >> 16 & 0xFF] << 16
+         | sbox[s0 >> 8 & 0xFF] << 8 | sbox[s1 & 0xFF]) ^ words[idx + 2],
+        (sbox[s3 >> 24] << 24 | sbox[s0 >> 16 & 0xFF] << 16
+         | sbox[s1 >> 8 & 0xFF] << 8 | sbox[s2 & 0xFF]) ^ words[idx + 3],
+    )
+
+
+def _process_blocks(data, words, rounds, process):
+    """Applies process to every block of data."""
+    if len(data) % (4 * constants.NB):
+        raise errors.StateSizeError()
+
+    result = bytearray(len(data))
+
+    for offset, block in enumerate(_BLOCK.iter_unpack(data)):
+        _BLOCK.pack_into(result, offset << 4, *process(block, words, rounds))
+
+    return bytes(result)
+
+
+def _process_state(state, words, rounds, process):
+    """Applies process to state in place."""
+    block = [int.from_bytes(bytes(column), 'big') for column in zip(*state)]
+    data = _BLOCK.pack(*process(block, words, rounds))
+
+    for row_idx in range(4):
+        state[row_idx] = bytearray(data[row_idx::4])
+
+
+@functools.singledispatch
+def decrypt(state, key):
+    """Decrypts state."""
+    raise NotImplementedError()
+
+
+@decrypt.register(Block)
+def _(block, key):
+    block.words = _decrypt_words(
+        block.words,
+        key.decryption_schedule.words,
+        constants.ROUNDS[key.size]
+    )
+
+
+@decrypt.register(State)
+def _(state, key):
+    _process_state(
+        state,
+        key.decryption_schedule.words,
+        constants.ROUNDS[key.size],
+        _decrypt_words
+    )
+
+
+def decrypt_blocks(data, key):
+    """Decrypts blocks of data."""
+    return _process_blocks(
+        data,
+        key.decryption_schedule.words,
+        constants.ROUNDS[key.size],
+        _decrypt_words
+    )
+
+
+@functools.singledispatch
+def encrypt(state, key):
+    """Encrypts state."""
+    raise NotImplementedError()
+
+
+@encrypt.register(Block)
+def _(block, key):
+    block.words = _encrypt_words(
+        block.words, key.schedule.words, constants.ROUNDS[key.size])
+
+
+@encrypt.register(State)
+def _(state, key):
+    _process_state(
+        state, key.schedule.words, constants.ROUNDS[key.size], _encrypt_words)
+
+
+def encrypt_blocks(data, key):
+    """Encrypts blocks of data."""
+    return _process_blocks(
+        data, key.schedule.words, constants.ROUNDS[key.size], _encrypt_words)
@@ -0,0 +1,104 @@
+"""NumPy engine.
+
+Blocks are processed all at once as an (N, 16) array of bytes: SubBytes
+and MixColumns multiplications are lookups with fancy indexing, ShiftRows
+is a fixed permutation of columns and AddRoundKey broadcasts round keys
+over all blocks. Requires NumPy. Array overhead outweighs a single
+state, so it goes through the T-table engine.
+"""
+
+import numpy
+
+from aes import constants
+from aes import errors
+from aes import utils
+from aes.engines import table
+
+_FORWARD_SBOX = numpy.array(constants.FORWARD_SBOX, dtype=numpy.uint8)
+_INVERSE_SBOX = numpy.array(constants.INVERSE_SBOX, dtype=numpy.uint8)
+_MUL = {
+    multiplier: numpy.frombuffer(products, dtype=numpy.uint8)
+    for multiplier, products in utils.MUL_TABLES.items()
+}
+
+# Byte i of a block is in row i % 4 and column i // 4.
+_FORWARD_SHIFT = numpy.array(
+    [(4 * (i // 4 + i % 4) + i % 4) % 16 for i in range(16)])
+_INVERSE_SHIFT = numpy.array(
+    [(4 * (i // 4 - i % 4) + i % 4) % 16 for i in range(16)])
+_ROTATIONS = tuple(
+    numpy.array([i - i % 4 + (i + times) % 4 for i in range(16)])
+    for times in range(1, 4)
+)
+
+
+def _round_keys(schedule):
+    """Returns round keys as (rounds + 1, 16) array."""
+    return numpy.frombuffer(schedule.data, dtype=numpy.uint8).reshape(-1, 16)
+
+
+def _blocks(data):
+    """Returns data as (N, 16) array."""
+    if len(data) % (4 * constants.NB):
+        raise errors.StateSizeError()
+
+    return numpy.frombuffer(data, dtype=numpy.uint8).reshape(-1, 16)
+
+
+def _mix_columns(blocks):
+    """The MixColumns step."""
+    rotation1, rotation2, rotation3 = _ROTATIONS
+    doubled = _MUL[0x02][blocks]
+    tripled = doubled ^ blocks
+
+    return (doubled ^ tripled[:, rotation1] ^ blocks[:, rotation2]
+            ^ blocks[:, rotation3])
+
+
+def _inverse_mix_columns(blocks):
+    """The InvMixColumns step."""
+    rotation1, rotation2, rotation3 = _ROTATIONS
+
+    return (_MUL[0x0E][blocks] ^ _MUL[0x0B][blocks[:, rotation1]]
+            ^ _MUL[0x0D][blocks[:, rotation2]]
+            ^ _MUL[0x09][blocks[:, rotation3]])
+
+
+def decrypt_blocks(data, key):
+    """Decrypts blocks of data."""
+    rounds = constants.ROUNDS[key.size]
+    round_keys = _round_keys(key.decryption_schedule)
+
+    blocks = _blocks(data) ^ round_keys[rounds]
+
+    for current_round in range(rounds - 1, 0, -1):
+        blocks = _INVERSE_SBOX[blocks[:, _INVERSE_SHIFT]]
+        blocks = _inverse_mix_columns(blocks)
+        blocks ^= round_keys[current_round]
+
+    blocks = _INVERSE_SBOX[blocks[:, _INVERSE_SHIFT]]
+    blocks ^= round_keys[0]
+
+    return blocks.tobytes()
+
+
+def encrypt_blocks(data, key):
+    """Encrypts blocks of data."""
+    rounds = constants.ROUNDS[key.size]
+    round_keys = _round_keys(key.schedule)
+
+    blocks = _blocks(data) ^ round_keys[0]
+
+    for current_round in range(1, rounds):
+        blocks = _FORWARD_SBOX[blocks[:, _FORWARD_SHIFT]]
+        blocks = _mix_columns(blocks)
+        blocks ^= round_keys[current_round]
+
+    blocks = _FORWARD_SBOX[blocks[:, _FORWARD_SHIFT]]
+    blocks ^= round_keys[rounds]
+
+    return blocks.tobytes()
+
+
+decrypt = table.decrypt
+encrypt = table.encrypt
@@ -11,3 +11,27 @@ class KeySizeError(AESError):
 
 class StateSizeError(AESError):
     """State size is wring error."""
+
+
+class EngineError(AESError):
+    """Engine is unknown or unavailable error."""
+
+
+class ChunkSizeError(AESError):
+    """Chunk size is not a positive multiple of block size error."""
+
+
+class FinalizedError(AESError):
+    """Context is already finalized error."""
+
+
+class IVSizeError(AESError):
+    """Initialization vector size is wrong error."""
+
+
+class ModeError(AESError):
+    """Mode of operation is unknown error."""
+
+
+class AuthenticationError(AESError):
+    """Authentication tag does not match data error."""
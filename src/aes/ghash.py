@@ -0,0 +1,115 @@
+"""GHASH function over GF(2^128) (NIST SP 800-38D, 6.4).
+
+Multiplication by the fixed hash subkey uses Shoup's 8-bit tables: for
+every byte position of a block the products of the subkey with all 256
+byte values are precomputed, so a multiplication is 16 lookups and XORs
+instead of 128 shift-and-add steps.
+"""
+
+from aes import constants
+
+BLOCK_SIZE = 4 * constants.NB
+
+_R = 0xE1 << 120
+
+
+class Tables:
+    """Multiplication tables of hash subkey."""
+
+    __slots__ = ('__tables',)
+
+    def __init__(self, subkey):
+        # Products of subkey and x^k for every bit k, bit 0 is the most
+        # significant one (SP 800-38D, 6.3).
+        powers = [int.from_bytes(subkey, 'big')]
+        for _ in range(8 * BLOCK_SIZE - 1):
+            power = powers[-1]
+            powers.append(power >> 1 ^ (_R if power & 1 else 0))
+
+        self.__tables = []
+        for position in range(BLOCK_SIZE):
+            table = [0]
+            for bit in range(8):
+                power = powers[8 * position + 7 - bit]
+                table += [product ^ power for product in table]
+
+            self.__tables.append(table)
+
+    def __del__(self):
+        """Wipes tables when no one holds them."""
+        self.zeroize()
+
+    def multiply(self, value):
+        """Returns product of 128-bit value and hash subkey."""
+        product = 0
+        for table, byte in zip(
+                self.__tables, value.to_bytes(BLOCK_SIZE, 'big')
+        ):
+            product ^= table[byte]
+
+        return product
+
+    def zeroize(self):
+        """Overwrites tables with zeros."""
+        for table in self.__tables:
+            table[:] = (0,) * len(table)
+
+
+class GHash:
+    """Incremental GHASH of data by whole blocks.
+
+    Partial blocks are buffered until more data comes or pad() fills
+    them with zeros.
+    """
+
+    def __init__(self, tables):
+        self.__pending = bytearray()
+        self.__tables = tables
+        self.__value = 0
+
+    def __getstate__(self):
+        """Returns state without tables, see restore()."""
+        return self.__pending, self.__value
+
+    def __setstate__(self, state):
+        self.__pending, self.__value = state
+        self.__tables = None
+
+    @property
+    def value(self):
+        """Hash of data padded so far as 128-bit integer."""
+        return self.__value
+
+    def pad(self):
+        """Pads partial block with zeros and hashes it."""
+        if self.__pending:
+            self.__pending += bytes(-len(self.__pending) % BLOCK_SIZE)
+            self.__absorb(self.__pending)
+            self.__pending.clear()
+
+    def restore(self, tables):
+        """Gives tables back to unpickled hash."""
+        self.__tables = tables
+
+    def update(self, data):
+        """Hashes data, buffering partial block."""
+        pending = self.__pending
+        pending += data
+
+        size = len(pending) - len(pending) % BLOCK_SIZE
+        if size:
+            with memoryview(pending) as view, view[:size] as blocks:
+                self.__absorb(blocks)
+
+            del pending[:size]
+
+    def __absorb(self, data):
+        """Hashes whole blocks."""
+        multiply = self.__tables.multiply
+        value = self.__value
+
+        for offset in range(0, len(data), BLOCK_SIZE):
+            value = multiply(
+                value ^ int.from_bytes(data[offset:offset + BLOCK_SIZE], 'big'))
+
+        self.__value = value
@@ -2,10 +2,13 @@
 
 import collections
 import functools
+import hashlib
 import pathlib
+import struct
 
 from aes import constants
 from aes import errors
+from aes import ghash
 from aes import utils
 
 
@@ -14,6 +17,8 @@ class Key:
 
     def __init__(self, data):
         self.__data = data
+        self.__decryption_schedule = None
+        self.__hash_tables = {}
         self.__schedule = None
         self.__size = None
         self.__words = None
@@ -24,11 +29,44 @@ class Key:
     def __eq__(self, other):
         return self.data == other.data
 
+    def __getstate__(self):
+        """Returns state without hash tables, they are computed again."""
+        state = self.__dict__.copy()
+        state['_Key__hash_tables'] = {}
+
+        return state
+
+    def __hash__(self):
+        return hash(bytes(self.data))
+
     @property
     def data(self):
         """Key's data."""
         return self.__data
 
+    @property
+    def decryption_schedule(self):
+        """Key schedule of the equivalent inverse cipher."""
+        if self.__decryption_schedule is None:
+            self.__decryption_schedule = KeySchedule(self, inverse=True)
+
+        return self.__decryption_schedule
+
+    def hash_tables(self, engine):
+        """GHASH multiplication tables of hash subkey (SP 800-38D, 6.3).
+
+        Hash subkey is encrypted by given engine module and tables are
+        cached per engine, so the engine chosen by context is not
+        bypassed by another one which asked first.
+        """
+        tables = self.__hash_tables.get(engine.__name__)
+        if tables is None:
+            subkey = engine.encrypt_blocks(bytes(4 * constants.NB), self)
+            tables = self.__hash_tables[engine.__name__] = ghash.Tables(
+                subkey)
+
+        return tables
+
     @property
     def schedule(self):
         """Key schedule."""
@@ -53,32 +91,210 @@ class Key:
 
         return self.__words
 
+    def zeroize(self):
+        """Wipes expanded key schedules and hash tables.
+
+        Key data given by caller is kept, so they are expanded again on
+        the next access. Key must not be in use by other threads.
+        """
+        expanded = (
+            self.__schedule,
+            self.__decryption_schedule,
+            *self.__hash_tables.values()
+        )
+        for item in expanded:
+            if item is not None:
+                item.zeroize()
+
+        self.__decryption_schedule = None
+        self.__hash_tables.clear()
+        self.__schedule = None
+
     @functools.singledispatchmethod
     @classmethod
-    def load(cls, data):
-        """Creates key from data."""
+    def load(cls, data, *, cached=False):
+        """Creates key from data.
+
+        Cached keys are shared through the process-wide key cache.
+        """
         raise NotImplementedError()
 
     @load.register(bytes)
     @classmethod
-    def _(cls, key_data):
+    def _(cls, key_data, *, cached=False):
+        if cached:
+            return CACHE.get(key_data)
+
         return cls(key_data)
 
     @load.register(pathlib.Path)
     @classmethod
-    def _(cls, key_file):
+    def _(cls, key_file, *, cached=False):
         with open(key_file, 'rb') as file:
-            return cls(file.read())
+            return cls.load(file.read(), cached=cached)
+
+
+class KeyCache:
+    """Bounded LRU cache of keys with expanded schedules.
+
+    Keys are shared by all callers, so evicted keys are only dropped:
+    their schedules and hash tables wipe themselves when no one holds
+    them any more.
+    """
+
+    DEFAULT_SIZE = 128
+
+    def __init__(self, size=DEFAULT_SIZE):
+        self.__keys = collections.OrderedDict()
+        self.__size = None
+        self.size = size
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.__keys)
+
+    @property
+    def size(self):
+        """Maximum number of cached keys."""
+        return self.__size
+
+    @size.setter
+    def size(self, size):
+        if size < 0:
+            raise ValueError('cache size must not be negative')
+
+        self.__size = size
+        self.__evict()
+
+    def clear(self):
+        """Drops all cached keys, resets counters."""
+        self.__keys.clear()
+
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, data):
+        """Returns cached key for data, creating it on miss."""
+        digest = hashlib.sha256(data).digest()
+
+        key = self.__keys.get(digest)
+        if key is not None:
+            self.__keys.move_to_end(digest)
+            self.hits += 1
+            return key
+
+        key = Key(data)
+        self.misses += 1
+        self.__keys[digest] = key
+        self.__evict()
+
+        return key
+
+    def __evict(self):
+        """Drops least recently used keys over the size."""
+        while len(self.__keys) > self.__size:
+            self.__keys.popitem(last=False)
+
+
+class KeySchedule:
+    """Represents key schedule as flat round keys."""
+
+    __slots__ = ('__data', '__round_keys', '__views', '__words')
+
+    def __init__(self, key, *, inverse=False):
+        """Creates key schedule from key.
+
+        Inverse schedule has InvMixColumns applied to all round keys but
+        the first and the last ones (FIPS 197, 5.3.5).
+        """
+        words = _expand(key)
+
+        if inverse:
+            for idx in range(constants.NB, len(words) - constants.NB):
+                column = utils.galois_mul(
+                    list(words[idx].to_bytes(4, 'big')), inverse=True)
+                words[idx] = int.from_bytes(bytes(column), 'big')
+
+        self.__data = bytearray(struct.pack(f'>{len(words)}I', *words))
+        self.__round_keys = None
+        self.__views = None
+        self.__words = tuple(words)
+
+    def __del__(self):
+        """Wipes round keys when no one holds schedule."""
+        self.zeroize()
+
+    def __getstate__(self):
+        """Returns state without views which are not picklable."""
+        return self.__data, self.__round_keys, self.__words
+
+    def __setstate__(self, state):
+        self.__data, self.__round_keys, self.__words = state
+        self.__views = None
+
+    def __getitem__(self, current_round):
+        """Returns round key as 16 bytes without copying."""
+        if self.__views is None:
+            data = memoryview(self.__data).toreadonly()
+            self.__views = tuple(
+                data[offset:offset + 4 * constants.NB]
+                for offset in range(0, len(data), 4 * constants.NB)
+            )
+
+        return self.__views[current_round]
+
+    def __len__(self):
+        """Returns number of round keys."""
+        return len(self.__words) // constants.NB
+
+    def zeroize(self):
+        """Overwrites round keys with zeros."""
+        self.__data[:] = bytes(len(self.__data))
+        self.__round_keys = None
+        self.__words = (0,) * len(self.__words)
+
+    @property
+    def data(self):
+        """All round keys as flat bytes."""
+        return memoryview(self.__data).toreadonly()
+
+    @property
+    def round_keys(self):
+        """Round keys as 128-bit integers."""
+        if self.__round_keys is None:
+            self.__round_keys = tuple(
+                int.from_bytes(round_key, 'big') for round_key in self)
+
+        return self.__round_keys
+
+    @property
+    def words(self):
+        """Round keys as 32-bit words."""
+        return self.__words
+
+
+CACHE = KeyCache()
 
 
-class KeySchedule(collections.UserList):
-    """Represents key schedule."""
+def _expand(key):
+    """Expands key into list of 32-bit words (FIPS 197, 5.2)."""
+    sbox = constants.FORWARD_SBOX
+    n_words = key.words
+    words = list(struct.unpack(f'>{n_words}I', key.data))
 
-    def __init__(self, key):
-        """Creates key schedule from key."""
-        super().__init__(bytearray(key.data[i::4]) for i in range(4))
+    for idx in range(n_words, constants.NB * (constants.ROUNDS[key.size] + 1)):
+        word = words[idx - 1]
+        if not idx % n_words:
+            word = (
+                sbox[word >> 16 & 0xFF] << 24 | sbox[word >> 8 & 0xFF] << 16
+                | sbox[word & 0xFF] << 8 | sbox[word >> 24]
+            ) ^ constants.RCON[0][idx // n_words - 1] << 24
+        elif n_words > 6 and idx % n_words == 4:
+            word = (
+                sbox[word >> 24] << 24 | sbox[word >> 16 & 0xFF] << 16
+                | sbox[word >> 8 & 0xFF] << 8 | sbox[word & 0xFF]
+            )
+        words.append(words[idx - n_words] ^ word)
 
-        for row_idx in range(4, 4 * (constants.ROUNDS[key.size] + 1)):
-            word = utils.next_word(self.data, row_idx, n_words=key.words)
-            for column_idx in range(4):
-                self.data[column_idx].append(word[column_idx])
+    return words
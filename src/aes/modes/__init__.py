@@ -0,0 +1,47 @@
+"""Block cipher modes of operation.
+
+Every mode is a module providing:
+
+* ``IV_SIZE`` - size of initialization vector in bytes or None if the
+  mode does not use it;
+* ``Decryptor``/``Encryptor`` - incremental contexts created as
+  ``Context(key, iv, engine, scheme=None, **options)`` where scheme is
+  an optional padding scheme and options are specific to the mode.
+
+Modes with keys other than AES keys provide ``load_key(key, *,
+cached=False)`` too.
+
+Authenticated modes also provide ``TAG_SIZE`` - default size of
+authentication tag in bytes, their encryptors expose ``tag`` after
+finalization and decryptors verify it with ``finalize_with_tag(tag)``.
+"""
+
+from aes import errors
+from aes.modes import cbc
+from aes.modes import cfb
+from aes.modes import ctr
+from aes.modes import ecb
+from aes.modes import gcm
+from aes.modes import ofb
+from aes.modes import xts
+
+MODES = {
+    'cbc': cbc,
+    'cfb': cfb,
+    'ctr': ctr,
+    'ecb': ecb,
+    'gcm': gcm,
+    'ofb': ofb,
+    'xts': xts,
+}
+
+
+def get(name):
+    """Returns mode by name."""
+    try:
+        return MODES[name]
+    except KeyError:
+        raise errors.ModeError(name) from None
+
+
+__all__ = ('MODES', 'get')
@@ -0,0 +1,181 @@
+"""Base of incremental cipher contexts."""
+
+import importlib
+
+import padding
+
+from aes import constants
+from aes import errors
+
+BLOCK_SIZE = 4 * constants.NB
+
+
+class Context:
+    """Incremental context which is finalized once.
+
+    Contexts are pickled with name of engine module, so they may be
+    processed by other processes.
+    """
+
+    def __init__(self, key, iv, engine):
+        self._engine = engine
+        self._iv = iv
+        self._key = key
+        self.__finalized = False
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_engine'] = self._engine.__name__
+
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._engine = importlib.import_module(state['_engine'])
+
+    @property
+    def finalized(self):
+        """Whether context is finalized."""
+        return self.__finalized
+
+    def finalize(self):
+        """Processes buffered data and finishes context."""
+        if self.__finalized:
+            raise errors.FinalizedError()
+
+        self.__finalized = True
+
+        return self._finalize()
+
+    def output_size(self, size):
+        """Returns maximum size of output of update with data of size."""
+        return size + BLOCK_SIZE - 1
+
+    def update(self, data):
+        """Processes data, returns data processed so far."""
+        buffer = bytearray(self.output_size(len(data)))
+        del buffer[self.update_into(data, buffer):]
+
+        return bytes(buffer)
+
+    def update_into(self, data, buffer):
+        """Processes data into buffer, returns number of written bytes.
+
+        Buffer must hold at least ``output_size(len(data))`` bytes.
+        """
+        if self.__finalized:
+            raise errors.FinalizedError()
+
+        with memoryview(data) as view, memoryview(buffer) as output:
+            with view.cast('B') as view, output.cast('B') as output:
+                return self._update_into(view, output)
+
+    def _finalize(self):
+        """Returns remaining processed data."""
+        raise NotImplementedError()
+
+    def _process(self, data):
+        """Processes data."""
+        raise NotImplementedError()
+
+    def _update_into(self, data, output):
+        """Processes data into output, returns number of written bytes."""
+        raise NotImplementedError()
+
+
+class BlockContext(Context):  # pylint: disable=abstract-method
+    """Incremental context processing data by whole blocks.
+
+    Partial blocks are buffered until more data comes. With padding
+    scheme, decryption holds back the last two blocks until finalization,
+    see padding.measure().
+    """
+
+    INVERSE = False
+
+    def __init__(self, key, iv, engine, *, scheme=None):
+        super().__init__(key, iv, engine)
+        self.__pending = bytearray()
+        self.__reserve = 2 * BLOCK_SIZE if scheme and self.INVERSE else 0
+        self.__scheme = scheme
+
+    def _finalize(self):
+        pending = self.__pending
+        if self.__scheme is None:
+            if pending:
+                raise errors.StateSizeError()
+
+            return b''
+
+        if not self.INVERSE:
+            padding.add(pending, BLOCK_SIZE, scheme=self.__scheme)
+            return self._process(pending)
+
+        if not pending or len(pending) % BLOCK_SIZE:
+            raise errors.StateSizeError()
+
+        result = bytearray(self._process(pending))
+        padding.remove(result, scheme=self.__scheme, size=BLOCK_SIZE)
+
+        return bytes(result)
+
+    def _update_into(self, data, output):
+        pending = self.__pending
+
+        size = max(len(pending) + len(data) - self.__reserve, 0)
+        size -= size % BLOCK_SIZE
+        if len(output) < size:
+            raise ValueError('buffer is too small')
+
+        if size <= len(pending):
+            self.__write(output, 0, pending[:size])
+            del pending[:size]
+            pending += data
+            return size
+
+        head = -len(pending) % BLOCK_SIZE
+        consumed = size - len(pending)
+        pending += data[:head]
+
+        written = self.__write(output, 0, pending)
+        with data[head:consumed] as chunk:
+            self.__write(output, written, chunk)
+        pending[:] = data[consumed:]
+
+        return size
+
+    def __write(self, output, offset, data):
+        """Processes data into output at offset, returns its size."""
+        if data:
+            output[offset:offset + len(data)] = self._process(data)
+
+        return len(data)
+
+
+class StreamContext(Context):  # pylint: disable=abstract-method
+    """Incremental context processing data of any length at once."""
+
+    def __init__(self, key, iv, engine, *, scheme=None):
+        if scheme is not None:
+            raise ValueError('stream modes do not use padding')
+
+        super().__init__(key, iv, engine)
+
+    def _finalize(self):
+        return b''
+
+    def _update_into(self, data, output):
+        if len(output) < len(data):
+            raise ValueError('buffer is too small')
+
+        if data:
+            output[:len(data)] = self._process(data)
+
+        return len(data)
+
+
+def xor(data, keystream):
+    """Returns data XORed with keystream of the same size."""
+    return (
+        int.from_bytes(data, 'big') ^ int.from_bytes(keystream, 'big')
+    ).to_bytes(len(data), 'big')
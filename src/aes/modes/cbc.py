@@ -0,0 +1,52 @@
+"""Cipher block chaining mode (NIST SP 800-38A, 6.2).
+
+Encryption is serial since every block is chained to the previous
+ciphertext block, so its blocks go through the single state path of the
+engine. Decryption is not: ``P[i] = D(C[i]) xor C[i - 1]``,
+so whole runs of blocks are decrypted at once and XORed with shifted
+ciphertext in one go.
+"""
+
+from aes.block import Block
+from aes.modes import base
+
+IV_SIZE = base.BLOCK_SIZE
+
+
+class Decryptor(base.BlockContext):
+    """CBC decryption context."""
+
+    INVERSE = True
+
+    def __init__(self, key, iv, engine, *, scheme=None):
+        super().__init__(key, iv, engine, scheme=scheme)
+        self.__previous = iv
+
+    def _process(self, data):
+        data = bytes(data)
+        decrypted = self._engine.decrypt_blocks(data, self._key)
+        chained = self.__previous + data[:-IV_SIZE]
+        self.__previous = data[-IV_SIZE:]
+
+        return base.xor(decrypted, chained)
+
+
+class Encryptor(base.BlockContext):
+    """CBC encryption context."""
+
+    def __init__(self, key, iv, engine, *, scheme=None):
+        super().__init__(key, iv, engine, scheme=scheme)
+        self.__block = Block(iv)
+
+    def _process(self, data):
+        encrypt, key = self._engine.encrypt, self._key
+        block = self.__block
+        result = bytearray()
+
+        for offset in range(0, len(data), base.BLOCK_SIZE):
+            block ^= int.from_bytes(
+                data[offset:offset + base.BLOCK_SIZE], 'big')
+            encrypt(block, key)
+            result += bytes(block)
+
+        return bytes(result)
@@ -0,0 +1,92 @@
+"""Cipher feedback mode with full-block segments (NIST SP 800-38A,
+6.3).
+
+Every keystream block is the encryption of the previous ciphertext
+block. Encryption is serial since ciphertext comes from the keystream,
+so its blocks go through the single state path of the engine.
+Decryption is not: keystream of all whole blocks of data is produced by
+one engine call over the shifted ciphertext. The last partial block
+uses the beginning of its keystream block, so data of any length is
+processed.
+"""
+
+from aes.block import Block
+from aes.modes import base
+
+IV_SIZE = base.BLOCK_SIZE
+
+
+class _Context(base.StreamContext):
+    """CFB context keeping feedback and unused keystream."""
+
+    INVERSE = False
+
+    def __init__(self, key, iv, engine, *, scheme=None):
+        super().__init__(key, iv, engine, scheme=scheme)
+        self.__feedback = bytearray(iv)
+        self.__keystream = b''
+
+    def _process(self, data):
+        data = bytes(data)
+        head = min(len(self.__keystream), len(data))
+        result = bytearray(self.__xor(data[:head]))
+
+        whole = head + (len(data) - head) // base.BLOCK_SIZE * base.BLOCK_SIZE
+        if whole > head:
+            process = self.__decrypt if self.INVERSE else self.__encrypt
+            result += process(data[head:whole])
+
+        if whole < len(data):
+            block = Block(self.__feedback)
+            self._engine.encrypt(block, self._key)
+            self.__keystream = bytes(block)
+            self.__feedback.clear()
+            result += self.__xor(data[whole:])
+
+        return bytes(result)
+
+    def __decrypt(self, data):
+        """Decrypts whole blocks at once."""
+        feedback = bytes(self.__feedback) + data[:-base.BLOCK_SIZE]
+        self.__feedback[:] = data[-base.BLOCK_SIZE:]
+
+        return base.xor(
+            data, self._engine.encrypt_blocks(feedback, self._key))
+
+    def __encrypt(self, data):
+        """Encrypts whole blocks one by one."""
+        encrypt, key = self._engine.encrypt, self._key
+        block = Block(self.__feedback)
+        result = bytearray()
+
+        for offset in range(0, len(data), base.BLOCK_SIZE):
+            encrypt(block, key)
+            block ^= int.from_bytes(
+                data[offset:offset + base.BLOCK_SIZE], 'big')
+            result += bytes(block)
+
+        self.__feedback[:] = bytes(block)
+
+        return result
+
+    def __xor(self, data):
+        """Processes data of partial block with unused keystream."""
+        size = len(data)
+        if not size:
+            return b''
+
+        result = base.xor(data, self.__keystream[:size])
+        self.__keystream = self.__keystream[size:]
+        self.__feedback += data if self.INVERSE else result
+
+        return result
+
+
+class Decryptor(_Context):
+    """CFB decryption context."""
+
+    INVERSE = True
+
+
+class Encryptor(_Context):
+    """CFB encryption context."""
@@ -0,0 +1,67 @@
+"""Counter mode (NIST SP 800-38A, 6.5).
+
+Initialization vector is the initial counter block: its last
+``counter_size`` bytes are the counter incremented for every block and
+the rest is a fixed nonce. Keystream of any position can be produced
+directly, so contexts can seek for random access or parallel work.
+"""
+
+from aes.modes import base
+
+IV_SIZE = base.BLOCK_SIZE
+
+
+class _Context(base.StreamContext):
+    """CTR context, encryption and decryption are the same."""
+
+    def __init__(self, key, iv, engine, *, scheme=None, counter_size=IV_SIZE):
+        super().__init__(key, iv, engine, scheme=scheme)
+
+        if not 0 < counter_size <= IV_SIZE:
+            raise ValueError(f'counter size must be from 1 to {IV_SIZE}')
+
+        mask = (1 << 8 * counter_size) - 1
+        initial = int.from_bytes(iv, 'big')
+        self.__counter = initial & mask
+        self.__limit = (mask + 1) * base.BLOCK_SIZE
+        self.__mask = mask
+        self.__nonce = initial & ~mask
+        self.__position = 0
+
+    @property
+    def position(self):
+        """Position in keystream in bytes."""
+        return self.__position
+
+    def seek(self, position):
+        """Moves to position in keystream in bytes."""
+        if not 0 <= position <= self.__limit:
+            raise ValueError('position is out of counter range')
+
+        self.__position = position
+
+    def _process(self, data):
+        start = self.__position
+        stop = start + len(data)
+        if stop > self.__limit:
+            raise OverflowError('counter is exhausted')
+
+        first, skip = divmod(start, base.BLOCK_SIZE)
+        last = -(-stop // base.BLOCK_SIZE)
+        counter, mask, nonce = self.__counter, self.__mask, self.__nonce
+        counters = b''.join(
+            (nonce | (counter + idx) & mask).to_bytes(IV_SIZE, 'big')
+            for idx in range(first, last)
+        )
+        keystream = self._engine.encrypt_blocks(counters, self._key)
+        self.__position = stop
+
+        return base.xor(data, memoryview(keystream)[skip:skip + len(data)])
+
+
+class Decryptor(_Context):
+    """CTR decryption context."""
+
+
+class Encryptor(_Context):
+    """CTR encryption context."""
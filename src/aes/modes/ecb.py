@@ -0,0 +1,21 @@
+"""Electronic codebook mode (NIST SP 800-38A, 6.1)."""
+
+from aes.modes import base
+
+IV_SIZE = None
+
+
+class Decryptor(base.BlockContext):
+    """ECB decryption context."""
+
+    INVERSE = True
+
+    def _process(self, data):
+        return self._engine.decrypt_blocks(data, self._key)
+
+
+class Encryptor(base.BlockContext):
+    """ECB encryption context."""
+
+    def _process(self, data):
+        return self._engine.encrypt_blocks(data, self._key)
@@ -0,0 +1,142 @@
+"""Galois/counter mode (NIST SP 800-38D).
+
+Data is encrypted in counter mode and authenticated with GHASH using
+multiplication tables which the key caches for the engine of context.
+Initialization vectors are 96-bit as recommended (SP 800-38D, 8.2.1).
+
+Decryption returns plaintext before the tag is verified on
+finalization, so it must be discarded if verification fails.
+"""
+
+import hmac
+
+from aes import errors
+from aes import ghash
+from aes.modes import base
+from aes.modes import ctr
+
+IV_SIZE = 12
+MIN_TAG_SIZE = 12
+TAG_SIZE = base.BLOCK_SIZE
+
+
+class _Context(base.StreamContext):
+    """GCM context authenticating additional data and ciphertext."""
+
+    INVERSE = False
+
+    def __init__(self, key, iv, engine, *, scheme=None, tag_size=TAG_SIZE):
+        super().__init__(key, iv, engine, scheme=scheme)
+
+        if not MIN_TAG_SIZE <= tag_size <= TAG_SIZE:
+            raise ValueError(
+                f'tag size must be from {MIN_TAG_SIZE} to {TAG_SIZE}')
+
+        # Counter block J0 masks the tag, data starts from inc32(J0).
+        self.__counter = ctr.Encryptor(
+            key, iv + b'\x00\x00\x00\x01', engine, counter_size=4)
+        self.__mask = int.from_bytes(
+            self.__counter.update(bytes(base.BLOCK_SIZE)), 'big')
+        self.__hash = ghash.GHash(key.hash_tables(engine))
+        self.__sizes = [0, 0]
+        self.__tag_size = tag_size
+
+    def __setstate__(self, state):
+        super().__setstate__(state)
+        # Tables are not pickled, the key keeps them for engine.
+        self.__hash.restore(self._key.hash_tables(self._engine))
+
+    @property
+    def tag_size(self):
+        """Size of authentication tag in bytes."""
+        return self.__tag_size
+
+    def authenticate_additional_data(self, data):
+        """Authenticates data which is not encrypted.
+
+        Additional data may come by pieces but before any data.
+        """
+        if self.finalized:
+            raise errors.FinalizedError()
+
+        if self.__sizes[1]:
+            raise ValueError('additional data must precede data')
+
+        self.__hash.update(data)
+        self.__sizes[0] += len(data)
+
+    def _digest(self):
+        """Returns authentication tag of processed data."""
+        self.__hash.pad()
+        self.__hash.update(b''.join(
+            (8 * size).to_bytes(8, 'big') for size in self.__sizes))
+
+        tag = (self.__hash.value ^ self.__mask).to_bytes(TAG_SIZE, 'big')
+
+        return tag[:self.__tag_size]
+
+    def _process(self, data):
+        if not self.__sizes[1]:
+            self.__hash.pad()
+
+        if self.INVERSE:
+            self.__hash.update(data)
+
+        result = self.__counter.update(data)
+        self.__sizes[1] += len(data)
+
+        if not self.INVERSE:
+            self.__hash.update(result)
+
+        return result
+
+
+class Decryptor(_Context):
+    """GCM decryption context verifying tag on finalization."""
+
+    INVERSE = True
+
+    def __init__(self, key, iv, engine, **options):
+        super().__init__(key, iv, engine, **options)
+        self.__tag = None
+
+    def finalize(self):
+        """Finishes context verifying tag given by finalize_with_tag().
+
+        Missing tag is checked first, so context may still be finalized
+        with tag afterwards.
+        """
+        if self.__tag is None and not self.finalized:
+            raise ValueError('tag is required, use finalize_with_tag()')
+
+        return super().finalize()
+
+    def finalize_with_tag(self, tag):
+        """Finishes context verifying authentication tag."""
+        self.__tag = tag
+
+        return self.finalize()
+
+    def _finalize(self):
+        if not hmac.compare_digest(self._digest(), self.__tag):
+            raise errors.AuthenticationError()
+
+        return b''
+
+
+class Encryptor(_Context):
+    """GCM encryption context producing tag on finalization."""
+
+    def __init__(self, key, iv, engine, **options):
+        super().__init__(key, iv, engine, **options)
+        self.__tag = None
+
+    @property
+    def tag(self):
+        """Authentication tag, None until finalization."""
+        return self.__tag
+
+    def _finalize(self):
+        self.__tag = self._digest()
+
+        return b''
@@ -0,0 +1,43 @@
+"""Output feedback mode (NIST SP 800-38A, 6.4).
+
+Keystream is a chain of encryptions of initialization vector which does
+not depend on data, so every update first produces keystream for all
+its data at once and then XORs it in one go. The chain is serial, so
+its blocks go through the single state path of the engine. Encryption
+and decryption are the same.
+"""
+
+from aes.block import Block
+from aes.modes import base
+
+IV_SIZE = base.BLOCK_SIZE
+
+
+class _Context(base.StreamContext):
+    """OFB context keeping unused keystream of the last block."""
+
+    def __init__(self, key, iv, engine, *, scheme=None):
+        super().__init__(key, iv, engine, scheme=scheme)
+        self.__block = Block(iv)
+        self.__keystream = b''
+
+    def _process(self, data):
+        encrypt, key = self._engine.encrypt, self._key
+        block = self.__block
+        keystream = bytearray(self.__keystream)
+
+        for _ in range(-(-(len(data) - len(keystream)) // base.BLOCK_SIZE)):
+            encrypt(block, key)
+            keystream += bytes(block)
+
+        self.__keystream = bytes(keystream[len(data):])
+
+        return base.xor(data, keystream[:len(data)])
+
+
+class Decryptor(_Context):
+    """OFB decryption context."""
+
+
+class Encryptor(_Context):
+    """OFB encryption context."""
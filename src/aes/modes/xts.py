@@ -0,0 +1,214 @@
+"""XEX-based tweaked-codebook mode with ciphertext stealing (IEEE 1619,
+NIST SP 800-38E).
+
+Data is divided into units of ``unit_size`` bytes, like disk sectors.
+Initialization vector is the number of the first unit as 128-bit
+little-endian tweak value, see unit_tweak(). Tweaks of the next units
+are their numbers, so any unit can be decrypted or re-encrypted alone. Whole
+units are processed in batches: tweaks of all their blocks go through
+the engine at once and so do the blocks themselves. The last unit may
+be partial but not shorter than a block; its last blocks use
+ciphertext stealing.
+
+Keys are twice as long as AES keys: the first half encrypts data and
+the second one encrypts tweaks.
+"""
+
+import collections
+import functools
+import pathlib
+
+from aes import constants
+from aes import errors
+from aes.key import Key
+from aes.modes import base
+
+DEFAULT_UNIT_SIZE = 4096
+IV_SIZE = base.BLOCK_SIZE
+
+_MODULUS = 1 << 8 * base.BLOCK_SIZE | 0x87
+
+Keys = collections.namedtuple('Keys', ('data_key', 'tweak_key'))
+
+
+@functools.singledispatch
+def load_key(data, *, cached=False):
+    """Creates pair of keys from data of double length."""
+    raise NotImplementedError()
+
+
+@load_key.register(Keys)
+def _(keys, *, cached=False):
+    return keys
+
+
+@load_key.register(Key)
+def _(key, *, cached=False):
+    return load_key(key.data, cached=cached)
+
+
+@load_key.register(bytes)
+def _(key_data, *, cached=False):
+    if len(key_data) << 3 not in constants.XTS_KEY_SIZES:
+        raise errors.KeySizeError()
+
+    size = len(key_data) >> 1
+
+    return Keys(
+        Key.load(key_data[:size], cached=cached),
+        Key.load(key_data[size:], cached=cached)
+    )
+
+
+@load_key.register(pathlib.Path)
+def _(key_file, *, cached=False):
+    with open(key_file, 'rb') as file:
+        return load_key(file.read(), cached=cached)
+
+
+class _Context(base.Context):
+    """XTS context buffering data until whole units."""
+
+    INVERSE = False
+
+    def __init__(
+            self,
+            key,
+            iv,
+            engine,
+            *,
+            scheme=None,
+            unit_size=DEFAULT_UNIT_SIZE
+    ):
+        super().__init__(key, iv, engine)
+
+        if scheme is not None:
+            raise ValueError('xts mode does not use padding')
+
+        if unit_size <= 0 or unit_size % base.BLOCK_SIZE:
+            raise ValueError(
+                f'unit size must be a positive multiple of {base.BLOCK_SIZE}')
+
+        self.__pending = bytearray()
+        self.__unit = int.from_bytes(iv, 'little')
+        self.__unit_size = unit_size
+
+    @property
+    def unit(self):
+        """Number of the next unit."""
+        return self.__unit
+
+    def output_size(self, size):
+        return size + self.__unit_size - 1
+
+    def _finalize(self):
+        pending = self.__pending
+        if not pending:
+            return b''
+
+        if len(pending) < base.BLOCK_SIZE:
+            raise errors.StateSizeError()
+
+        return self._process(pending)
+
+    def _process(self, data):
+        """Processes whole units and, at the end, maybe a partial one."""
+        stolen = len(data) % base.BLOCK_SIZE
+        whole = len(data) - stolen - (base.BLOCK_SIZE if stolen else 0)
+        tweaks = self.__tweaks(len(data))
+
+        result = bytearray(self.__xex(data[:whole], tweaks[:whole]))
+        if stolen:
+            first, second = (
+                tweaks[whole:whole + base.BLOCK_SIZE],
+                tweaks[whole + base.BLOCK_SIZE:]
+            )
+            if self.INVERSE:
+                first, second = second, first
+
+            # Last whole block gives its end to partial block and takes
+            # place of the processed partial block (IEEE 1619, 5.3.2).
+            last = self.__xex(data[whole:whole + base.BLOCK_SIZE], first)
+            result += self.__xex(
+                bytes(data[whole + base.BLOCK_SIZE:]) + last[stolen:], second)
+            result += last[:stolen]
+
+        return bytes(result)
+
+    def _update_into(self, data, output):
+        pending = self.__pending
+
+        size = len(pending) + len(data)
+        size -= size % self.__unit_size
+        if len(output) < size:
+            raise ValueError('buffer is too small')
+
+        pending += data
+        if size:
+            output[:size] = self._process(pending[:size])
+            del pending[:size]
+
+        return size
+
+    def __tweaks(self, size):
+        """Returns tweaks of all blocks of next units of data size."""
+        unit_size = self.__unit_size
+        units = range(self.__unit, self.__unit - (-size // unit_size))
+        self.__unit = units.stop
+
+        encrypted = self._engine.encrypt_blocks(
+            b''.join(map(unit_tweak, units)), self._key.tweak_key)
+
+        tweaks = bytearray()
+        for offset in range(0, len(encrypted), base.BLOCK_SIZE):
+            tweak = int.from_bytes(
+                encrypted[offset:offset + base.BLOCK_SIZE], 'little')
+            blocks = -(-min(unit_size, size) // base.BLOCK_SIZE)
+            size -= unit_size
+
+            # Multiplications by the primitive element alpha.
+            for _ in range(blocks):
+                tweaks += tweak.to_bytes(base.BLOCK_SIZE, 'little')
+                tweak <<= 1
+                if tweak >> 8 * base.BLOCK_SIZE:
+                    tweak ^= _MODULUS
+
+        return tweaks
+
+    def __xex(self, data, tweaks):
+        """Processes whole blocks masked with their tweaks."""
+        if not data:
+            return b''
+
+        process = (
+            self._engine.decrypt_blocks
+            if self.INVERSE else self._engine.encrypt_blocks
+        )
+
+        return base.xor(
+            process(base.xor(data, tweaks), self._key.data_key), tweaks)
+
+
+def check_size(size, unit_size=DEFAULT_UNIT_SIZE):
+    """Checks data of size does not end with unit shorter than block.
+
+    Such unit is found out only when context is finalized, so callers
+    knowing size beforehand check it before writing any output.
+    """
+    if 0 < size % unit_size < base.BLOCK_SIZE:
+        raise errors.StateSizeError()
+
+
+def unit_tweak(unit):
+    """Returns tweak value of data unit number."""
+    return unit.to_bytes(base.BLOCK_SIZE, 'little')
+
+
+class Decryptor(_Context):
+    """XTS decryption context."""
+
+    INVERSE = True
+
+
+class Encryptor(_Context):
+    """XTS encryption context."""
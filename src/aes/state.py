@@ -2,10 +2,9 @@
 
 import collections
 import functools
+import mmap
 import pathlib
 
-from itertools import chain
-
 from aes import constants
 from aes import errors
 
@@ -25,9 +24,10 @@ class State(collections.UserList):
         raise NotImplementedError()
 
     @dump.register(bytearray)
+    @dump.register(memoryview)
+    @dump.register(mmap.mmap)
     def _(self, data, offset):
-        data[offset:offset + 4 * constants.NB] = chain.from_iterable(
-            zip(*self.data))
+        self.dump_into(data, offset)
 
     @dump.register(pathlib.Path)
     def _(self, file_path, offset):
@@ -38,20 +38,27 @@ class State(collections.UserList):
             for column in zip(*self.data):
                 file.write(bytes(column))
 
+    def dump_into(self, buffer, offset=0):
+        """Writes state into writable buffer in place."""
+        view = memoryview(buffer).cast('B')
+        stop = offset + 4 * constants.NB
+
+        for row_idx, row in enumerate(self.data):
+            view[offset + row_idx:stop:4] = bytes(row)
+
     @functools.singledispatchmethod
     @classmethod
     def load(cls, data, offset):
         """Loads state from data."""
         raise NotImplementedError()
 
+    @load.register(bytes)
     @load.register(bytearray)
+    @load.register(memoryview)
+    @load.register(mmap.mmap)
     @classmethod
     def _(cls, data, offset=0):
-        data = data[offset:offset + 16]
-        if data:
-            return State(data)
-
-        return None
+        return cls.load_from_buffer(data, offset)
 
     @load.register(pathlib.Path)
     @classmethod
@@ -64,3 +71,12 @@ class State(collections.UserList):
                 return State(data)
 
         return None
+
+    @classmethod
+    def load_from_buffer(cls, buffer, offset=0):
+        """Loads state from buffer without intermediate copies."""
+        data = memoryview(buffer).cast('B')[offset:offset + 4 * constants.NB]
+        if data:
+            return State(data)
+
+        return None
@@ -5,13 +5,10 @@ from aes import utils
 
 def add_round_key(state, key_schedule, *, current_round):
     """The AddRoundKey step."""
-    start, stop = 4 * current_round, 4 * (current_round + 1)
+    round_key = key_schedule[current_round]
 
     for row_idx, row in enumerate(state):
-        state[row_idx] = utils.xor_vectors(
-            row,
-            key_schedule[row_idx][start:stop]
-        )
+        state[row_idx] = utils.xor_vectors(row, round_key[row_idx::4])
 
 
 def mix_columns(state, *, inverse=False):
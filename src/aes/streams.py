@@ -0,0 +1,476 @@
+"""File-like objects and asyncio streams over encrypted data."""
+
+import asyncio
+import hashlib
+import io
+import pickle
+from concurrent import futures
+
+import padding
+
+from aes import engines
+from aes import errors
+from aes import modes
+from aes.cipher import Cipher
+from aes.cipher import load_key
+from aes.key import Key
+from aes.modes import base
+from aes.modes import cbc
+from aes.modes import ctr
+
+BLOCK_SIZE = base.BLOCK_SIZE
+CHUNK_SIZE = 1 << 20
+SEEKABLE_MODES = ('cbc', 'ctr', 'ecb')
+
+_CLOSED = 'I/O operation on closed file'
+
+# Keys of worker process by digest set by pool initializer.
+_KEYS = {}
+
+
+async def decrypt_stream(reader, writer, key, *, executor=None, **options):
+    """Decrypts data from asyncio stream reader into stream writer.
+
+    Chunks of CHUNK_SIZE bytes are decrypted by executor, the default
+    one of the loop if None, and written waiting for drain(). Options
+    are mode, iv, padding scheme and options of mode, see
+    DecryptingReader.
+    """
+    context = _context(key, inverse=True, **options)
+    reserve = getattr(context, 'tag_size', 0)
+
+    context, tail = await _pipe(
+        reader, writer, context, executor, reserve=reserve)
+
+    if not reserve:
+        writer.write(context.finalize())
+    elif len(tail) < reserve:
+        raise errors.StateSizeError()
+    else:
+        writer.write(context.finalize_with_tag(tail))
+
+    await writer.drain()
+
+
+async def encrypt_stream(reader, writer, key, *, executor=None, **options):
+    """Encrypts data from asyncio stream reader into stream writer.
+
+    Chunks of CHUNK_SIZE bytes are encrypted by executor, the default
+    one of the loop if None, and written waiting for drain(). Process
+    pools get the key once by initialize() and only state of context
+    with every chunk. They should not fork workers while connections
+    are open since they inherit sockets, forkserver or spawn context
+    avoids it. Options are mode, iv, padding scheme and options of mode,
+    see EncryptingWriter.
+    """
+    context = _context(key, **options)
+
+    context, _ = await _pipe(reader, writer, context, executor)
+
+    writer.write(
+        context.finalize() + (getattr(context, 'tag', None) or b''))
+    await writer.drain()
+
+
+def initialize(*keys):
+    """Keeps keys in worker process, initializer of process pools.
+
+    Keys are data or loaded keys, XTS keys are given as loaded pairs.
+    """
+    for key in keys:
+        for item in key if isinstance(key, tuple) else (load_key(key),):
+            _KEYS[_digest(item)] = item
+
+
+class DecryptingReader(io.RawIOBase):
+    """Reader decrypting encrypted file sequentially.
+
+    Raw data is read and decrypted by CHUNK_SIZE bytes into preallocated
+    buffers. Block modes use bit padding by default which is removed at
+    the end of file; authenticated modes expect tag ending the file and
+    verify it there.
+    """
+
+    def __init__(self, raw, key, mode='ecb', iv=None, *, scheme=None,
+                 **options):
+        super().__init__()
+        self.__context = _context(
+            key, mode, iv, inverse=True, scheme=scheme, **options)
+        self.__raw = raw
+
+        # Raw data, its first bytes are held back as possible tag.
+        self.__data = bytearray(CHUNK_SIZE + self.__reserve)
+        self.__held = 0
+        # Decrypted data, from start to end is not read yet.
+        self.__buffer = bytearray(self.__context.output_size(CHUNK_SIZE))
+        self.__start = self.__end = 0
+
+    @property
+    def __reserve(self):
+        """Size of tag ending raw data."""
+        return getattr(self.__context, 'tag_size', 0)
+
+    def close(self):
+        if not self.closed:
+            try:
+                super().close()
+            finally:
+                self.__raw.close()
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        if self.closed:
+            raise ValueError(_CLOSED)
+
+        while self.__start == self.__end and not self.__context.finalized:
+            self.__fill()
+
+        with memoryview(buffer) as view, view.cast('B') as output:
+            size = min(len(output), self.__end - self.__start)
+            output[:size] = self.__buffer[self.__start:self.__start + size]
+
+        self.__start += size
+
+        return size
+
+    def __fill(self):
+        """Reads and decrypts next chunk of raw data."""
+        held, reserve = self.__held, self.__reserve
+
+        with memoryview(self.__data) as view:
+            with view[held:] as free:
+                size = held + (self.__raw.readinto(free) or 0)
+
+            if size == held:
+                self.__finish(view[:held])
+                return
+
+            count = max(size - reserve, 0)
+            with view[:count] as data:
+                self.__end = self.__context.update_into(data, self.__buffer)
+
+        self.__start = 0
+        self.__held = size - count
+        self.__data[:self.__held] = self.__data[count:size]
+
+    def __finish(self, tail):
+        """Finalizes context with tag held at the end of raw data."""
+        with tail:
+            if not self.__reserve:
+                result = self.__context.finalize()
+            elif len(tail) < self.__reserve:
+                raise errors.StateSizeError()
+            else:
+                result = self.__context.finalize_with_tag(bytes(tail))
+
+        self.__buffer[:len(result)] = result
+        self.__start, self.__end = 0, len(result)
+
+
+class EncryptingWriter(io.RawIOBase):
+    """Writer encrypting data into raw file.
+
+    Written data is collected into preallocated buffer and encrypted by
+    CHUNK_SIZE bytes. Closing writer encrypts the rest with padding, bit
+    one by default in block modes, or appends tag in authenticated modes.
+    """
+
+    def __init__(self, raw, key, mode='ecb', iv=None, *, scheme=None,
+                 **options):
+        super().__init__()
+        self.__context = _context(key, mode, iv, scheme=scheme, **options)
+        self.__raw = raw
+
+        self.__data = bytearray(CHUNK_SIZE)
+        self.__filled = 0
+        self.__buffer = bytearray(self.__context.output_size(CHUNK_SIZE))
+        self.__position = 0
+
+    def close(self):
+        if not self.closed:
+            try:
+                # Flushes collected data before finalization.
+                super().close()
+                self.__raw.write(
+                    self.__context.finalize()
+                    + (getattr(self.__context, 'tag', None) or b''))
+            finally:
+                self.__raw.close()
+
+    def flush(self):
+        """Encrypts collected data and flushes raw file.
+
+        Data of partial blocks stays in context until more data comes.
+        """
+        super().flush()
+        self.__flush()
+        self.__raw.flush()
+
+    def tell(self):
+        if self.closed:
+            raise ValueError(_CLOSED)
+
+        return self.__position
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        if self.closed:
+            raise ValueError(_CLOSED)
+
+        with memoryview(data) as view, view.cast('B') as view:
+            offset = 0
+            while offset < len(view):
+                count = min(len(view) - offset, CHUNK_SIZE - self.__filled)
+                filled = self.__filled + count
+                self.__data[self.__filled:filled] = view[offset:offset + count]
+                self.__filled = filled
+                offset += count
+
+                if filled == CHUNK_SIZE:
+                    self.__flush()
+
+        self.__position += offset
+
+        return offset
+
+    def __flush(self):
+        """Encrypts collected data into raw file."""
+        if not self.__filled:
+            return
+
+        with memoryview(self.__data) as view, view[:self.__filled] as data:
+            size = self.__context.update_into(data, self.__buffer)
+
+        self.__filled = 0
+
+        with memoryview(self.__buffer) as view, view[:size] as result:
+            self.__raw.write(result)
+
+
+class SeekableReader(io.RawIOBase):
+    """Reader decrypting random ranges of seekable encrypted file.
+
+    Only blocks covering requested range are read and decrypted, which
+    is possible in ECB and CTR modes and in CBC mode with one block
+    before the range. Block modes use bit padding by default which is
+    measured once at the end of file. Every read returns at most
+    CHUNK_SIZE bytes.
+    """
+
+    def __init__(self, raw, key, mode='ecb', iv=None, *, scheme=None):
+        super().__init__()
+
+        if mode not in SEEKABLE_MODES:
+            raise ValueError(f'{mode} mode does not support random access')
+
+        if (None if iv is None else len(iv)) != modes.get(mode).IV_SIZE:
+            raise errors.IVSizeError()
+
+        if mode == 'ctr':
+            if scheme is not None:
+                raise ValueError('ctr mode does not use padding')
+        elif scheme is None:
+            scheme = padding.DEFAULT_SCHEME
+
+        self.__iv = iv
+        self.__key = load_key(key)
+        self.__mode = mode
+        self.__position = 0
+        self.__raw = raw
+        self.__scheme = scheme
+        self.__size = None
+
+    @property
+    def size(self):
+        """Size of decrypted data."""
+        if self.__size is None:
+            size = self.__raw.seek(0, io.SEEK_END)
+
+            if self.__scheme is not None:
+                if not size or size % BLOCK_SIZE:
+                    raise errors.StateSizeError()
+
+                # Padding may take the last two blocks, see padding.measure().
+                first = max(size // BLOCK_SIZE - 2, 0)
+                tail = self.__decrypt(first, size // BLOCK_SIZE)
+                size -= padding.measure(
+                    tail, scheme=self.__scheme, size=BLOCK_SIZE)
+
+            self.__size = size
+
+        return self.__size
+
+    def close(self):
+        if not self.closed:
+            self.__raw.close()
+
+        super().close()
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        with memoryview(buffer) as view, view.cast('B') as output:
+            size = min(len(output), self.size - self.__position, CHUNK_SIZE)
+            if size <= 0:
+                return 0
+
+            start = self.__position
+            first = start // BLOCK_SIZE
+            data = self.__decrypt(first, -(-(start + size) // BLOCK_SIZE))
+            offset = start - first * BLOCK_SIZE
+            output[:size] = data[offset:offset + size]
+
+        self.__position += size
+
+        return size
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self.__position
+        elif whence == io.SEEK_END:
+            offset += self.size
+        elif whence != io.SEEK_SET:
+            raise ValueError(f'invalid whence: {whence}')
+
+        if offset < 0:
+            raise ValueError(f'negative seek position: {offset}')
+
+        self.__position = offset
+
+        return offset
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self.__position
+
+    def __decrypt(self, first, last):
+        """Returns decrypted blocks from first to last."""
+        data = self.__read(first, last)
+        engine = engines.get()
+
+        if self.__mode == 'ctr':
+            decryptor = ctr.Decryptor(self.__key, self.__iv, engine)
+            decryptor.seek(first * BLOCK_SIZE)
+            return decryptor.update(data)
+
+        if self.__mode == 'cbc':
+            iv = self.__read(first - 1, first) if first else self.__iv
+            return cbc.Decryptor(self.__key, iv, engine).update(data)
+
+        return engine.decrypt_blocks(data, self.__key)
+
+    def __read(self, first, last):
+        """Returns raw data from first to last block."""
+        self.__raw.seek(first * BLOCK_SIZE)
+        data = self.__raw.read((last - first) * BLOCK_SIZE)
+
+        if self.__mode != 'ctr' and len(data) % BLOCK_SIZE:
+            raise errors.StateSizeError()
+
+        return data
+
+
+def _context(key, mode='ecb', iv=None, *, inverse=False, scheme=None,
+             **options):
+    """Returns context of mode, block modes use bit padding by default."""
+    if scheme is None and issubclass(
+            modes.get(mode).Encryptor, base.BlockContext
+    ):
+        scheme = padding.DEFAULT_SCHEME
+
+    cipher = Cipher(key, mode, iv, scheme=scheme, **options)
+
+    return cipher.decryptor() if inverse else cipher.encryptor()
+
+
+def _digest(key):
+    """Returns digest referring to key in pickled state."""
+    return hashlib.sha256(key.data).digest()
+
+
+def _dumps(context, keys):
+    """Returns pickled state of context referring to its keys by digest.
+
+    Keys are collected into keys by their digest.
+    """
+    def persistent_id(obj):
+        if not isinstance(obj, Key):
+            return None
+
+        digest = _digest(obj)
+        keys[digest] = obj
+
+        return digest
+
+    with io.BytesIO() as file:
+        pickler = pickle.Pickler(file, pickle.HIGHEST_PROTOCOL)
+        pickler.persistent_id = persistent_id
+        pickler.dump(context)
+
+        return file.getvalue()
+
+
+def _loads(state, keys):
+    """Returns context unpickled from state with keys by digest."""
+    def persistent_load(digest):
+        try:
+            return keys[digest]
+        except KeyError:
+            raise pickle.UnpicklingError(
+                'key is not given to worker, see initialize()') from None
+
+    with io.BytesIO(state) as file:
+        unpickler = pickle.Unpickler(file)
+        unpickler.persistent_load = persistent_load
+
+        return unpickler.load()
+
+
+async def _pipe(reader, writer, context, executor, *, reserve=0):
+    """Streams data from reader through context into writer by chunks.
+
+    Process pools get pickled state of context without keys, see
+    _update(). Returns context, a copy when processed by another
+    process, and tail of reserved size held back from it.
+    """
+    loop = asyncio.get_running_loop()
+    keys = {}
+    pickled = isinstance(executor, futures.ProcessPoolExecutor)
+    if pickled:
+        context = _dumps(context, keys)
+    tail = b''
+
+    while chunk := await reader.read(CHUNK_SIZE):
+        data = tail + chunk if tail else chunk
+        size = max(len(data) - reserve, 0)
+        tail = data[size:]
+
+        if size:
+            context, result = await loop.run_in_executor(
+                executor, _update, context, data[:size])
+            writer.write(result)
+            await writer.drain()
+
+    return (_loads(context, keys) if pickled else context), tail
+
+
+def _update(context, data):
+    """Returns context with result of processing data by it.
+
+    Context pickled by _dumps() is loaded with keys of worker and
+    returned pickled again.
+    """
+    if not isinstance(context, bytes):
+        return context, context.update(data)
+
+    context = _loads(context, _KEYS)
+    result = context.update(data)
+
+    return _dumps(context, {}), result
@@ -48,21 +48,28 @@ _MUL_OPS_MAPPING = {
     0x0D: _mul_by_0d,
     0x0E: _mul_by_0e
 }
+MUL_TABLES = {
+    multiplier: bytes(map(operation, range(0x100)))
+    for multiplier, operation in _MUL_OPS_MAPPING.items()
+}
+_MIX_COLUMNS_TABLES = {
+    inverse: tuple(
+        tuple(MUL_TABLES[multiplier] for multiplier in row) for row in matrix)
+    for inverse, matrix in (
+        (False, constants.FORWARD_MIX_COLUMNS),
+        (True, constants.INVERSE_MIX_COLUMNS)
+    )
+}
 
 
 def galois_mul(vector, *, inverse=False):
     """Multiplies matrix by vector in Galois Field (256)."""
-    if inverse:
-        matrix = constants.INVERSE_MIX_COLUMNS
-    else:
-        matrix = constants.FORWARD_MIX_COLUMNS
-
     result = []
 
-    for row in matrix:
+    for row in _MIX_COLUMNS_TABLES[inverse]:
         number = 0x00
-        for elem, multiplier in zip(vector, row):
-            number ^= _MUL_OPS_MAPPING[multiplier](elem)
+        for elem, table in zip(vector, row):
+            number ^= table[elem]
         result.append(number)
 
     return result
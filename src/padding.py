@@ -1,49 +1,100 @@
 """
 Functions that helps working with padding similar to bit padding as
 described in
-https://en.wikipedia.org/wiki/Padding_(cryptography)#Bit_padding.
+https://en.wikipedia.org/wiki/Padding_(cryptography)#Bit_padding
+and PKCS#7 padding as described in RFC 5652, 6.3.
+
+Block sizes up to 255 bytes are supported.
 """
 
 import functools
+import io
 import pathlib
 
+BIT = 'bit'
+PKCS7 = 'pkcs7'
+
+DEFAULT_SCHEME = BIT
+MAX_SIZE = 255
+SCHEMES = (BIT, PKCS7)
+
+
+class PaddingError(ValueError):
+    """Padding is malformed error."""
+
 
 @functools.singledispatch
-def add(data, size):
+def add(data, size, *, scheme=DEFAULT_SCHEME):
     """Adds padding."""
     raise NotImplementedError()
 
 
 @add.register(bytearray)
-def _(data, size):
-    data += b'\x01'
-    data += b'\x00' * (size - len(data) % size)
+def _(data, size, *, scheme=DEFAULT_SCHEME):
+    data += generate(len(data), size, scheme=scheme)
 
 
 @add.register(pathlib.Path)
-def _(file_path, size):
+def _(file_path, size, *, scheme=DEFAULT_SCHEME):
     with open(file_path, 'ab') as file:
-        file.write(b'\x01')
-        file.write(b'\x00' * (size - file.tell() % size))
+        file.write(generate(file.seek(0, io.SEEK_END), size, scheme=scheme))
+
+
+def generate(length, size, *, scheme=DEFAULT_SCHEME):
+    """Returns padding for data of given length."""
+    if scheme == PKCS7:
+        count = size - length % size
+        return bytes((count,)) * count
+
+    _check_scheme(scheme)
+
+    return b'\x01' + b'\x00' * (size - (length + 1) % size)
+
+
+def measure(data, *, scheme=DEFAULT_SCHEME, size=MAX_SIZE):
+    """Returns length of padding ending data of blocks of given size.
+
+    Bit padding takes up to size + 1 bytes: its first byte may end one
+    block followed by a whole block of zeros, so the last two blocks
+    must be given to measure it.
+    """
+    if scheme == PKCS7:
+        count = data[-1] if data else 0
+        if not 0 < count <= size or data[-count:] != bytes((count,)) * count:
+            raise PaddingError()
+
+        return count
+
+    _check_scheme(scheme)
+
+    stripped = bytes(data).rstrip(b'\x00')
+    if not stripped.endswith(b'\x01'):
+        raise PaddingError()
+
+    return len(data) - len(stripped) + 1
 
 
 @functools.singledispatch
-def remove(data):
-    """Removes padding."""
+def remove(data, *, scheme=DEFAULT_SCHEME, size=MAX_SIZE):
+    """Removes padding from data of blocks of given size."""
     raise NotImplementedError()
 
 
 @remove.register(bytearray)
-def _(data):
-    while not data.pop():
-        continue
+def _(data, *, scheme=DEFAULT_SCHEME, size=MAX_SIZE):
+    del data[len(data) - measure(data, scheme=scheme, size=size):]
 
 
 @remove.register(pathlib.Path)
-def _(file_path):
-    with open(file_path, 'ab+') as file:
-        file.seek(-1, 1)
-        while file.read(1) != b'\x01':
-            file.seek(-2, 1)
+def _(file_path, *, scheme=DEFAULT_SCHEME, size=MAX_SIZE):
+    with open(file_path, 'rb+') as file:
+        end = file.seek(0, io.SEEK_END)
+        file.seek(max(end - size - 1, 0))
+
+        file.truncate(end - measure(file.read(), scheme=scheme, size=size))
+
 
-        file.truncate(file.tell() - 1)
+def _check_scheme(scheme):
+    """Checks scheme is known."""
+    if scheme not in SCHEMES:
+        raise ValueError(f'unknown padding scheme: {scheme}')
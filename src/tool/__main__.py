@@ -4,8 +4,161 @@ import argparse
 import pathlib
 import sys
 
+import padding
+
 from aes import constants
+from aes import errors
+from aes import modes
+from aes.modes import base as modes_base
+from aes.modes import xts
 from tool import actions
+from tool import parallel
+
+STDIO = pathlib.Path('-')
+
+
+def chunk_size(value):
+    """Converts chunk size argument to int."""
+    try:
+        size = int(value)
+        actions.check_chunk_size(size)
+    except (ValueError, errors.ChunkSizeError):
+        raise argparse.ArgumentTypeError(
+            f'chunk size must be a positive multiple of {4 * constants.NB}'
+        ) from None
+
+    return size
+
+
+def check_cipher_arguments(parser, namespace):
+    """Checks padding scheme and initialization vector suit mode."""
+    mode = modes.get(namespace.mode)
+
+    if not issubclass(mode.Encryptor, modes_base.BlockContext):
+        if namespace.scheme is not None:
+            parser.error(f'{namespace.mode} mode does not use padding')
+    elif namespace.scheme == actions.CIPHERTEXT_STEALING:
+        if namespace.mode != 'ecb':
+            parser.error('ciphertext stealing requires ecb mode')
+
+    if namespace.jobs is not None:
+        if namespace.mode not in parallel.MODES:
+            parser.error(f'--jobs requires {" or ".join(parallel.MODES)} mode')
+        if namespace.scheme == actions.CIPHERTEXT_STEALING:
+            parser.error('ciphertext stealing does not support --jobs')
+
+    if namespace.unit_size is not None and namespace.mode != 'xts':
+        parser.error('--unit-size requires xts mode')
+
+    if mode.IV_SIZE is None:
+        if namespace.iv is not None:
+            parser.error(f'{namespace.mode} mode does not use --iv')
+    elif namespace.iv is None or len(namespace.iv) != mode.IV_SIZE:
+        parser.error(f'{namespace.mode} mode requires --iv of '
+                     f'{mode.IV_SIZE} bytes')
+
+
+def initialization_vector(value):
+    """Converts hexadecimal initialization vector argument to bytes."""
+    try:
+        return bytes.fromhex(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            'initialization vector must be hexadecimal') from None
+
+
+def jobs(value):
+    """Converts number of jobs argument to int."""
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+
+    if number < 1:
+        raise argparse.ArgumentTypeError('jobs must be a positive number')
+
+    return number
+
+
+def unit_size(value):
+    """Converts data unit size argument to int."""
+    try:
+        size = int(value)
+        actions.check_chunk_size(size)
+    except (ValueError, errors.ChunkSizeError):
+        raise argparse.ArgumentTypeError(
+            f'unit size must be a positive multiple of {4 * constants.NB}'
+        ) from None
+
+    return size
+
+
+def add_processing_arguments(parser):
+    """Adds arguments shared by decrypt and encrypt actions."""
+    parser.add_argument(
+        '-c',
+        '--chunk-size',
+        default=actions.DEFAULT_CHUNK_SIZE,
+        type=chunk_size,
+        help='bytes to process at once',
+        metavar='SIZE'
+    )
+    parser.add_argument(
+        '-m',
+        '--mode',
+        default=actions.DEFAULT_MODE,
+        choices=modes.MODES,
+        help='mode of operation',
+        metavar='MODE'
+    )
+    parser.add_argument(
+        '--iv',
+        type=initialization_vector,
+        help='initialization vector in hexadecimal',
+        metavar='HEX'
+    )
+    parser.add_argument(
+        '--unit-size',
+        type=unit_size,
+        help=f'data unit size of xts mode ({xts.DEFAULT_UNIT_SIZE} by default)',
+        metavar='SIZE'
+    )
+    parser.add_argument(
+        '-p',
+        '--padding',
+        choices=actions.SCHEMES,
+        dest='scheme',
+        help=f'padding scheme ({padding.DEFAULT_SCHEME} by default for block'
+             ' modes) or ciphertext stealing',
+        metavar='SCHEME'
+    )
+    output_group = parser.add_mutually_exclusive_group()
+    output_group.add_argument(
+        '--mmap',
+        action='store_true',
+        dest='mapped',
+        help='process memory-mapped file in place'
+    )
+    output_group.add_argument(
+        '-j',
+        '--jobs',
+        type=jobs,
+        help='process file in place by N worker processes (ecb and ctr '
+             'modes)',
+        metavar='N'
+    )
+    output_group.add_argument(
+        '-o',
+        '--output',
+        type=pathlib.Path,
+        help='file to write to instead of processing in place',
+        metavar='OUTPUT'
+    )
+    output_group.add_argument(
+        '--atomic',
+        action='store_true',
+        help='write to temporary file and replace FILE with it'
+    )
 
 
 def main(*args):
@@ -22,7 +175,7 @@ def main(*args):
     decrypt_parser.add_argument(
         'file_path',
         type=pathlib.Path,
-        help='file to decrypt',
+        help='file to decrypt in place or - to stream stdin to stdout',
         metavar='FILE'
     )
     decrypt_parser.add_argument(
@@ -31,11 +184,12 @@ def main(*args):
         help='key to decrypt with',
         metavar='KEY'
     )
+    add_processing_arguments(decrypt_parser)
     encrypt_parser = subparsers.add_parser('encrypt')
     encrypt_parser.add_argument(
         'file_path',
         type=pathlib.Path,
-        help='file to encrypt',
+        help='file to encrypt in place or - to stream stdin to stdout',
         metavar='FILE'
     )
     encrypt_parser.add_argument(
@@ -44,14 +198,16 @@ def main(*args):
         help='key to encrypt with',
         metavar='KEY'
     )
+    add_processing_arguments(encrypt_parser)
     generate_parser = subparsers.add_parser('generate')
     generate_parser.add_argument(
         '-s',
         '--key-size',
         default=constants.DEFAULT_KEY_SIZE,
         type=int,
-        choices=constants.ALLOWED_KEY_SIZES,
-        help='size of key',
+        choices=sorted(
+            constants.ALLOWED_KEY_SIZES | constants.XTS_KEY_SIZES),
+        help='size of key, xts mode takes double size keys',
         metavar='SIZE'
     )
     generate_parser.add_argument(
@@ -64,8 +220,52 @@ def main(*args):
     if namespace.action == 'generate':
         actions.generate(namespace.key_file, namespace.key_size)
     else:
+        process(parser, namespace)
+
+
+def process(parser, namespace):
+    """Runs decrypt or encrypt action for parsed arguments."""
+    check_cipher_arguments(parser, namespace)
+
+    options = {
+        'chunk_size': namespace.chunk_size,
+        'scheme': namespace.scheme,
+        'mode': namespace.mode,
+        'iv': namespace.iv
+    }
+    if namespace.unit_size is not None:
+        options['unit_size'] = namespace.unit_size
+    output = namespace.file_path if namespace.atomic else namespace.output
+
+    # Unverified data of authenticated modes must not overwrite FILE.
+    authenticated = hasattr(modes.get(namespace.mode), 'TAG_SIZE')
+    if namespace.action == 'decrypt' and authenticated:
+        if namespace.mapped:
+            parser.error(f'{namespace.mode} mode does not decrypt with --mmap')
+        if output is None and namespace.file_path != STDIO:
+            output = namespace.file_path
+
+    if namespace.file_path == STDIO:
+        if namespace.mapped or namespace.jobs or output is not None:
+            parser.error('--mmap, --jobs, -o and --atomic require FILE, not -')
+
+        action = getattr(actions, f'{namespace.action}_stream')
+        action(
+            sys.stdin.buffer, sys.stdout.buffer, namespace.key_file, **options)
+    elif output is not None:
+        action = getattr(actions, f'{namespace.action}_to')
+        action(namespace.file_path, output, namespace.key_file, **options)
+    else:
+        if namespace.jobs is not None:
+            options['jobs'] = namespace.jobs
+
         action = getattr(actions, namespace.action)
-        action(namespace.file_path, namespace.key_file)
+        action(
+            namespace.file_path,
+            namespace.key_file,
+            mapped=namespace.mapped,
+            **options
+        )
 
 
 if __name__ == '__main__':
@@ -1,56 +1,428 @@
 """Main action functions."""
 
+import collections
+import functools
+import mmap
+import os
+import pathlib
 import secrets
+import shutil
+import tempfile
 
-import aes
 import padding
 
 from aes import constants
 from aes import errors
-from aes.key import Key
-from aes.state import State
+from aes import modes
+from aes.cipher import Cipher
+from aes.cipher import load_key
+from aes.modes import base as modes_base
+from aes.modes import xts
+from tool import parallel
 
+CIPHERTEXT_STEALING = 'cts'
+DEFAULT_CHUNK_SIZE = 1 << 20
+DEFAULT_MODE = 'ecb'
+SCHEMES = (*padding.SCHEMES, CIPHERTEXT_STEALING)
 
-def decrypt(file_path, key):
-    """Decrypts data with given key."""
-    key = Key.load(key)
+_BLOCK_SIZE = 4 * constants.NB
 
-    offset = 0
-    while True:
-        state = State.load(file_path, offset)
-        if state is None:
-            break
+_Stage = collections.namedtuple('_Stage', ('process', 'finish', 'reserve'))
 
-        aes.decrypt(state, key)
-        state.dump(file_path, offset)
 
-        offset += 4 * constants.NB
+def check_chunk_size(chunk_size):
+    """Checks chunk size holds whole blocks."""
+    if chunk_size <= 0 or chunk_size % _BLOCK_SIZE:
+        raise errors.ChunkSizeError()
 
-    padding.remove(file_path)
 
+def decrypt(
+        file_path,
+        key,
+        *,
+        chunk_size=DEFAULT_CHUNK_SIZE,
+        mapped=False,
+        jobs=None,
+        **options
+):
+    """Decrypts data with given key.
 
-def encrypt(file_path, key_file):
-    """Encrypts data with given key."""
-    padding.add(file_path, 4 * constants.NB)
+    Mapped mode processes memory-mapped file instead of reading it, jobs
+    process ranges of file in that many processes, see tool.parallel.
+    Authenticated modes always decrypt into temporary file replacing the
+    file after verification, so unverified data never overwrites it.
+    Options are padding scheme, mode and iv, see _stage().
+    """
+    check_chunk_size(chunk_size)
 
-    key = Key.load(key_file)
+    if jobs is not None:
+        _check_jobs(mapped)
+        parallel.process(
+            file_path, key, jobs=jobs, chunk_size=chunk_size, inverse=True,
+            **options)
+        return
 
-    offset = 0
-    while True:
-        state = State.load(file_path, offset)
-        if state is None:
-            break
+    stage = _stage(key, inverse=True, **options)
+    _check_units(os.stat(file_path).st_size, options)
 
-        aes.encrypt(state, key)
-        state.dump(file_path, offset)
+    if hasattr(modes.get(options.get('mode', DEFAULT_MODE)), 'TAG_SIZE'):
+        _process_to(file_path, file_path, stage, chunk_size)
+        return
 
-        offset += 4 * constants.NB
+    process = _process_mapped if mapped else _process
+    process(file_path, stage, chunk_size)
+
+
+def decrypt_stream(
+        source,
+        target,
+        key,
+        *,
+        chunk_size=DEFAULT_CHUNK_SIZE,
+        **options
+):
+    """Decrypts data read from source stream into target stream.
+
+    Options are padding scheme, mode and iv, see _stage().
+    """
+    check_chunk_size(chunk_size)
+
+    stage = _stage(key, inverse=True, **options)
+    _check_stream_units(source, options)
+
+    target.write(stage.finish(_stream(source, target, stage, chunk_size)))
+    target.flush()
+
+
+def decrypt_to(
+        file_path,
+        output_path,
+        key,
+        *,
+        chunk_size=DEFAULT_CHUNK_SIZE,
+        **options
+):
+    """Decrypts file into output replaced atomically.
+
+    Output may be the same file to decrypt it in place safely.
+    Options are padding scheme, mode and iv, see _stage().
+    """
+    check_chunk_size(chunk_size)
+
+    stage = _stage(key, inverse=True, **options)
+    _check_units(os.stat(file_path).st_size, options)
+
+    _process_to(file_path, output_path, stage, chunk_size)
+
+
+def encrypt(
+        file_path,
+        key_file,
+        *,
+        chunk_size=DEFAULT_CHUNK_SIZE,
+        mapped=False,
+        jobs=None,
+        **options
+):
+    """Encrypts data with given key.
+
+    Mapped mode processes memory-mapped file instead of reading it, jobs
+    process ranges of file in that many processes, see tool.parallel.
+    Options are padding scheme, mode and iv, see _stage().
+    """
+    check_chunk_size(chunk_size)
+
+    if jobs is not None:
+        _check_jobs(mapped)
+        parallel.process(
+            file_path, key_file, jobs=jobs, chunk_size=chunk_size, **options)
+        return
+
+    stage = _stage(key_file, **options)
+    _check_units(os.stat(file_path).st_size, options)
+
+    process = _process_mapped if mapped else _process
+    process(file_path, stage, chunk_size)
+
+
+def encrypt_stream(
+        source,
+        target,
+        key_file,
+        *,
+        chunk_size=DEFAULT_CHUNK_SIZE,
+        **options
+):
+    """Encrypts data read from source stream into target stream.
+
+    Options are padding scheme, mode and iv, see _stage().
+    """
+    check_chunk_size(chunk_size)
+
+    stage = _stage(key_file, **options)
+    _check_stream_units(source, options)
+
+    target.write(stage.finish(_stream(source, target, stage, chunk_size)))
+    target.flush()
+
+
+def encrypt_to(
+        file_path,
+        output_path,
+        key_file,
+        *,
+        chunk_size=DEFAULT_CHUNK_SIZE,
+        **options
+):
+    """Encrypts file into output replaced atomically.
+
+    Output may be the same file to encrypt it in place safely.
+    Options are padding scheme, mode and iv, see _stage().
+    """
+    check_chunk_size(chunk_size)
+
+    stage = _stage(key_file, **options)
+    _check_units(os.stat(file_path).st_size, options)
+
+    _process_to(file_path, output_path, stage, chunk_size)
 
 
 def generate(key_file, key_size):
     """Generates key for further usage."""
-    if key_size not in constants.ALLOWED_KEY_SIZES:
+    if key_size not in constants.ALLOWED_KEY_SIZES | constants.XTS_KEY_SIZES:
         raise errors.KeySizeError()
 
     with open(key_file, 'wb') as file:
         file.write(secrets.token_bytes(key_size >> 3))
+
+
+def _pad(tail, *, process, scheme):
+    """Pads and processes final partial block."""
+    padding.add(tail, _BLOCK_SIZE, scheme=scheme)
+
+    return process(tail)
+
+
+def _process(file_path, stage, chunk_size):
+    """Processes file in place by chunks of whole blocks."""
+    with open(file_path, 'rb') as source, open(file_path, 'rb+') as target:
+        target.write(stage.finish(_stream(source, target, stage, chunk_size)))
+        target.truncate()
+
+
+def _process_mapped(file_path, stage, chunk_size):
+    """Processes memory-mapped file in place by chunks of whole blocks."""
+    with open(file_path, 'rb+') as file:
+        size = _whole_blocks(os.fstat(file.fileno()).st_size, stage.reserve)
+
+        written = 0
+        if size:
+            with mmap.mmap(file.fileno(), size) as mapping:
+                with memoryview(mapping) as view:
+                    for offset in range(0, size, chunk_size):
+                        with view[offset:offset + chunk_size] as chunk:
+                            result = stage.process(chunk)
+
+                        # Output may lag behind data buffered by stage.
+                        view[written:written + len(result)] = result
+                        written += len(result)
+
+                mapping.flush()
+
+        file.seek(size)
+        tail = bytearray(file.read())
+        file.seek(written)
+        file.write(stage.finish(tail))
+        file.truncate()
+
+
+def _process_to(file_path, output_path, stage, chunk_size):
+    """Processes file into temporary file sequentially and replaces output.
+
+    Output is left untouched if processing fails.
+    """
+    output_path = pathlib.Path(output_path)
+    descriptor, temporary_path = tempfile.mkstemp(
+        prefix=f'.{output_path.name}.', dir=output_path.parent)
+
+    try:
+        with open(descriptor, 'wb') as target, open(file_path, 'rb') as source:
+            target.write(
+                stage.finish(_stream(source, target, stage, chunk_size)))
+            target.flush()
+            os.fsync(target.fileno())
+
+        shutil.copymode(file_path, temporary_path)
+        os.replace(temporary_path, output_path)
+    except BaseException:
+        os.unlink(temporary_path)
+        raise
+
+
+def _check_units(size, options):
+    """Checks data of size ends with XTS unit not shorter than block.
+
+    Otherwise processing would fail only at the end after writing output.
+    """
+    if options.get('mode') == 'xts':
+        xts.check_size(
+            size, options.get('unit_size', xts.DEFAULT_UNIT_SIZE))
+
+
+def _check_stream_units(source, options):
+    """Checks size of data left in seekable source, see _check_units()."""
+    if options.get('mode') == 'xts' and source.seekable():
+        position = source.tell()
+        size = source.seek(0, os.SEEK_END) - position
+        source.seek(position)
+        _check_units(size, options)
+
+
+def _check_jobs(mapped):
+    """Checks processing by jobs is not mixed with mapped file."""
+    if mapped:
+        raise ValueError('jobs do not process memory-mapped file')
+
+
+def _finish(tail, *, context):
+    """Processes final data and finalizes context."""
+    return context.update(tail) + context.finalize()
+
+
+def _open(tail, *, context):
+    """Processes final data and verifies authentication tag ending it."""
+    tag_size = context.tag_size
+    if len(tail) < tag_size:
+        raise errors.StateSizeError()
+
+    return context.update(tail[:-tag_size]) + context.finalize_with_tag(
+        bytes(tail[-tag_size:]))
+
+
+def _seal(tail, *, context):
+    """Processes final data and appends authentication tag."""
+    return _finish(tail, context=context) + context.tag
+
+
+def _stage(
+        key_file,
+        *,
+        inverse=False,
+        scheme=None,
+        mode=DEFAULT_MODE,
+        iv=None,
+        **options
+):
+    """Returns processing stage for key, padding scheme, mode and iv.
+
+    Other options are specific to the mode.
+    """
+    key = load_key(key_file, mode, cached=True)
+    cipher = Cipher(key, mode, iv, **options)
+    context = cipher.decryptor() if inverse else cipher.encryptor()
+
+    if not isinstance(context, modes_base.BlockContext):
+        if scheme is not None:
+            raise ValueError(f'{mode} mode does not use padding')
+
+        return _stage_context(context, inverse=inverse)
+
+    if scheme == CIPHERTEXT_STEALING and mode != 'ecb':
+        raise ValueError('ciphertext stealing requires ecb mode')
+
+    return _stage_blocks(context, scheme, inverse=inverse)
+
+
+def _stage_blocks(context, scheme, *, inverse=False):
+    """Returns processing stage for block mode context.
+
+    Tail of data is held back until its end to be padded or unpadded,
+    see padding.measure().
+    """
+    process = context.update
+
+    if scheme == CIPHERTEXT_STEALING:
+        finish = functools.partial(_steal, process=process)
+        return _Stage(process, finish, _BLOCK_SIZE)
+
+    scheme = scheme or padding.DEFAULT_SCHEME
+
+    if inverse:
+        finish = functools.partial(_unpad, process=process, scheme=scheme)
+        return _Stage(process, finish, 2 * _BLOCK_SIZE)
+
+    finish = functools.partial(_pad, process=process, scheme=scheme)
+    return _Stage(process, finish, 0)
+
+
+def _stage_context(context, *, inverse=False):
+    """Returns processing stage for stream or data unit mode context.
+
+    Context buffers data itself, tail is passed to it as is before
+    finalization; authenticated modes append tag to data and verify it
+    when decrypting.
+    """
+    process = context.update
+
+    if not hasattr(context, 'tag_size'):
+        finish = functools.partial(_finish, context=context)
+        return _Stage(process, finish, 0)
+
+    if inverse:
+        finish = functools.partial(_open, context=context)
+        return _Stage(process, finish, context.tag_size)
+
+    return _Stage(process, functools.partial(_seal, context=context), 0)
+
+
+def _steal(tail, *, process):
+    """Processes final blocks with ciphertext stealing.
+
+    Last partial block borrows the end of the previous processed block,
+    which is the same operation both ways.
+    """
+    stolen = len(tail) - _BLOCK_SIZE
+    if stolen < 0:
+        raise errors.StateSizeError()
+
+    if not stolen:
+        return process(tail)
+
+    last = process(tail[:_BLOCK_SIZE])
+
+    return process(tail[_BLOCK_SIZE:] + last[stolen:]) + last[:stolen]
+
+
+def _stream(source, target, stage, chunk_size):
+    """Streams whole blocks from source through stage into target.
+
+    Returns unprocessed tail which keeps at least reserved bytes.
+    """
+    tail = bytearray()
+
+    while chunk := source.read(chunk_size):
+        tail += chunk
+        size = _whole_blocks(len(tail), stage.reserve)
+        if size:
+            target.write(stage.process(tail[:size]))
+            del tail[:size]
+
+    return tail
+
+
+def _unpad(tail, *, process, scheme):
+    """Processes final blocks and removes padding."""
+    if not tail or len(tail) % _BLOCK_SIZE:
+        raise errors.StateSizeError()
+
+    tail = bytearray(process(tail))
+    padding.remove(tail, scheme=scheme, size=_BLOCK_SIZE)
+
+    return tail
+
+
+def _whole_blocks(size, reserve):
+    """Returns size of whole blocks to process leaving reserved bytes."""
+    size = max(size - reserve, 0)
+
+    return size - size % _BLOCK_SIZE
@@ -0,0 +1,163 @@
+"""Processing file in place by ranges in worker processes.
+
+Blocks of ECB and CTR modes do not depend on each other, so the file is
+split into block-aligned ranges, one for every worker, which reads,
+processes and writes back its range by chunks through its own handle.
+Key is expanded before the pool starts and passed to workers once.
+Padding is handled by the coordinating process without changing the
+file before workers finish: the padded last block is encrypted in memory
+and written after their ranges, padding of decrypted data is measured on
+the last blocks beforehand and truncated afterwards.
+"""
+
+import collections
+import pathlib
+
+from concurrent import futures
+
+import padding
+
+from aes import constants
+from aes import errors
+from aes.cipher import Cipher
+from aes.cipher import load_key
+
+MODES = ('ctr', 'ecb')
+
+_BLOCK_SIZE = 4 * constants.NB
+# Task of worker process set by pool initializer.
+_WORKER = {}
+
+_Task = collections.namedtuple(
+    '_Task', ('file_path', 'key', 'inverse', 'chunk_size', 'options'))
+
+
+def process(file_path, key_file, *, jobs, chunk_size, inverse=False,
+            **options):
+    """Processes file in place by jobs worker processes.
+
+    Options are padding scheme, bit one by default in ECB mode, mode and
+    iv, other options are specific to the mode.
+    """
+    if jobs < 1:
+        raise ValueError('jobs must be positive')
+
+    scheme = options.pop('scheme', None)
+    mode = options.setdefault('mode', 'ecb')
+    if mode not in MODES:
+        raise ValueError(f'{mode} mode does not support parallel processing')
+
+    if mode == 'ecb':
+        scheme = scheme or padding.DEFAULT_SCHEME
+    elif scheme is not None:
+        raise ValueError(f'{mode} mode does not use padding')
+
+    key = load_key(key_file, mode, cached=True)
+    # Checks padding scheme, iv and options before touching file.
+    Cipher(key, scheme=scheme, **options)
+
+    file_path = pathlib.Path(file_path)
+    size = end = file_path.stat().st_size
+    tail = b''
+    if scheme is not None and inverse:
+        end = _unpadded_size(file_path, size, Cipher(key, **options), scheme)
+    elif scheme is not None:
+        size, tail = _padded_tail(
+            file_path, size, Cipher(key, **options), scheme)
+
+    # Workers get the key with schedule expanded here once.
+    _ = key.decryption_schedule if inverse and mode == 'ecb' else key.schedule
+
+    task = _Task(file_path, key, inverse, chunk_size, options)
+    with futures.ProcessPoolExecutor(
+            jobs, initializer=_initialize, initargs=(task,)
+    ) as executor:
+        list(executor.map(_process, *_ranges(size, jobs)))
+
+    if scheme is not None:
+        with open(file_path, 'rb+') as file:
+            file.seek(size)
+            file.write(tail)
+            file.truncate(end if inverse else None)
+
+
+def _initialize(task):
+    """Keeps task in worker process."""
+    _WORKER['task'] = task
+
+
+def _padded_tail(file_path, size, cipher, scheme):
+    """Returns size of whole blocks and encrypted padded rest of file."""
+    size -= size % _BLOCK_SIZE
+    with open(file_path, 'rb') as file:
+        file.seek(size)
+        tail = bytearray(file.read())
+
+    padding.add(tail, _BLOCK_SIZE, scheme=scheme)
+
+    return size, cipher.encryptor().update(tail)
+
+
+def _process(offset, size):
+    """Processes range of file by chunks in worker process."""
+    task = _WORKER['task']
+    cipher = Cipher(task.key, **task.options)
+    context = cipher.decryptor() if task.inverse else cipher.encryptor()
+    if hasattr(context, 'seek'):
+        context.seek(offset)
+
+    buffer = bytearray(task.chunk_size)
+    with open(task.file_path, 'rb+', buffering=0) as file, \
+            memoryview(buffer) as view:
+        for position in range(offset, offset + size, task.chunk_size):
+            chunk_size = min(task.chunk_size, offset + size - position)
+            file.seek(position)
+            with view[:chunk_size] as chunk:
+                _read(file, chunk)
+                result = context.update(chunk)
+
+            file.seek(position)
+            _write(file, result)
+
+
+def _ranges(size, jobs):
+    """Returns offsets and sizes of block-aligned ranges for jobs."""
+    step = -(-size // (jobs * _BLOCK_SIZE)) * _BLOCK_SIZE
+    offsets = range(0, size, step or _BLOCK_SIZE)
+
+    return offsets, [min(step, size - offset) for offset in offsets]
+
+
+def _unpadded_size(file_path, size, cipher, scheme):
+    """Returns size of file without padding found in its last blocks."""
+    if not size or size % _BLOCK_SIZE:
+        raise errors.StateSizeError()
+
+    # Bit padding may take up to two blocks, see padding.measure().
+    with open(file_path, 'rb') as file:
+        file.seek(max(size - 2 * _BLOCK_SIZE, 0))
+        tail = cipher.decryptor().update(file.read())
+
+    return size - padding.measure(tail, scheme=scheme, size=_BLOCK_SIZE)
+
+
+def _read(file, buffer):
+    """Fills buffer from raw file which may read it by parts."""
+    read = 0
+    while read < len(buffer):
+        with buffer[read:] as rest:
+            count = file.readinto(rest)
+
+        if not count:
+            raise errors.StateSizeError()
+
+        read += count
+
+
+def _write(file, data):
+    """Writes all data to raw file which may write it by parts."""
+    with memoryview(data) as view:
+        written = 0
+        while written < len(view):
+            with view[written:] as rest:
+                written += file.write(rest)
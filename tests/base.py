@@ -5,6 +5,11 @@ import secrets
 import unittest
 
 from aes import constants
+from aes import engines
+from aes import errors
+from aes.block import Block
+from aes.engines import table
+from aes.key import Key
 
 
 class BaseTestCase(unittest.TestCase):
@@ -15,6 +20,104 @@ class BaseTestCase(unittest.TestCase):
         cls.offset = 0
         cls.size = 4 * constants.NB
         cls.tests = 200
+        # FIPS 197, Appendix C: key size -> (key, plaintext, ciphertext).
+        cls.vectors = {
+            128: (
+                bytes(range(16)),
+                bytes.fromhex('00112233445566778899aabbccddeeff'),
+                bytes.fromhex('69c4e0d86a7b0430d8cdb78070b4c55a')
+            ),
+            192: (
+                bytes(range(24)),
+                bytes.fromhex('00112233445566778899aabbccddeeff'),
+                bytes.fromhex('dda97ca4864cdfe06eaf70a0ec0d7191')
+            ),
+            256: (
+                bytes(range(32)),
+                bytes.fromhex('00112233445566778899aabbccddeeff'),
+                bytes.fromhex('8ea2b7ca516745bfeafc49904b496089')
+            )
+        }
+        # NIST SP 800-38A, Appendix F: mode -> (key, iv, plaintext,
+        # ciphertext).
+        plaintext = bytes.fromhex(
+            '6bc1bee22e409f96e93d7e117393172a'
+            'ae2d8a571e03ac9c9eb76fac45af8e51'
+            '30c81c46a35ce411e5fbc1191a0a52ef'
+            'f69f2445df4f9b17ad2b417be66c3710'
+        )
+        cls.mode_vectors = {
+            'cbc': (
+                bytes.fromhex('2b7e151628aed2a6abf7158809cf4f3c'),
+                bytes.fromhex('000102030405060708090a0b0c0d0e0f'),
+                plaintext,
+                bytes.fromhex(
+                    '7649abac8119b246cee98e9b12e9197d'
+                    '5086cb9b507219ee95db113a917678b2'
+                    '73bed6b8e3c1743b7116e69e22229516'
+                    '3ff1caa1681fac09120eca307586e1a7'
+                )
+            ),
+            'cfb': (
+                bytes.fromhex('2b7e151628aed2a6abf7158809cf4f3c'),
+                bytes.fromhex('000102030405060708090a0b0c0d0e0f'),
+                plaintext,
+                bytes.fromhex(
+                    '3b3fd92eb72dad20333449f8e83cfb4a'
+                    'c8a64537a0b3a93fcde3cdad9f1ce58b'
+                    '26751f67a3cbb140b1808cf187a4f4df'
+                    'c04b05357c5d1c0eeac4c66f9ff7f2e6'
+                )
+            ),
+            'ctr': (
+                bytes.fromhex('2b7e151628aed2a6abf7158809cf4f3c'),
+                bytes.fromhex('f0f1f2f3f4f5f6f7f8f9fafbfcfdfeff'),
+                plaintext,
+                bytes.fromhex(
+                    '874d6191b620e3261bef6864990db6ce'
+                    '9806f66b7970fdff8617187bb9fffdff'
+                    '5ae4df3edbd5d35e5b4f09020db03eab'
+                    '1e031dda2fbe03d1792170a0f3009cee'
+                )
+            ),
+            'ecb': (
+                bytes.fromhex('2b7e151628aed2a6abf7158809cf4f3c'),
+                None,
+                plaintext,
+                bytes.fromhex(
+                    '3ad77bb40d7a3660a89ecaf32466ef97'
+                    'f5d3d58503b9699de785895a96fdbaaf'
+                    '43b1cd7f598ece23881b00e3ed030688'
+                    '7b0c785e27e8ad3f8223207104725dd4'
+                )
+            ),
+            'ofb': (
+                bytes.fromhex('2b7e151628aed2a6abf7158809cf4f3c'),
+                bytes.fromhex('000102030405060708090a0b0c0d0e0f'),
+                plaintext,
+                bytes.fromhex(
+                    '3b3fd92eb72dad20333449f8e83cfb4a'
+                    '7789508d16918f03f53c52dac54ed825'
+                    '9740051e9c5fecf64344f7a82260edcc'
+                    '304c6528f659c77866a510d9c1d6ae5e'
+                )
+            )
+        }
+
+    def _assert_blocks_like_table(self, engine, data):
+        """Asserts engine processes blocks of data like T-table engine."""
+        for size in constants.ALLOWED_KEY_SIZES:
+            key = Key(self._generate_data(size >> 3))
+
+            with self.subTest(size=size):
+                self.assertEqual(
+                    table.decrypt_blocks(data, key),
+                    engine.decrypt_blocks(data, key)
+                )
+                self.assertEqual(
+                    table.encrypt_blocks(data, key),
+                    engine.encrypt_blocks(data, key)
+                )
 
     @staticmethod
     def _generate_data(size, *, urlsafe=False):
@@ -38,3 +141,69 @@ class BaseTestCase(unittest.TestCase):
     def _write_data(file_path, data):
         with open(file_path, 'wb') as file:
             file.write(data)
+
+
+class EnginesTestMixin:
+    """Checks shared by all engines, run over every available one.
+
+    Test case provides data of whole blocks.
+    """
+
+    def test_engines_decrypt(self):
+        """Tests decrypting Block and blocks of FIPS 197 vectors."""
+        for name, engine in engines.ENGINES.items():
+            for size, (key_data, plaintext, ciphertext) in (
+                    self.vectors.items()
+            ):
+                block = Block(ciphertext)
+
+                with self.subTest(engine=name, size=size):
+                    engine.decrypt(block, Key(key_data))
+
+                    self.assertEqual(plaintext, bytes(block))
+                    self.assertEqual(
+                        plaintext * 3,
+                        engine.decrypt_blocks(ciphertext * 3, Key(key_data))
+                    )
+
+    def test_engines_encrypt(self):
+        """Tests encrypting Block and blocks of FIPS 197 vectors."""
+        for name, engine in engines.ENGINES.items():
+            for size, (key_data, plaintext, ciphertext) in (
+                    self.vectors.items()
+            ):
+                block = Block(plaintext)
+
+                with self.subTest(engine=name, size=size):
+                    engine.encrypt(block, Key(key_data))
+
+                    self.assertEqual(ciphertext, bytes(block))
+                    self.assertEqual(
+                        ciphertext * 3,
+                        engine.encrypt_blocks(plaintext * 3, Key(key_data))
+                    )
+
+    def test_engines_blocks(self):
+        """Tests processing random blocks like the T-table engine."""
+        key = Key(self._generate_data(self.size))
+
+        for name, engine in engines.ENGINES.items():
+            with self.subTest(engine=name):
+                self._assert_blocks_like_table(engine, self.data)
+                self.assertEqual(
+                    self.data,
+                    engine.decrypt_blocks(
+                        engine.encrypt_blocks(memoryview(self.data), key),
+                        key
+                    )
+                )
+
+    def test_engines_blocks_not_allowed_size(self):
+        """Tests processing data of not whole blocks."""
+        key = Key(self._generate_data(self.size))
+
+        for name, engine in engines.ENGINES.items():
+            for process in (engine.decrypt_blocks, engine.encrypt_blocks):
+                with self.subTest(engine=name, process=process):
+                    self.assertRaises(
+                        errors.StateSizeError, process, self.data[1:], key)
@@ -1,11 +1,15 @@
 """Module for testing actions."""
 
+import io
 import pathlib
 import tempfile
 import unittest
 
 from aes import constants
 from aes import errors
+from aes import modes
+from aes.cipher import Cipher
+from aes.modes import xts
 from tool import actions
 
 import base
@@ -32,6 +36,175 @@ class TestActions(base.BaseTestCase):
 
                 self.assertEqual(data, self._read_data(self.file))
 
+    def test_decrypt_by_chunks(self):
+        """Tests decrypting file by chunks of different sizes."""
+        data = self._generate_data(1000)
+
+        for chunk_size in (16, 48, 1024, actions.DEFAULT_CHUNK_SIZE):
+            self._write_data(self.file, data)
+
+            with self.subTest(chunk_size=chunk_size):
+                actions.encrypt(self.file, self.key, chunk_size=chunk_size)
+                actions.decrypt(self.file, self.key, chunk_size=16)
+
+                self.assertEqual(data, self._read_data(self.file))
+
+    def test_decrypt_mapped(self):
+        """Tests decrypting memory-mapped file."""
+        for size in range(self.tests):
+            data = self._generate_data(size)
+            self._write_data(self.file, data)
+
+            with self.subTest(size=size):
+                actions.encrypt(self.file, self.key, mapped=True)
+                encrypted = self._read_data(self.file)
+                actions.decrypt(self.file, self.key, mapped=True)
+
+                self.assertEqual(data, self._read_data(self.file))
+
+                self._write_data(self.file, data)
+                actions.encrypt(self.file, self.key, chunk_size=16)
+
+                self.assertEqual(encrypted, self._read_data(self.file))
+
+    def test_decrypt_modes(self):
+        """Tests decrypting files and streams with modes of operation."""
+        for mode in ('cbc', 'cfb', 'ctr', 'gcm', 'ofb'):
+            iv = self._generate_data(modes.get(mode).IV_SIZE)
+
+            for size in range(0, self.tests, 5):
+                data = self._generate_data(size)
+                self._write_data(self.file, data)
+
+                with self.subTest(mode=mode, size=size):
+                    actions.encrypt(self.file, self.key, mode=mode, iv=iv)
+                    encrypted = self._read_data(self.file)
+
+                    source, target = io.BytesIO(data), io.BytesIO()
+                    actions.encrypt_stream(
+                        source, target, self.key, chunk_size=16, mode=mode,
+                        iv=iv)
+
+                    self.assertEqual(encrypted, target.getvalue())
+
+                    actions.decrypt(
+                        self.file, self.key, mapped=True, mode=mode, iv=iv)
+
+                    self.assertEqual(data, self._read_data(self.file))
+
+    def test_decrypt_jobs(self):
+        """Tests processing file by jobs like serially."""
+        data = self._generate_data(3 * (4 * constants.NB << 10) + 42)
+
+        for mode, iv in (('ctr', self._generate_data(16)), ('ecb', None)):
+            self._write_data(self.file, data)
+
+            with self.subTest(mode=mode):
+                actions.encrypt(
+                    self.file, self.key, chunk_size=1024, jobs=3, mode=mode,
+                    iv=iv)
+                encrypted = self._read_data(self.file)
+
+                actions.decrypt(self.file, self.key, mode=mode, iv=iv)
+                self.assertEqual(data, self._read_data(self.file))
+
+                actions.encrypt(self.file, self.key, mode=mode, iv=iv)
+                self.assertEqual(encrypted, self._read_data(self.file))
+
+                actions.decrypt(
+                    self.file, self.key, chunk_size=1024, jobs=3, mode=mode,
+                    iv=iv)
+                self.assertEqual(data, self._read_data(self.file))
+
+    def test_decrypt_units(self):
+        """Tests decrypting data units of file alone."""
+        unit_size = 4 * constants.NB << 5
+        data = self._generate_data(5 * unit_size + 42)
+        self._write_data(self.file, data)
+        actions.generate(self.key, max(constants.XTS_KEY_SIZES))
+        actions.encrypt(
+            self.file,
+            self.key,
+            mode='xts',
+            iv=xts.unit_tweak(0),
+            unit_size=unit_size
+        )
+        encrypted = self._read_data(self.file)
+
+        for unit, offset in enumerate(range(0, len(data), unit_size)):
+            decryptor = Cipher(
+                self.key, 'xts', xts.unit_tweak(unit), unit_size=unit_size
+            ).decryptor()
+            chunk = encrypted[offset:offset + unit_size]
+
+            with self.subTest(unit=unit):
+                self.assertEqual(
+                    data[offset:offset + unit_size],
+                    decryptor.update(chunk) + decryptor.finalize()
+                )
+
+    def test_decrypt_schemes(self):
+        """Tests decrypting files and streams with padding schemes."""
+        for scheme in actions.SCHEMES:
+            for size in range(4 * constants.NB, self.tests, 5):
+                data = self._generate_data(size)
+                self._write_data(self.file, data)
+
+                with self.subTest(scheme=scheme, size=size):
+                    actions.encrypt(self.file, self.key, scheme=scheme)
+                    encrypted = self._read_data(self.file)
+
+                    source, target = io.BytesIO(data), io.BytesIO()
+                    actions.encrypt_stream(
+                        source, target, self.key, chunk_size=16, scheme=scheme)
+
+                    self.assertEqual(encrypted, target.getvalue())
+
+                    actions.decrypt(
+                        self.file, self.key, mapped=True, scheme=scheme)
+
+                    self.assertEqual(data, self._read_data(self.file))
+
+    def test_decrypt_stream(self):
+        """Tests decrypting stream encrypted in place and back."""
+        for size in range(self.tests):
+            data = self._generate_data(size)
+            self._write_data(self.file, data)
+            actions.encrypt(self.file, self.key)
+            encrypted = self._read_data(self.file)
+
+            with self.subTest(size=size):
+                source, target = io.BytesIO(data), io.BytesIO()
+                actions.encrypt_stream(source, target, self.key, chunk_size=32)
+
+                self.assertEqual(encrypted, target.getvalue())
+
+                source, target = io.BytesIO(encrypted), io.BytesIO()
+                actions.decrypt_stream(source, target, self.key, chunk_size=16)
+
+                self.assertEqual(data, target.getvalue())
+
+    def test_decrypt_to(self):
+        """Tests decrypting file encrypted atomically in place."""
+        output = self.file.with_name(f'{self.file.name}.out')
+        self.addCleanup(output.unlink, missing_ok=True)
+
+        for size in range(0, self.tests, 9):
+            data = self._generate_data(size)
+            self._write_data(self.file, data)
+
+            with self.subTest(size=size):
+                actions.encrypt_to(self.file, self.file, self.key)
+                encrypted = self._read_data(self.file)
+                actions.decrypt_to(self.file, output, self.key)
+
+                self.assertEqual(data, self._read_data(output))
+
+                self._write_data(self.file, data)
+                actions.encrypt(self.file, self.key)
+
+                self.assertEqual(encrypted, self._read_data(self.file))
+
     def test_encrypt(self):
         """Tests encrypting file."""
         for size in range(self.tests):
@@ -0,0 +1,72 @@
+"""Module for testing asyncio streams encryption."""
+
+import asyncio
+import multiprocessing
+import unittest
+from concurrent import futures
+
+from aes import streams
+from aes.cipher import Cipher
+from aes.key import Key
+
+import base
+
+
+class TestStreams(base.BaseTestCase):
+    """Tests for asyncio streams encryption."""
+
+    def setUp(self):
+        self.key = Key(self._generate_data(16))
+        self.iv = self._generate_data(16)
+
+    async def _serve(self, executor, data, count):
+        """Returns data of count clients encrypted by loopback server."""
+        async def handle(reader, writer):
+            await streams.encrypt_stream(
+                reader, writer, self.key, executor=executor, mode='ctr',
+                iv=self.iv)
+            writer.close()
+            await writer.wait_closed()
+
+        async def request(port):
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+            writer.write(data)
+            writer.write_eof()
+            result = await reader.read()
+            writer.close()
+            await writer.wait_closed()
+
+            return result
+
+        server = await asyncio.start_server(handle, '127.0.0.1', 0)
+        async with server:
+            port = server.sockets[0].getsockname()[1]
+
+            return await asyncio.gather(
+                *(request(port) for _ in range(count)))
+
+    def test_loopback(self):
+        """Tests concurrent connections encrypted by process pool."""
+        data = self._generate_data(3 * streams.CHUNK_SIZE // 2)
+        expected = Cipher(self.key, 'ctr', self.iv).encryptor().update(data)
+
+        # Workers must not inherit open sockets, fork is not safe.
+        method = (
+            'forkserver'
+            if 'forkserver' in multiprocessing.get_all_start_methods()
+            else 'spawn'
+        )
+        context = multiprocessing.get_context(method)
+
+        with futures.ProcessPoolExecutor(
+                2, mp_context=context,
+                initializer=streams.initialize, initargs=(self.key,)
+        ) as executor:
+            results = asyncio.run(self._serve(executor, data, 4))
+
+        for result in results:
+            self.assertEqual(expected, result)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -8,6 +8,7 @@ import aes
 
 from aes import constants
 from aes import key
+from aes.block import Block
 from aes.state import State
 
 import base
@@ -20,6 +21,39 @@ class TestAES(base.BaseTestCase):
         self.state = State.load(
             bytearray(self._generate_data(self.size)), self.offset)
 
+    def test_decrypt_known_answer(self):
+        """Tests decrypting FIPS 197 vectors."""
+        for size, (key_data, plaintext, ciphertext) in self.vectors.items():
+            data = bytearray(ciphertext)
+            state = State.load(data, self.offset)
+
+            with self.subTest(size=size):
+                aes.decrypt(state, key.Key(key_data))
+                state.dump(data, self.offset)
+
+                self.assertEqual(plaintext, data)
+
+    def test_decrypt_block(self):
+        """Tests decrypting Block of FIPS 197 vectors without engine."""
+        for size, (key_data, plaintext, ciphertext) in self.vectors.items():
+            block = Block(ciphertext)
+
+            with self.subTest(size=size):
+                aes.decrypt(block, key.Key(key_data))
+
+                self.assertEqual(plaintext, bytes(block))
+
+    @mock.patch('aes.engines.get')
+    def test_decrypt_with_engine(self, get_mock):
+        """Tests decrypting State with chosen engine."""
+        key_ = key.Key(self._generate_data(self.size))
+
+        aes.decrypt(self.state, key_, engine='table')
+
+        get_mock.assert_called_once_with('table')
+        get_mock.return_value.decrypt.assert_called_once_with(
+            self.state, key_)
+
     @mock.patch('aes.steps.sub_bytes')
     @mock.patch('aes.steps.shift_rows')
     @mock.patch('aes.steps.mix_columns')
@@ -49,6 +83,39 @@ class TestAES(base.BaseTestCase):
                 self.assertEqual(rounds, shift_rows_mock.call_count)
                 self.assertEqual(rounds, sub_bytes_mock.call_count)
 
+    def test_encrypt_known_answer(self):
+        """Tests encrypting FIPS 197 vectors."""
+        for size, (key_data, plaintext, ciphertext) in self.vectors.items():
+            data = bytearray(plaintext)
+            state = State.load(data, self.offset)
+
+            with self.subTest(size=size):
+                aes.encrypt(state, key.Key(key_data))
+                state.dump(data, self.offset)
+
+                self.assertEqual(ciphertext, data)
+
+    def test_encrypt_block(self):
+        """Tests encrypting Block of FIPS 197 vectors without engine."""
+        for size, (key_data, plaintext, ciphertext) in self.vectors.items():
+            block = Block(plaintext)
+
+            with self.subTest(size=size):
+                aes.encrypt(block, key.Key(key_data))
+
+                self.assertEqual(ciphertext, bytes(block))
+
+    @mock.patch('aes.engines.get')
+    def test_encrypt_with_engine(self, get_mock):
+        """Tests encrypting State with chosen engine."""
+        key_ = key.Key(self._generate_data(self.size))
+
+        aes.encrypt(self.state, key_, engine='table')
+
+        get_mock.assert_called_once_with('table')
+        get_mock.return_value.encrypt.assert_called_once_with(
+            self.state, key_)
+
     @mock.patch('aes.steps.sub_bytes')
     @mock.patch('aes.steps.shift_rows')
     @mock.patch('aes.steps.mix_columns')
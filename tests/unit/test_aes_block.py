@@ -0,0 +1,147 @@
+"""Module for testing AES blocks."""
+
+import pathlib
+import unittest
+
+from unittest import mock
+
+from aes import block
+from aes import constants
+from aes import errors
+from aes import key
+
+import base
+
+
+class TestBlock(base.BaseTestCase):
+    """Tests for AES blocks."""
+
+    def setUp(self):
+        self.data = self._generate_data(self.size)
+        self.key = key.Key(
+            self._generate_data(constants.DEFAULT_KEY_SIZE >> 3))
+
+    def test_block_add_round_key(self):
+        """Tests adding round key with a single XOR."""
+        block_ = block.Block(self.data)
+        round_key = self.key.schedule.round_keys[2]
+
+        block_ ^= round_key
+
+        self.assertEqual(
+            int.from_bytes(self.data, 'big') ^ round_key, block_.value)
+
+    def test_block_allowed_size(self):
+        """Tests initializing Block of allowed size."""
+        block_ = block.Block(self.data)
+
+        self.assertEqual(self.data, bytes(block_))
+        self.assertFalse(hasattr(block_, '__dict__'))
+
+    def test_block_dump_to_bytes(self):
+        """Tests dumping Block to bytes."""
+        data = bytearray(self.data)
+        block_ = block.Block.load(data, self.offset)
+        block_ ^= self.key.schedule.round_keys[2]
+
+        block_.dump(data, self.offset)
+
+        self.assertEqual(bytes(block_), data)
+        self.assertNotEqual(bytearray(self.data), data)
+
+    def test_block_dump_to_file(self):
+        """Tests dumping Block to files."""
+        file_mock = mock.MagicMock(spec=pathlib.Path)
+        open_mock = mock.mock_open(file_mock, self.data)
+        file_handler_mock = open_mock.return_value
+
+        with mock.patch('builtins.open', open_mock):
+            block_ = block.Block.load(file_mock, self.offset)
+            block_ ^= self.key.schedule.round_keys[2]
+
+            block_.dump(file_mock, self.offset)
+
+        self.assertEqual(2, open_mock.call_count)
+        open_mock.assert_any_call(file_mock, 'rb')
+        open_mock.assert_any_call(file_mock, 'rb+')
+        self.assertEqual(2, file_handler_mock.seek.call_count)
+        file_handler_mock.seek.assert_any_call(self.offset)
+        file_handler_mock.read.assert_called_once_with(self.size)
+        file_handler_mock.write.assert_called_once_with(bytes(block_))
+
+    def test_block_dump_to_non_bytes(self):
+        """Tests dumping Block to non-bytes."""
+        block_ = block.Block(self.data)
+
+        self.assertRaises(NotImplementedError, block_.dump, 42, self.offset)
+
+    def test_block_load_after_bytes_end(self):
+        """Tests loading Block after the end of bytes."""
+        data = bytearray(self.data)
+
+        self.assertIsNone(block.Block.load(data, self.size))
+
+    def test_block_load_after_file_end(self):
+        """Tests loading Block after the end of file."""
+        file_mock = mock.MagicMock(spec=pathlib.Path)
+        open_mock = mock.mock_open(file_mock, b'')
+
+        with mock.patch('builtins.open', open_mock):
+            self.assertIsNone(block.Block.load(file_mock, self.offset))
+
+        open_mock.assert_called_once_with(file_mock, 'rb')
+
+    def test_block_load_from_bytes(self):
+        """Tests loading Block from bytes."""
+        data = bytearray(self.data)
+
+        self.assertEqual(
+            block.Block(data), block.Block.load(data, self.offset))
+
+    def test_block_load_from_file(self):
+        """Tests loading Block from file."""
+        file_mock = mock.MagicMock(spec=pathlib.Path)
+        open_mock = mock.mock_open(file_mock, self.data)
+        file_handler_mock = open_mock.return_value
+
+        with mock.patch('builtins.open', open_mock):
+            block_ = block.Block.load(file_mock, self.offset)
+
+        self.assertEqual(block.Block(self.data), block_)
+        open_mock.assert_called_once_with(file_mock, 'rb')
+        file_handler_mock.seek.assert_called_once_with(self.offset)
+        file_handler_mock.read.assert_called_once_with(self.size)
+
+    def test_block_load_from_non_bytes(self):
+        """Tests loading Block from non-bytes."""
+        self.assertRaises(
+            NotImplementedError, block.Block.load, 42, self.offset)
+
+    def test_block_not_allowed_sizes(self):
+        """Tests initializing Block of not allowed sizes."""
+        sizes = self._generate_sizes(
+            range(self.size << 1), self.tests, exclude={self.size})
+        for size in sizes:
+            data = self._generate_data(size)
+            with self.subTest(size=size):
+                self.assertRaises(errors.StateSizeError, block.Block, data)
+
+    def test_block_words(self):
+        """Tests getting and setting Block columns."""
+        block_ = block.Block(self.data)
+        words = block_.words
+
+        block_.words = words
+
+        self.assertEqual(
+            tuple(
+                int.from_bytes(self.data[idx:idx + 4], 'big')
+                for idx in range(0, self.size, 4)
+            ),
+            words
+        )
+        self.assertEqual(self.data, bytes(block_))
+
+
+if __name__ == '__main__':
+    unittest.main()
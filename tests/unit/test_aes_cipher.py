@@ -0,0 +1,107 @@
+"""Module for testing AES incremental cipher."""
+
+import pickle
+import unittest
+
+import padding
+
+from aes import constants
+from aes import engines
+from aes import errors
+from aes import modes
+from aes.cipher import Cipher
+from aes.key import Key
+
+import base
+
+
+class TestAESCipher(base.BaseTestCase):
+    """Tests for AES incremental cipher."""
+
+    def test_cipher(self):
+        """Tests encrypting and decrypting with every engine and key."""
+        data = self._generate_data(self.tests)
+
+        for name in engines.ENGINES:
+            for size in constants.ALLOWED_KEY_SIZES:
+                key = Key(self._generate_data(size >> 3))
+                cipher = Cipher(key, engine=name, scheme=padding.PKCS7)
+
+                with self.subTest(engine=name, size=size):
+                    encryptor = cipher.encryptor()
+                    encrypted = encryptor.update(data) + encryptor.finalize()
+                    decryptor = cipher.decryptor()
+                    decrypted = (
+                        decryptor.update(encrypted) + decryptor.finalize())
+
+                    self.assertEqual(data, decrypted)
+
+    def test_cipher_key_data(self):
+        """Tests creating cipher from key data."""
+        key, iv, plaintext, ciphertext = self.mode_vectors['ecb']
+        encryptor = Cipher(key, 'ecb', iv).encryptor()
+
+        self.assertEqual(
+            ciphertext, encryptor.update(plaintext) + encryptor.finalize())
+
+    def test_cipher_mode_key(self):
+        """Tests creating cipher from key data of mode with own keys."""
+        data = self._generate_data(self.tests)
+        cipher = Cipher(self._generate_data(64), 'xts', bytes(16))
+        encryptor, decryptor = cipher.encryptor(), cipher.decryptor()
+        encrypted = encryptor.update(data) + encryptor.finalize()
+
+        self.assertEqual(
+            data, decryptor.update(encrypted) + decryptor.finalize())
+        self.assertRaises(
+            errors.KeySizeError, Cipher, self._generate_data(16), 'xts')
+
+    def test_cipher_options(self):
+        """Tests creating cipher with options of mode."""
+        key, iv, plaintext, ciphertext = self.mode_vectors['ctr']
+        cipher = Cipher(key, 'ctr', iv, counter_size=4)
+
+        self.assertEqual(ciphertext, cipher.encryptor().update(plaintext))
+        self.assertEqual(plaintext, cipher.decryptor().update(ciphertext))
+
+    def test_cipher_pickle(self):
+        """Tests continuing pickled contexts of every mode."""
+        data = self._generate_data(self.tests)
+
+        for mode in sorted(modes.MODES):
+            iv = self._generate_data(modes.get(mode).IV_SIZE or 0) or None
+            key = self._generate_data(32)
+            cipher = Cipher(key, mode, iv, scheme=(
+                padding.BIT if mode in ('cbc', 'ecb') else None))
+            encryptor = cipher.encryptor()
+            expected = encryptor.update(data + data) + encryptor.finalize()
+
+            with self.subTest(mode=mode):
+                encryptor = cipher.encryptor()
+                result = encryptor.update(data)
+                encryptor = pickle.loads(pickle.dumps(encryptor))
+                result += encryptor.update(data) + encryptor.finalize()
+
+                self.assertEqual(expected, result)
+
+    def test_cipher_unknown(self):
+        """Tests creating cipher with unknown mode, engine or padding."""
+        key = self._generate_data(16)
+
+        self.assertRaises(errors.ModeError, Cipher, key, 'unknown')
+        self.assertRaises(errors.EngineError, Cipher, key, engine='unknown')
+        self.assertRaises(ValueError, Cipher, key, scheme='unknown')
+
+    def test_cipher_wrong_iv(self):
+        """Tests creating cipher with initialization vector not needed."""
+        self.assertRaises(
+            errors.IVSizeError,
+            Cipher,
+            self._generate_data(16),
+            'ecb',
+            self._generate_data(16)
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
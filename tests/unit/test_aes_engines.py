@@ -0,0 +1,47 @@
+"""Module for testing AES engines registry."""
+
+import importlib
+import sys
+import unittest
+
+from unittest import mock
+
+from aes import engines
+from aes import errors
+
+import base
+
+
+class TestAESEngines(base.EnginesTestMixin, base.BaseTestCase):
+    """Tests for AES engines registry and checks shared by engines."""
+
+    def setUp(self):
+        self.data = self._generate_data(self.size * self.tests)
+
+    def test_get(self):
+        """Tests getting engines by name."""
+        for name, engine in engines.ENGINES.items():
+            with self.subTest(name=name):
+                self.assertIs(engine, engines.get(name))
+
+    def test_get_default(self):
+        """Tests getting the fastest available engine."""
+        self.assertIn(engines.get(), engines.ENGINES.values())
+
+    def test_engines_missing_dependencies(self):
+        """Tests skipping engine which dependencies are missing."""
+        self.addCleanup(importlib.reload, engines)
+
+        with mock.patch.dict(sys.modules, {'aes.engines.vector': None}):
+            importlib.reload(engines)
+
+        self.assertNotIn('vector', engines.ENGINES)
+        self.assertIn('table', engines.ENGINES)
+
+    def test_get_unknown(self):
+        """Tests getting unknown engine."""
+        self.assertRaises(errors.EngineError, engines.get, 'unknown')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+"""Module for testing AES engines adapters."""
+
+import unittest
+
+from aes.block import Block
+from aes.engines import adapters
+from aes.state import State
+
+import base
+
+
+class TestAESEnginesAdapters(base.BaseTestCase):
+    """Tests for AES engines adapters."""
+
+    def setUp(self):
+        self.data = self._generate_data(self.size)
+        self.key = object()
+        self.function = adapters.from_blocks(self._reverse)
+
+    @staticmethod
+    def _reverse(data, _):
+        return bytes(data)[::-1]
+
+    def test_from_blocks_block(self):
+        """Tests acting over Block."""
+        block = Block(self.data)
+
+        self.function(block, self.key)
+
+        self.assertEqual(self.data[::-1], bytes(block))
+
+    def test_from_blocks_not_state(self):
+        """Tests acting over not a state."""
+        self.assertRaises(
+            NotImplementedError, self.function, self.data, self.key)
+
+    def test_from_blocks_state(self):
+        """Tests acting over State."""
+        data = bytearray(self.size)
+        state = State(self.data)
+
+        self.function(state, self.key)
+        state.dump(data, self.offset)
+
+        self.assertEqual(self.data[::-1], data)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,22 @@
+"""Module for testing AES bitsliced engine."""
+
+import unittest
+
+from aes.engines import bitslice
+
+import base
+
+
+class TestAESEnginesBitslice(base.BaseTestCase):
+    """Tests for AES bitsliced engine, see also base.EnginesTestMixin."""
+
+    def test_blocks_groups(self):
+        """Tests processing a whole group and a partial one."""
+        self._assert_blocks_like_table(
+            bitslice,
+            self._generate_data(self.size * (bitslice.GROUP_BLOCKS + 3))
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,29 @@
+"""Module for testing AES SWAR engine."""
+
+import unittest
+
+from aes.engines import swar
+
+import base
+
+
+class TestAESEnginesSWAR(base.BaseTestCase):
+    """Tests for AES SWAR engine, see also base.EnginesTestMixin."""
+
+    def test_blocks_few(self):
+        """Tests processing less blocks than a lane holds."""
+        for blocks in range(4):
+            with self.subTest(blocks=blocks):
+                self._assert_blocks_like_table(
+                    swar, self._generate_data(blocks * self.size))
+
+    def test_blocks_lanes(self):
+        """Tests processing two whole lanes and a partial one."""
+        self._assert_blocks_like_table(
+            swar,
+            self._generate_data(self.size * (2 * swar.LANE_BLOCKS + 3))
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+"""Module for testing AES T-table engine."""
+
+import unittest
+
+import aes
+
+from aes import constants
+from aes.engines import table
+from aes.key import Key
+from aes.state import State
+
+import base
+
+
+class TestAESEnginesTable(base.BaseTestCase):
+    """Tests for AES T-table engine, see also base.EnginesTestMixin."""
+
+    def setUp(self):
+        self.data = self._generate_data(self.size * self.tests)
+
+    def test_decrypt(self):
+        """Tests decrypting State like the step-by-step cipher."""
+        for size in constants.ALLOWED_KEY_SIZES:
+            key = Key(self._generate_data(size >> 3))
+            expected, actual = bytearray(self.size), bytearray(self.size)
+            reference_state = State.load(bytearray(self.data), self.offset)
+            state = State.load(bytearray(self.data), self.offset)
+
+            with self.subTest(size=size):
+                aes.decrypt(reference_state, key)
+                table.decrypt(state, key)
+                reference_state.dump(expected, self.offset)
+                state.dump(actual, self.offset)
+
+                self.assertEqual(expected, actual)
+
+    def test_decrypt_not_state(self):
+        """Tests decrypting not a state."""
+        key = Key(self._generate_data(self.size))
+
+        self.assertRaises(NotImplementedError, table.decrypt, self.data, key)
+
+    def test_encrypt(self):
+        """Tests encrypting State like the step-by-step cipher."""
+        for size in constants.ALLOWED_KEY_SIZES:
+            key = Key(self._generate_data(size >> 3))
+            expected, actual = bytearray(self.size), bytearray(self.size)
+            reference_state = State.load(bytearray(self.data), self.offset)
+            state = State.load(bytearray(self.data), self.offset)
+
+            with self.subTest(size=size):
+                aes.encrypt(reference_state, key)
+                table.encrypt(state, key)
+                reference_state.dump(expected, self.offset)
+                state.dump(actual, self.offset)
+
+                self.assertEqual(expected, actual)
+
+    def test_encrypt_not_state(self):
+        """Tests encrypting not a state."""
+        key = Key(self._generate_data(self.size))
+
+        self.assertRaises(NotImplementedError, table.encrypt, self.data, key)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+"""Module for testing GHASH function."""
+
+import unittest
+
+from unittest import mock
+
+from aes import ghash
+
+import base
+
+_R = 0xE1 << 120
+
+
+class TestAESGHash(base.BaseTestCase):
+    """Tests for GHASH function."""
+
+    def setUp(self):
+        # GCM specification, test case 2.
+        self.subkey = bytes.fromhex('66e94bd4ef8a2c3b884cfa59ca342b2e')
+        self.ciphertext = bytes.fromhex('0388dace60b6a392f328c2b971b2fe78')
+        self.lengths = bytes.fromhex('00000000000000000000000000000080')
+        self.digest = 0xf38cbb1ad69223dcc3457ae5b6b0f885
+
+    def test_ghash(self):
+        """Tests hashing data by pieces."""
+        data = self.ciphertext + self.lengths
+
+        for size in range(1, len(data) + 1):
+            ghash_ = ghash.GHash(ghash.Tables(self.subkey))
+
+            with self.subTest(size=size):
+                for offset in range(0, len(data), size):
+                    ghash_.update(data[offset:offset + size])
+
+                self.assertEqual(self.digest, ghash_.value)
+
+    def test_ghash_pad(self):
+        """Tests padding partial block with zeros."""
+        ghash_ = ghash.GHash(ghash.Tables(self.subkey))
+        ghash_.update(self.ciphertext[:7])
+        ghash_.pad()
+        ghash_.pad()
+
+        expected = ghash.GHash(ghash.Tables(self.subkey))
+        expected.update(self.ciphertext[:7] + bytes(9))
+
+        self.assertEqual(expected.value, ghash_.value)
+
+    def test_tables_multiply(self):
+        """Tests multiplying by tables as bit by bit."""
+        for _ in range(self.tests):
+            subkey = self._generate_data(16)
+            tables = ghash.Tables(subkey)
+            value = int.from_bytes(self._generate_data(16), 'big')
+
+            with self.subTest(subkey=subkey, value=value):
+                self.assertEqual(
+                    _multiply(value, int.from_bytes(subkey, 'big')),
+                    tables.multiply(value)
+                )
+
+    def test_tables_zeroize(self):
+        """Tests zeroizing tables."""
+        tables = ghash.Tables(self.subkey)
+        tables.zeroize()
+
+        self.assertEqual(0, tables.multiply((1 << 128) - 1))
+
+    def test_tables_zeroize_unused(self):
+        """Tests tables zeroize themselves when no one holds them."""
+        tables = ghash.Tables(self.subkey)
+        with mock.patch.object(ghash.Tables, 'zeroize') as zeroize_mock:
+            del tables
+
+        zeroize_mock.assert_called_once_with()
+
+
+def _multiply(value, subkey):
+    """Multiplies in GF(2^128) bit by bit (SP 800-38D, 6.3)."""
+    product = 0
+    for bit in range(127, -1, -1):
+        if value >> bit & 1:
+            product ^= subkey
+
+        subkey = subkey >> 1 ^ (_R if subkey & 1 else 0)
+
+    return product
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,13 +1,16 @@
 """Module for testing AES keys."""
 
 import pathlib
+import pickle
 import unittest
 
 from unittest import mock
 
 from aes import constants
+from aes import engines
 from aes import errors
 from aes import key
+from aes import utils
 
 import base
 
@@ -28,6 +31,183 @@ class TestAESKey(base.BaseTestCase):
                 self.assertEqual(data, key_.data)
                 self.assertIsInstance(key_.schedule, key.KeySchedule)
 
+    def test_key_cache_clear(self):
+        """Tests clearing KeyCache drops keys and resets counters."""
+        cache = key.KeyCache()
+        data = cache.get(self.vectors[128][0]).schedule.data
+        cache.get(self.vectors[128][0])
+
+        cache.clear()
+
+        self.assertEqual(0, len(cache))
+        self.assertEqual((0, 0), (cache.hits, cache.misses))
+        self.assertEqual(bytes(len(data)), data)
+
+    def test_key_cache_eviction(self):
+        """Tests KeyCache drops least recently used keys."""
+        cache = key.KeyCache(size=2)
+        first, second, third = (
+            self.vectors[size][0] for size in sorted(self.vectors))
+
+        held = cache.get(first)
+        expected = bytes(held.schedule.data)
+        data = cache.get(second).decryption_schedule.data
+        cache.get(third)
+        cache.get(first)
+
+        self.assertEqual(2, len(cache))
+        self.assertEqual((0, 4), (cache.hits, cache.misses))
+        # Schedule of key nobody holds wipes itself, held key is intact.
+        self.assertEqual(bytes(len(data)), data)
+        self.assertEqual(expected, held.schedule.data)
+        self.assertIsNot(held, cache.get(first))
+
+        cache.size = 1
+
+        self.assertEqual(1, cache.size)
+        self.assertEqual(1, len(cache))
+        self.assertIs(cache.get(first), cache.get(first))
+        self.assertEqual((3, 4), (cache.hits, cache.misses))
+
+        cache.size = 0
+
+        self.assertEqual(0, len(cache))
+
+    def test_key_cache_negative_size(self):
+        """Tests KeyCache rejects negative size."""
+        self.assertRaises(ValueError, key.KeyCache, size=-1)
+
+        cache = key.KeyCache(size=1)
+        cache.get(self.vectors[128][0])
+
+        with self.assertRaises(ValueError):
+            cache.size = -1
+
+        self.assertEqual(1, cache.size)
+        self.assertEqual(1, len(cache))
+
+    def test_key_decryption_schedule(self):
+        """Tests key schedule of the equivalent inverse cipher."""
+        for size in constants.ALLOWED_KEY_SIZES:
+            key_ = key.Key(self._generate_data(size >> 3))
+            rounds = constants.ROUNDS[size]
+            schedule = key_.decryption_schedule
+
+            with self.subTest(size=size):
+                self.assertIs(schedule, key_.decryption_schedule)
+                self.assertEqual(
+                    key_.schedule.round_keys[0], schedule.round_keys[0])
+                self.assertEqual(
+                    key_.schedule.round_keys[rounds],
+                    schedule.round_keys[rounds]
+                )
+                for idx in range(4, 4 * rounds):
+                    column = list(key_.schedule.words[idx].to_bytes(4, 'big'))
+                    self.assertEqual(
+                        utils.galois_mul(column, inverse=True),
+                        list(schedule.words[idx].to_bytes(4, 'big'))
+                    )
+
+    def test_key_schedule_last_words(self):
+        """Tests expanding FIPS 197 keys."""
+        expected = {128: 0x4D2B30C5, 192: 0xE3A41D5D, 256: 0x6D68DE36}
+
+        for size, (key_data, _, _) in self.vectors.items():
+            schedule = key.Key(key_data).schedule
+
+            with self.subTest(size=size):
+                self.assertEqual(
+                    4 * (constants.ROUNDS[size] + 1), len(schedule.words))
+                self.assertEqual(expected[size], schedule.words[-1])
+                self.assertEqual(
+                    constants.ROUNDS[size] + 1, len(schedule.round_keys))
+                self.assertEqual(
+                    expected[size], schedule.round_keys[-1] & 0xFFFFFFFF)
+
+    def test_key_schedule_layout(self):
+        """Tests KeySchedule round keys views over flat data."""
+        for size in constants.ALLOWED_KEY_SIZES:
+            key_ = key.Key(self.vectors[size][0])
+            schedule = key_.schedule
+            rounds = constants.ROUNDS[size]
+
+            with self.subTest(size=size):
+                self.assertEqual(rounds + 1, len(schedule))
+                self.assertEqual(16 * (rounds + 1), len(schedule.data))
+                self.assertEqual(key_.data, schedule.data[:len(key_.data)])
+                self.assertTrue(schedule[rounds].readonly)
+                self.assertFalse(hasattr(schedule, '__dict__'))
+
+                for current_round, round_key in enumerate(schedule):
+                    self.assertEqual(
+                        schedule.data[16 * current_round:][:16], round_key)
+
+    def test_key_schedule_pickle(self):
+        """Tests pickling key with expanded schedule and its views."""
+        key_ = key.Key(self.vectors[128][0])
+        self.assertEqual(16, len(key_.schedule[0]))
+
+        restored = pickle.loads(pickle.dumps(key_))
+
+        self.assertEqual(key_.data, restored.data)
+        self.assertEqual(key_.schedule.words, restored.schedule.words)
+        self.assertEqual(key_.schedule[10], restored.schedule[10])
+
+    def test_key_pickle_hash_tables(self):
+        """Tests pickling key without its hash tables."""
+        key_ = key.Key(self.vectors[128][0])
+        tables = key_.hash_tables(engines.get())
+
+        self.assertLess(len(pickle.dumps(key_)), 1024)
+        self.assertIs(tables, key_.hash_tables(engines.get()))
+
+    def test_key_hash(self):
+        """Tests equal keys have equal hashes."""
+        data = self._generate_data(16)
+
+        self.assertEqual(hash(key.Key(data)), hash(key.Key(data)))
+        self.assertEqual(1, len({key.Key(data), key.Key(data)}))
+        self.assertEqual(
+            hash(key.Key(data)), hash(key.Key(bytearray(data))))
+
+    def test_key_hash_tables(self):
+        """Tests GHASH tables are built once per engine and zeroized."""
+        key_ = key.Key(bytes(16))
+        # Hash subkey for zero key (GCM specification, test case 1).
+        subkey = int.from_bytes(
+            bytes.fromhex('66e94bd4ef8a2c3b884cfa59ca342b2e'), 'big')
+
+        for name, engine in engines.ENGINES.items():
+            engine = mock.Mock(wraps=engine, __name__=engine.__name__)
+
+            with self.subTest(engine=name):
+                tables = key_.hash_tables(engine)
+
+                self.assertIs(tables, key_.hash_tables(engine))
+                self.assertEqual(subkey, tables.multiply(1 << 127))
+                engine.encrypt_blocks.assert_called_once_with(
+                    bytes(16), key_)
+
+        key_.zeroize()
+
+        self.assertEqual(0, tables.multiply(1 << 127))
+        self.assertIsNot(tables, key_.hash_tables(engines.get()))
+
+    def test_key_load_cached(self):
+        """Tests loading Key through the process-wide cache."""
+        with mock.patch('aes.key.CACHE', key.KeyCache()) as cache:
+            for size in constants.ALLOWED_KEY_SIZES:
+                data = self._generate_data(size >> 3)
+
+                with self.subTest(size=size):
+                    key_ = key.Key.load(data, cached=True)
+
+                    self.assertIs(key_, key.Key.load(data, cached=True))
+                    self.assertIsNot(key_, key.Key.load(data))
+
+            self.assertEqual(len(constants.ALLOWED_KEY_SIZES), cache.hits)
+            self.assertEqual(len(constants.ALLOWED_KEY_SIZES), cache.misses)
+
     def test_key_load_from_bytes(self):
         """Tests loading Key from bytes."""
         for size in constants.ALLOWED_KEY_SIZES:
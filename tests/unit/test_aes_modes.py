@@ -0,0 +1,69 @@
+"""Module for testing AES modes of operation registry."""
+
+import unittest
+
+from unittest import mock
+
+from aes import engines
+from aes import errors
+from aes import modes
+from aes.key import Key
+
+import base
+
+
+class TestAESModes(base.BaseTestCase):
+    """Tests for AES modes of operation registry."""
+
+    def test_feedback_modes(self):
+        """Tests CFB and OFB on NIST SP 800-38A vectors by pieces."""
+        for name in ('cfb', 'ofb'):
+            mode = modes.get(name)
+            key, iv, plaintext, ciphertext = self.mode_vectors[name]
+
+            for size in range(1, len(plaintext) + 1):
+                encryptor = mode.Encryptor(Key(key), iv, engines.get())
+                decryptor = mode.Decryptor(Key(key), iv, engines.get())
+                offsets = range(0, len(plaintext), size)
+
+                with self.subTest(mode=name, size=size):
+                    self.assertEqual(ciphertext, b''.join(
+                        encryptor.update(plaintext[offset:offset + size])
+                        for offset in offsets
+                    ) + encryptor.finalize())
+                    self.assertEqual(plaintext, b''.join(
+                        decryptor.update(ciphertext[offset:offset + size])
+                        for offset in offsets
+                    ) + decryptor.finalize())
+
+    def test_feedback_modes_engines(self):
+        """Tests CFB and OFB encrypt block by block through every engine."""
+        for name in ('cfb', 'ofb'):
+            mode = modes.get(name)
+            key, iv, plaintext, ciphertext = self.mode_vectors[name]
+
+            for engine_name, engine in engines.ENGINES.items():
+                engine = mock.Mock(wraps=engine)
+                encryptor = mode.Encryptor(Key(key), iv, engine)
+
+                with self.subTest(mode=name, engine=engine_name):
+                    self.assertEqual(
+                        ciphertext,
+                        encryptor.update(plaintext[:-1])
+                        + encryptor.update(plaintext[-1:])
+                    )
+                    engine.encrypt_blocks.assert_not_called()
+
+    def test_get(self):
+        """Tests getting modes by name."""
+        for name, mode in modes.MODES.items():
+            with self.subTest(name=name):
+                self.assertIs(mode, modes.get(name))
+
+    def test_get_unknown(self):
+        """Tests getting unknown mode."""
+        self.assertRaises(errors.ModeError, modes.get, 'unknown')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+"""Module for testing AES base cipher contexts."""
+
+import unittest
+
+from aes import engines
+from aes.key import Key
+from aes.modes import base as modes_base
+
+import base
+
+
+class TestAESModesBase(base.BaseTestCase):
+    """Tests for AES base cipher contexts."""
+
+    def setUp(self):
+        self.key = Key(self._generate_data(16))
+        self.engine = engines.get()
+
+    def test_context_not_implemented(self):
+        """Tests contexts without processing."""
+        contexts = (
+            modes_base.Context(self.key, None, self.engine),
+            modes_base.BlockContext(self.key, None, self.engine),
+            modes_base.StreamContext(self.key, None, self.engine)
+        )
+        for context in contexts:
+            with self.subTest(context=type(context)):
+                self.assertRaises(
+                    NotImplementedError, context.update, bytes(self.size))
+
+        self.assertRaises(NotImplementedError, contexts[0].finalize)
+
+    def test_stream_context_padding(self):
+        """Tests stream context with padding scheme."""
+        self.assertRaises(
+            ValueError,
+            modes_base.StreamContext,
+            self.key,
+            None,
+            self.engine,
+            scheme='pkcs7'
+        )
+
+    def test_stream_context_small_buffer(self):
+        """Tests stream context processing into too small buffer."""
+        context = modes_base.StreamContext(self.key, None, self.engine)
+
+        self.assertRaises(
+            ValueError, context.update_into, b'data', bytearray(3))
+
+    def test_xor(self):
+        """Tests XORing data with keystream."""
+        for size in range(self.tests):
+            data = self._generate_data(size)
+            keystream = self._generate_data(size)
+
+            with self.subTest(size=size):
+                self.assertEqual(
+                    bytes(map(int.__xor__, data, keystream)),
+                    modes_base.xor(data, keystream)
+                )
+
+
+if __name__ == '__main__':
+    unittest.main()
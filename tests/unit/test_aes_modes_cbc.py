@@ -0,0 +1,95 @@
+"""Module for testing AES cipher block chaining mode."""
+
+import unittest
+
+from unittest import mock
+
+import padding
+
+from aes import engines
+from aes.key import Key
+from aes.modes import cbc
+
+import base
+
+
+class TestAESModesCBC(base.BaseTestCase):
+    """Tests for AES cipher block chaining mode."""
+
+    def setUp(self):
+        key, self.iv, self.plaintext, self.ciphertext = (
+            self.mode_vectors['cbc'])
+        self.key = Key(key)
+        self.engine = engines.get()
+
+    def test_decrypt(self):
+        """Tests decrypting NIST SP 800-38A vectors by pieces."""
+        for size in range(1, len(self.ciphertext) + 1):
+            decryptor = cbc.Decryptor(self.key, self.iv, self.engine)
+
+            with self.subTest(size=size):
+                result = b''.join(
+                    decryptor.update(self.ciphertext[offset:offset + size])
+                    for offset in range(0, len(self.ciphertext), size)
+                )
+
+                self.assertEqual(self.plaintext, result + decryptor.finalize())
+
+    def test_decrypt_buffer_reused(self):
+        """Tests chaining does not refer to data changed afterwards."""
+        decryptor = cbc.Decryptor(self.key, self.iv, self.engine)
+        data = bytearray(self.ciphertext[:self.size])
+        result = decryptor.update(data)
+        data[:] = self.ciphertext[self.size:2 * self.size]
+        result += decryptor.update(data)
+
+        self.assertEqual(self.plaintext[:2 * self.size], result)
+
+    def test_encrypt(self):
+        """Tests encrypting NIST SP 800-38A vectors by pieces."""
+        for size in range(1, len(self.plaintext) + 1):
+            encryptor = cbc.Encryptor(self.key, self.iv, self.engine)
+
+            with self.subTest(size=size):
+                result = b''.join(
+                    encryptor.update(self.plaintext[offset:offset + size])
+                    for offset in range(0, len(self.plaintext), size)
+                )
+
+                self.assertEqual(
+                    self.ciphertext, result + encryptor.finalize())
+
+    def test_encrypt_engines(self):
+        """Tests encrypting block by block through every engine."""
+        for name, engine in engines.ENGINES.items():
+            engine = mock.Mock(wraps=engine)
+            encryptor = cbc.Encryptor(self.key, self.iv, engine)
+
+            with self.subTest(engine=name):
+                self.assertEqual(
+                    self.ciphertext, encryptor.update(self.plaintext))
+                engine.encrypt_blocks.assert_not_called()
+
+    def test_padding(self):
+        """Tests encrypting and decrypting with padding schemes."""
+        for scheme in padding.SCHEMES:
+            for size in range(0, self.tests, 3):
+                data = self._generate_data(size)
+                encryptor = cbc.Encryptor(
+                    self.key, self.iv, self.engine, scheme=scheme)
+                decryptor = cbc.Decryptor(
+                    self.key, self.iv, self.engine, scheme=scheme)
+
+                with self.subTest(scheme=scheme, size=size):
+                    encrypted = encryptor.update(data) + encryptor.finalize()
+                    decrypted = b''.join(
+                        decryptor.update(encrypted[offset:offset + 7])
+                        for offset in range(0, len(encrypted), 7)
+                    )
+
+                    self.assertFalse(len(encrypted) % self.size)
+                    self.assertEqual(data, decrypted + decryptor.finalize())
+
+
+if __name__ == '__main__':
+    unittest.main()
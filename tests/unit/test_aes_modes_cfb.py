@@ -0,0 +1,47 @@
+"""Module for testing AES cipher feedback mode."""
+
+import unittest
+
+from unittest import mock
+
+from aes import engines
+from aes.key import Key
+from aes.modes import cfb
+
+import base
+
+
+class TestAESModesCFB(base.BaseTestCase):
+    """Tests for AES cipher feedback mode, see also test_aes_modes."""
+
+    def setUp(self):
+        key, self.iv, self.plaintext, self.ciphertext = (
+            self.mode_vectors['cfb'])
+        self.key = Key(key)
+        self.engine = mock.Mock(wraps=engines.get())
+
+    def test_decrypt_batched(self):
+        """Tests decrypting whole blocks of update by one engine call."""
+        decryptor = cfb.Decryptor(self.key, self.iv, self.engine)
+        half = len(self.ciphertext) // 2
+
+        for count, offset in enumerate((0, half), 1):
+            chunk = self.ciphertext[offset:offset + half]
+
+            with self.subTest(offset=offset):
+                self.assertEqual(
+                    self.plaintext[offset:offset + half],
+                    decryptor.update(chunk)
+                )
+                self.assertEqual(
+                    count, self.engine.encrypt_blocks.call_count)
+                self.assertEqual(
+                    (self.iv + self.ciphertext)[offset:offset + half],
+                    self.engine.encrypt_blocks.call_args.args[0]
+                )
+
+        self.engine.encrypt.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,121 @@
+"""Module for testing AES counter mode."""
+
+import unittest
+
+from aes import engines
+from aes.key import Key
+from aes.modes import ctr
+
+import base
+
+
+class TestAESModesCTR(base.BaseTestCase):
+    """Tests for AES counter mode."""
+
+    def setUp(self):
+        key, self.iv, self.plaintext, self.ciphertext = (
+            self.mode_vectors['ctr'])
+        self.key = Key(key)
+        self.engine = engines.get()
+
+    def test_counter_sizes(self):
+        """Tests counter wrapping inside its size only."""
+        iv = bytes(range(15)) + b'\xff'
+        blocks = [
+            bytes(range(15)) + b'\xff',
+            bytes(range(15)) + b'\x00',
+            bytes(range(14)) + b'\x0f\x00'
+        ]
+
+        for counter_size, expected in ((1, blocks[1]), (2, blocks[2])):
+            encryptor = ctr.Encryptor(
+                self.key, iv, self.engine, counter_size=counter_size)
+
+            with self.subTest(counter_size=counter_size):
+                keystream = encryptor.update(bytes(2 * self.size))
+
+                self.assertEqual(
+                    self.engine.encrypt_blocks(blocks[0] + expected, self.key),
+                    keystream
+                )
+
+    def test_counter_exhausted(self):
+        """Tests running out of counter values."""
+        encryptor = ctr.Encryptor(
+            self.key, self.iv, self.engine, counter_size=1)
+        encryptor.update(bytes(255 * self.size))
+
+        self.assertRaises(
+            OverflowError, encryptor.update, bytes(self.size + 1))
+        self.assertEqual(
+            self.size, len(encryptor.update(bytes(self.size))))
+        self.assertRaises(OverflowError, encryptor.update, b'\x00')
+
+    def test_decrypt(self):
+        """Tests decrypting NIST SP 800-38A vectors by pieces."""
+        for size in range(1, len(self.ciphertext) + 1):
+            decryptor = ctr.Decryptor(self.key, self.iv, self.engine)
+
+            with self.subTest(size=size):
+                result = b''.join(
+                    decryptor.update(self.ciphertext[offset:offset + size])
+                    for offset in range(0, len(self.ciphertext), size)
+                )
+
+                self.assertEqual(self.plaintext, result + decryptor.finalize())
+                self.assertEqual(len(self.ciphertext), decryptor.position)
+
+    def test_encrypt(self):
+        """Tests encrypting NIST SP 800-38A vectors by pieces."""
+        for size in range(1, len(self.plaintext) + 1):
+            encryptor = ctr.Encryptor(self.key, self.iv, self.engine)
+
+            with self.subTest(size=size):
+                result = b''.join(
+                    encryptor.update(self.plaintext[offset:offset + size])
+                    for offset in range(0, len(self.plaintext), size)
+                )
+
+                self.assertEqual(
+                    self.ciphertext, result + encryptor.finalize())
+
+    def test_seek(self):
+        """Tests random access to keystream."""
+        decryptor = ctr.Decryptor(self.key, self.iv, self.engine)
+
+        for start in range(len(self.ciphertext)):
+            for stop in range(start, len(self.ciphertext) + 1, 7):
+                with self.subTest(start=start, stop=stop):
+                    decryptor.seek(start)
+
+                    self.assertEqual(
+                        self.plaintext[start:stop],
+                        decryptor.update(self.ciphertext[start:stop])
+                    )
+                    self.assertEqual(stop, decryptor.position)
+
+    def test_seek_out_of_range(self):
+        """Tests seeking outside of counter range."""
+        decryptor = ctr.Decryptor(
+            self.key, self.iv, self.engine, counter_size=1)
+
+        for position in (-1, 256 * self.size + 1):
+            with self.subTest(position=position):
+                self.assertRaises(ValueError, decryptor.seek, position)
+
+    def test_wrong_counter_size(self):
+        """Tests creating context with wrong counter sizes."""
+        for counter_size in (0, self.size + 1):
+            with self.subTest(counter_size=counter_size):
+                self.assertRaises(
+                    ValueError,
+                    ctr.Encryptor,
+                    self.key,
+                    self.iv,
+                    self.engine,
+                    counter_size=counter_size
+                )
+
+
+if __name__ == '__main__':
+    unittest.main()
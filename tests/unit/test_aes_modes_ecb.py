@@ -0,0 +1,140 @@
+"""Module for testing AES electronic codebook mode."""
+
+import unittest
+
+import padding
+
+from aes import engines
+from aes import errors
+from aes.key import Key
+from aes.modes import ecb
+
+import base
+
+
+class TestAESModesECB(base.BaseTestCase):
+    """Tests for AES electronic codebook mode."""
+
+    def setUp(self):
+        self.key, _, self.plaintext, self.ciphertext = (
+            self.mode_vectors['ecb'])
+        self.key = Key(self.key)
+        self.engine = engines.get()
+
+    def test_decrypt(self):
+        """Tests decrypting NIST SP 800-38A vectors by pieces."""
+        for size in range(1, len(self.ciphertext) + 1):
+            decryptor = ecb.Decryptor(self.key, None, self.engine)
+
+            with self.subTest(size=size):
+                result = b''.join(
+                    decryptor.update(self.ciphertext[offset:offset + size])
+                    for offset in range(0, len(self.ciphertext), size)
+                )
+
+                self.assertEqual(self.plaintext, result + decryptor.finalize())
+
+    def test_encrypt(self):
+        """Tests encrypting NIST SP 800-38A vectors by pieces."""
+        for size in range(1, len(self.plaintext) + 1):
+            encryptor = ecb.Encryptor(self.key, None, self.engine)
+
+            with self.subTest(size=size):
+                result = b''.join(
+                    encryptor.update(self.plaintext[offset:offset + size])
+                    for offset in range(0, len(self.plaintext), size)
+                )
+
+                self.assertEqual(
+                    self.ciphertext, result + encryptor.finalize())
+
+    def test_encrypt_not_whole_blocks(self):
+        """Tests finalizing encryption of not whole blocks."""
+        encryptor = ecb.Encryptor(self.key, None, self.engine)
+        encryptor.update(self.plaintext[:-1])
+
+        self.assertRaises(errors.StateSizeError, encryptor.finalize)
+
+    def test_finalized(self):
+        """Tests using finalized contexts."""
+        for context in (ecb.Decryptor, ecb.Encryptor):
+            context = context(self.key, None, self.engine)
+            context.finalize()
+
+            with self.subTest(context=type(context)):
+                self.assertRaises(errors.FinalizedError, context.finalize)
+                self.assertRaises(errors.FinalizedError, context.update, b'')
+                self.assertRaises(
+                    errors.FinalizedError,
+                    context.update_into,
+                    b'',
+                    bytearray()
+                )
+
+    def test_padding(self):
+        """Tests encrypting and decrypting with padding schemes."""
+        for scheme in padding.SCHEMES:
+            for size in range(0, self.tests, 3):
+                data = self._generate_data(size)
+                encryptor = ecb.Encryptor(
+                    self.key, None, self.engine, scheme=scheme)
+                decryptor = ecb.Decryptor(
+                    self.key, None, self.engine, scheme=scheme)
+
+                with self.subTest(scheme=scheme, size=size):
+                    encrypted = encryptor.update(data) + encryptor.finalize()
+                    decrypted = b''.join(
+                        decryptor.update(encrypted[offset:offset + 7])
+                        for offset in range(0, len(encrypted), 7)
+                    )
+
+                    self.assertFalse(len(encrypted) % self.size)
+                    self.assertEqual(data, decrypted + decryptor.finalize())
+
+    def test_padding_over_block(self):
+        """Tests decrypting PKCS#7 padding longer than block."""
+        count = 2 * self.size
+        encryptor = ecb.Encryptor(self.key, None, self.engine)
+        decryptor = ecb.Decryptor(
+            self.key, None, self.engine, scheme=padding.PKCS7)
+        decryptor.update(encryptor.update(bytes((count,)) * count))
+
+        self.assertRaises(padding.PaddingError, decryptor.finalize)
+
+    def test_padding_not_whole_blocks(self):
+        """Tests finalizing decryption of not whole padded blocks."""
+        for data in (b'', self.ciphertext[:-1]):
+            decryptor = ecb.Decryptor(
+                self.key, None, self.engine, scheme=padding.PKCS7)
+            decryptor.update(data)
+
+            with self.subTest(size=len(data)):
+                self.assertRaises(errors.StateSizeError, decryptor.finalize)
+
+    def test_update_into(self):
+        """Tests encrypting into reused buffer."""
+        encryptor = ecb.Encryptor(self.key, None, self.engine)
+        buffer = bytearray(len(self.plaintext) + self.size - 1)
+        result = bytearray()
+
+        for offset in range(0, len(self.plaintext), 24):
+            chunk = memoryview(self.plaintext)[offset:offset + 24]
+            written = encryptor.update_into(chunk, buffer)
+            result += buffer[:written]
+
+        self.assertEqual(self.ciphertext, result + encryptor.finalize())
+
+    def test_update_into_small_buffer(self):
+        """Tests processing into too small buffer."""
+        encryptor = ecb.Encryptor(self.key, None, self.engine)
+
+        self.assertRaises(
+            ValueError,
+            encryptor.update_into,
+            self.plaintext,
+            bytearray(len(self.plaintext) - 1)
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,170 @@
+"""Module for testing AES Galois/counter mode."""
+
+import unittest
+
+from aes import engines
+from aes import errors
+from aes.key import Key
+from aes.modes import gcm
+
+import base
+
+
+class TestAESModesGCM(base.BaseTestCase):
+    """Tests for AES Galois/counter mode."""
+
+    def setUp(self):
+        # GCM specification, test case 4.
+        self.key = Key(bytes.fromhex('feffe9928665731c6d6a8f9467308308'))
+        self.iv = bytes.fromhex('cafebabefacedbaddecaf888')
+        self.aad = bytes.fromhex('feedfacedeadbeeffeedfacedeadbeefabaddad2')
+        self.plaintext = bytes.fromhex(
+            'd9313225f88406e5a55909c5aff5269a'
+            '86a7a9531534f7da2e4c303d8a318a72'
+            '1c3c0c95956809532fcf0e2449a6b525'
+            'b16aedf5aa0de657ba637b39'
+        )
+        self.ciphertext = bytes.fromhex(
+            '42831ec2217774244b7221b784d0d49c'
+            'e3aa212f2c02a4e035c17e2329aca12e'
+            '21d514b25466931c7d8f6a5aac84aa05'
+            '1ba30b396a0aac973d58e091'
+        )
+        self.tag = bytes.fromhex('5bc94fbc3221a5db94fae95ae7121a47')
+        self.engine = engines.get()
+
+    def _decrypt(self, aad, ciphertext, tag, **options):
+        """Returns decrypted data verified with tag."""
+        decryptor = gcm.Decryptor(self.key, self.iv, self.engine, **options)
+        decryptor.authenticate_additional_data(aad)
+
+        return decryptor.update(ciphertext) + decryptor.finalize_with_tag(tag)
+
+    def test_additional_data_after_data(self):
+        """Tests authenticating additional data after data."""
+        encryptor = gcm.Encryptor(self.key, self.iv, self.engine)
+        encryptor.update(b'')
+        encryptor.authenticate_additional_data(self.aad)
+        encryptor.update(self.plaintext)
+
+        self.assertRaises(
+            ValueError, encryptor.authenticate_additional_data, self.aad)
+
+        encryptor.finalize()
+
+        self.assertRaises(
+            errors.FinalizedError,
+            encryptor.authenticate_additional_data,
+            self.aad
+        )
+
+    def test_decrypt(self):
+        """Tests decrypting and verifying by pieces."""
+        for size in range(1, len(self.ciphertext) + 1):
+            decryptor = gcm.Decryptor(self.key, self.iv, self.engine)
+
+            with self.subTest(size=size):
+                for offset in range(0, len(self.aad), size):
+                    decryptor.authenticate_additional_data(
+                        self.aad[offset:offset + size])
+
+                result = b''.join(
+                    decryptor.update(self.ciphertext[offset:offset + size])
+                    for offset in range(0, len(self.ciphertext), size)
+                )
+                result += decryptor.finalize_with_tag(self.tag)
+
+                self.assertEqual(self.plaintext, result)
+
+    def test_decrypt_no_tag(self):
+        """Tests finalizing decryption without tag."""
+        decryptor = gcm.Decryptor(self.key, self.iv, self.engine)
+        decryptor.authenticate_additional_data(self.aad)
+        result = decryptor.update(self.ciphertext)
+
+        self.assertRaises(ValueError, decryptor.finalize)
+        self.assertFalse(decryptor.finalized)
+
+        result += decryptor.finalize_with_tag(self.tag)
+
+        self.assertEqual(self.plaintext, result)
+        self.assertRaises(errors.FinalizedError, decryptor.finalize)
+
+    def test_decrypt_tampered(self):
+        """Tests decrypting tampered data, additional data or tag."""
+        tampered = tuple(
+            bytes((data[0] ^ 1,)) + data[1:]
+            for data in (self.aad, self.ciphertext, self.tag)
+        )
+        cases = (
+            (tampered[0], self.ciphertext, self.tag),
+            (self.aad, tampered[1], self.tag),
+            (self.aad, self.ciphertext, tampered[2]),
+            (self.aad, self.ciphertext, self.tag[:-1]),
+            (b'', self.ciphertext, self.tag)
+        )
+
+        for case in cases:
+            with self.subTest(case=case):
+                self.assertRaises(
+                    errors.AuthenticationError, self._decrypt, *case)
+
+    def test_encrypt(self):
+        """Tests encrypting and authenticating by pieces."""
+        for size in range(1, len(self.plaintext) + 1):
+            encryptor = gcm.Encryptor(self.key, self.iv, self.engine)
+
+            with self.subTest(size=size):
+                for offset in range(0, len(self.aad), size):
+                    encryptor.authenticate_additional_data(
+                        self.aad[offset:offset + size])
+
+                self.assertIsNone(encryptor.tag)
+
+                result = b''.join(
+                    encryptor.update(self.plaintext[offset:offset + size])
+                    for offset in range(0, len(self.plaintext), size)
+                )
+
+                self.assertEqual(
+                    self.ciphertext, result + encryptor.finalize())
+                self.assertEqual(self.tag, encryptor.tag)
+
+    def test_tag_size(self):
+        """Tests truncated tags."""
+        for tag_size in range(gcm.MIN_TAG_SIZE, gcm.TAG_SIZE + 1):
+            encryptor = gcm.Encryptor(
+                self.key, self.iv, self.engine, tag_size=tag_size)
+            encryptor.authenticate_additional_data(self.aad)
+            encryptor.update(self.plaintext)
+            encryptor.finalize()
+
+            with self.subTest(tag_size=tag_size):
+                self.assertEqual(tag_size, encryptor.tag_size)
+                self.assertEqual(self.tag[:tag_size], encryptor.tag)
+                self.assertEqual(
+                    self.plaintext,
+                    self._decrypt(
+                        self.aad,
+                        self.ciphertext,
+                        encryptor.tag,
+                        tag_size=tag_size
+                    )
+                )
+
+    def test_wrong_tag_size(self):
+        """Tests creating context with wrong tag sizes."""
+        for tag_size in (gcm.MIN_TAG_SIZE - 1, gcm.TAG_SIZE + 1):
+            with self.subTest(tag_size=tag_size):
+                self.assertRaises(
+                    ValueError,
+                    gcm.Encryptor,
+                    self.key,
+                    self.iv,
+                    self.engine,
+                    tag_size=tag_size
+                )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,48 @@
+"""Module for testing AES output feedback mode."""
+
+import unittest
+
+from unittest import mock
+
+from aes import engines
+from aes.key import Key
+from aes.modes import base as modes_base
+from aes.modes import ofb
+
+import base
+
+
+class TestAESModesOFB(base.BaseTestCase):
+    """Tests for AES output feedback mode, see also test_aes_modes."""
+
+    def setUp(self):
+        key, self.iv, self.plaintext, self.ciphertext = (
+            self.mode_vectors['ofb'])
+        self.key = Key(key)
+        self.engine = engines.get()
+
+    def test_keystream_before_xor(self):
+        """Tests keystream of update is produced before one XOR."""
+        calls = []
+        xor = modes_base.xor
+        engine = mock.Mock(wraps=self.engine)
+        engine.encrypt.side_effect = lambda block, key: calls.append(
+            'encrypt') or self.engine.encrypt(block, key)
+        encryptor = ofb.Encryptor(self.key, self.iv, engine)
+
+        with mock.patch(
+                'aes.modes.base.xor',
+                side_effect=lambda data, keystream: calls.append(
+                    'xor') or xor(data, keystream)
+        ):
+            result = encryptor.update(self.plaintext[:40])
+            result += encryptor.update(self.plaintext[40:])
+
+        self.assertEqual(self.ciphertext, result)
+        # Third block is partly used by the first update.
+        self.assertEqual(
+            ['encrypt'] * 3 + ['xor'] + ['encrypt'] + ['xor'], calls)
+
+
+if __name__ == '__main__':
+    unittest.main()
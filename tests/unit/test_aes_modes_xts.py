@@ -0,0 +1,198 @@
+"""Module for testing AES XTS mode."""
+
+import pathlib
+import tempfile
+import unittest
+
+from aes import engines
+from aes import errors
+from aes.key import Key
+from aes.modes import xts
+
+import base
+
+
+class TestAESModesXTS(base.BaseTestCase):
+    """Tests for AES XTS mode."""
+
+    def setUp(self):
+        self.engine = engines.get()
+        # IEEE 1619, Annex B: vector 1 and vectors 15-18 with stealing.
+        self.vectors = (
+            (
+                bytes(32),
+                0,
+                bytes(32),
+                bytes.fromhex(
+                    '917cf69ebd68b2ec9b9fe9a3eadda692'
+                    'cd43d2f59598ed858c02c2652fbf922e'
+                )
+            ),
+            *(
+                (
+                    bytes.fromhex(
+                        'fffefdfcfbfaf9f8f7f6f5f4f3f2f1f0'
+                        'bfbebdbcbbbab9b8b7b6b5b4b3b2b1b0'
+                    ),
+                    0x123456789a,
+                    bytes(range(len(ciphertext))),
+                    ciphertext
+                )
+                for ciphertext in map(bytes.fromhex, (
+                    '6c1625db4671522d3d7599601de7ca09ed',
+                    'd069444b7a7e0cab09e24447d24deb1fedbf',
+                    'e5df1351c0544ba1350b3363cd8ef4beedbf9d',
+                    '9d84c813f719aa2c7be3f66171c7c5c2edbf9dac'
+                ))
+            )
+        )
+
+    def test_decrypt(self):
+        """Tests decrypting IEEE 1619 vectors by pieces."""
+        for key, unit, plaintext, ciphertext in self.vectors:
+            for size in range(1, len(ciphertext) + 1):
+                decryptor = xts.Decryptor(
+                    xts.load_key(key), xts.unit_tweak(unit), self.engine)
+
+                with self.subTest(size=size, length=len(ciphertext)):
+                    result = b''.join(
+                        decryptor.update(ciphertext[offset:offset + size])
+                        for offset in range(0, len(ciphertext), size)
+                    )
+
+                    self.assertEqual(plaintext, result + decryptor.finalize())
+
+    def test_encrypt(self):
+        """Tests encrypting IEEE 1619 vectors by pieces."""
+        for key, unit, plaintext, ciphertext in self.vectors:
+            for size in range(1, len(plaintext) + 1):
+                encryptor = xts.Encryptor(
+                    xts.load_key(key), xts.unit_tweak(unit), self.engine)
+
+                with self.subTest(size=size, length=len(plaintext)):
+                    result = b''.join(
+                        encryptor.update(plaintext[offset:offset + size])
+                        for offset in range(0, len(plaintext), size)
+                    )
+
+                    self.assertEqual(
+                        ciphertext, result + encryptor.finalize())
+
+    def test_check_size(self):
+        """Tests checking size of data ending with partial unit."""
+        for size in (0, 16, 31, 32, 48, 63, 64, 80):
+            with self.subTest(size=size):
+                xts.check_size(size, unit_size=32)
+
+        for size in (1, 15, 33, 47, 65):
+            with self.subTest(size=size):
+                self.assertRaises(
+                    errors.StateSizeError, xts.check_size, size, 32)
+
+        self.assertRaises(
+            errors.StateSizeError, xts.check_size, xts.DEFAULT_UNIT_SIZE + 1)
+
+    def test_encrypt_short(self):
+        """Tests finalizing encryption of partial unit shorter than block."""
+        encryptor = xts.Encryptor(
+            xts.load_key(bytes(32)),
+            xts.unit_tweak(0),
+            self.engine,
+            unit_size=self.size
+        )
+        encryptor.update(bytes(self.size + 1))
+
+        self.assertRaises(errors.StateSizeError, encryptor.finalize)
+
+    def test_units(self):
+        """Tests processing units independently."""
+        keys = xts.load_key(self._generate_data(64))
+        data = self._generate_data(5 * self.size)
+        encryptor = xts.Encryptor(
+            keys, xts.unit_tweak(7), self.engine, unit_size=2 * self.size)
+        encrypted = encryptor.update(data)
+
+        self.assertEqual(4 * self.size, len(encrypted))
+        self.assertEqual(9, encryptor.unit)
+
+        encrypted += encryptor.finalize()
+
+        unit_size = 2 * self.size
+        for unit, offset in enumerate(range(0, len(data), unit_size), 7):
+            decryptor = xts.Decryptor(
+                keys, xts.unit_tweak(unit), self.engine, unit_size=unit_size)
+            chunk = encrypted[offset:offset + unit_size]
+
+            with self.subTest(unit=unit):
+                self.assertEqual(
+                    data[offset:offset + unit_size],
+                    decryptor.update(chunk) + decryptor.finalize()
+                )
+
+    def test_update_into_small_buffer(self):
+        """Tests processing into too small buffer."""
+        encryptor = xts.Encryptor(
+            xts.load_key(bytes(32)),
+            xts.unit_tweak(0),
+            self.engine,
+            unit_size=self.size
+        )
+
+        self.assertEqual(2 * self.size - 1, encryptor.output_size(self.size))
+        self.assertRaises(
+            ValueError,
+            encryptor.update_into,
+            bytes(self.size),
+            bytearray(self.size - 1)
+        )
+
+    def test_load_key(self):
+        """Tests loading pairs of keys."""
+        data = self._generate_data(64)
+        keys = xts.Keys(Key(data[:32]), Key(data[32:]))
+
+        with tempfile.TemporaryDirectory() as directory:
+            key_file = pathlib.Path(directory, 'key')
+            self._write_data(key_file, data)
+
+            for key in (data, key_file, keys):
+                with self.subTest(key=key):
+                    self.assertEqual(keys, xts.load_key(key))
+
+        self.assertEqual(
+            xts.Keys(Key(data[:16]), Key(data[16:32])),
+            xts.load_key(Key(data[:32]))
+        )
+
+    def test_load_key_wrong(self):
+        """Tests loading pairs of keys of wrong sizes or types."""
+        for size in (16, 24, 48, 63):
+            with self.subTest(size=size):
+                self.assertRaises(
+                    errors.KeySizeError, xts.load_key, bytes(size))
+
+        self.assertRaises(NotImplementedError, xts.load_key, 'key')
+
+    def test_wrong_options(self):
+        """Tests creating context with padding or wrong unit sizes."""
+        keys = xts.load_key(bytes(32))
+        cases = (
+            {'scheme': 'pkcs7'},
+            {'unit_size': 0},
+            {'unit_size': self.size + 1}
+        )
+
+        for options in cases:
+            with self.subTest(options=options):
+                self.assertRaises(
+                    ValueError,
+                    xts.Encryptor,
+                    keys,
+                    xts.unit_tweak(0),
+                    self.engine,
+                    **options
+                )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,7 @@
 """Module for testing AES states."""
 
+import array
+import mmap
 import pathlib
 import unittest
 
@@ -37,6 +39,30 @@ class TestState(base.BaseTestCase):
 
         self.assertNotEqual(bytearray(self.data), data)
 
+    def test_state_dump_into_buffers(self):
+        """Tests dumping State into writable buffers at offsets."""
+        state_ = state.State(self.data)
+
+        for buffer in self._generate_buffers(3 * self.size):
+            for offset in (0, 3, self.size):
+                with self.subTest(buffer=type(buffer), offset=offset):
+                    state_.dump_into(buffer, offset)
+
+                    self.assertEqual(
+                        self.data,
+                        memoryview(buffer).cast('B')[offset:offset + 16]
+                    )
+
+    def test_state_dump_to_buffers(self):
+        """Tests dumping State to dispatched buffers."""
+        state_ = state.State(self.data)
+
+        for buffer in self._generate_buffers(self.size)[:3]:
+            with self.subTest(buffer=type(buffer)):
+                state_.dump(buffer, self.offset)
+
+                self.assertEqual(self.data, bytes(buffer))
+
     def test_state_dump_to_file(self):
         """Tests dumping State to files."""
         file_mock = mock.MagicMock(spec=pathlib.Path)
@@ -94,6 +120,30 @@ class TestState(base.BaseTestCase):
         self.assertEqual(
             state.State(data), state.State.load(data, self.offset))
 
+    def test_state_load_from_buffers(self):
+        """Tests loading State from buffers at offsets."""
+        data = self._generate_data(3 * self.size)
+
+        buffers = self._generate_buffers(len(data))
+        for buffer in buffers:
+            memoryview(buffer).cast('B')[:] = data
+
+        for buffer in (data, *buffers):
+            for offset in (0, 3, self.size):
+                expected = state.State(data[offset:offset + 16])
+
+                with self.subTest(buffer=type(buffer), offset=offset):
+                    self.assertEqual(
+                        expected, state.State.load_from_buffer(buffer, offset))
+
+                    if not isinstance(buffer, array.array):
+                        self.assertEqual(
+                            expected, state.State.load(buffer, offset))
+
+            with self.subTest(buffer=type(buffer)):
+                self.assertIsNone(
+                    state.State.load_from_buffer(buffer, len(data)))
+
     def test_state_load_from_file(self):
         """Tests loading State from file."""
         file_mock = mock.MagicMock(spec=pathlib.Path)
@@ -113,6 +163,16 @@ class TestState(base.BaseTestCase):
         self.assertRaises(
             NotImplementedError, state.State.load, 42, self.offset)
 
+    @staticmethod
+    def _generate_buffers(size):
+        """Returns writable buffers of different types and given size."""
+        return (
+            bytearray(size),
+            memoryview(bytearray(size)),
+            mmap.mmap(-1, size),
+            array.array('I', bytes(size))
+        )
+
     def test_state_not_allowed_sizes(self):
         """Tests initializing State of not allowed sizes."""
         sizes = self._generate_sizes(
@@ -0,0 +1,507 @@
+"""Module for testing AES file-like objects."""
+
+import asyncio
+import functools
+import gzip
+import io
+import pickle
+import tarfile
+import unittest
+from concurrent import futures
+from unittest import mock
+
+import padding
+
+from aes import errors
+from aes import modes
+from aes import streams
+from aes.cipher import Cipher
+from aes.key import Key
+from aes.modes import xts
+
+import base
+
+
+class _CountingIO(io.BytesIO):
+    """Bytes stream counting read bytes."""
+
+    def __init__(self, data):
+        super().__init__(data)
+        self.count = 0
+
+    def read(self, size=-1):
+        data = super().read(size)
+        self.count += len(data)
+
+        return data
+
+
+class _Writer:
+    """Asyncio stream writer collecting data."""
+
+    def __init__(self):
+        self.data = bytearray()
+        self.drained = 0
+
+    def write(self, data):
+        """Collects data."""
+        self.data += data
+
+    async def drain(self):
+        """Counts waiting for drain."""
+        self.drained += 1
+
+
+class _InlinePool(futures.ProcessPoolExecutor):
+    """Process pool running tasks in caller and keeping their contexts."""
+
+    def __init__(self):
+        super().__init__(1)
+        self.contexts = []
+
+    def submit(self, fn, /, *args, **kwargs):
+        self.contexts.append(args[0])
+        future = futures.Future()
+        future.set_result(fn(*args, **kwargs))
+
+        return future
+
+
+class _KeptIO(io.BytesIO):
+    """Bytes stream keeping its value after closing."""
+
+    value = None
+
+    def close(self):
+        if not self.closed:
+            self.value = self.getvalue()
+
+        super().close()
+
+
+@mock.patch('aes.streams.CHUNK_SIZE', 100)
+class TestAESStreamsWrappers(base.BaseTestCase):
+    """Tests for encrypting writer and decrypting reader."""
+
+    def setUp(self):
+        self.key = Key(bytes(range(16)))
+        self.plaintext = bytes(range(256)) * 3 + b'tail'
+        self.options = {
+            'cbc': (bytes(16), {'scheme': padding.BIT}),
+            'ctr': (bytes(16), {}),
+            'ecb': (None, {'scheme': padding.PKCS7}),
+            'gcm': (bytes(12), {'tag_size': 12})
+        }
+
+    def _encrypt(self, mode, data, pieces=1):
+        """Returns data written by pieces through encrypting writer."""
+        iv, options = self.options[mode]
+        raw = _KeptIO()
+
+        with streams.EncryptingWriter(
+                raw, self.key, mode, iv, **options) as writer:
+            for index in range(pieces):
+                writer.write(data[
+                    len(data) * index // pieces:
+                    len(data) * (index + 1) // pieces
+                ])
+
+            self.assertEqual(len(data), writer.tell())
+
+        return raw.value
+
+    def _reader(self, mode, data):
+        """Returns decrypting reader of data."""
+        iv, options = self.options[mode]
+
+        return streams.DecryptingReader(
+            io.BytesIO(data), self.key, mode, iv, **options)
+
+    def test_encrypt(self):
+        """Tests writing data by pieces equals encrypting it at once."""
+        for mode, (iv, options) in self.options.items():
+            encryptor = Cipher(self.key, mode, iv, **options).encryptor()
+            expected = encryptor.update(self.plaintext) + encryptor.finalize()
+            expected += getattr(encryptor, 'tag', None) or b''
+
+            for pieces in (1, 3, 50):
+                with self.subTest(mode=mode, pieces=pieces):
+                    self.assertEqual(
+                        expected, self._encrypt(mode, self.plaintext, pieces))
+
+    def test_decrypt(self):
+        """Tests reading decrypted data by pieces."""
+        for mode in self.options:
+            ciphertext = self._encrypt(mode, self.plaintext)
+
+            for size in (1, 17, 1000):
+                reader = self._reader(mode, ciphertext)
+
+                with self.subTest(mode=mode, size=size):
+                    result = b''.join(
+                        iter(functools.partial(reader.read, size), b''))
+
+                    self.assertEqual(self.plaintext, result)
+                    self.assertEqual(b'', reader.read())
+
+    def test_default_padding(self):
+        """Tests block modes using bit padding by default."""
+        raw = _KeptIO()
+        with streams.EncryptingWriter(raw, self.key) as writer:
+            writer.write(b'data')
+
+        decryptor = Cipher(self.key, scheme=padding.BIT).decryptor()
+
+        self.assertEqual(
+            b'data', decryptor.update(raw.value) + decryptor.finalize())
+        self.assertEqual(
+            b'data', streams.DecryptingReader(
+                io.BytesIO(raw.value), self.key).read())
+
+    def test_empty(self):
+        """Tests writing and reading no data."""
+        for mode in self.options:
+            with self.subTest(mode=mode):
+                self.assertEqual(
+                    b'', self._reader(mode, self._encrypt(mode, b'')).read())
+
+    def test_wrong_tag(self):
+        """Tests reading data with wrong or missing tag."""
+        ciphertext = self._encrypt('gcm', self.plaintext)
+
+        self.assertRaises(
+            errors.AuthenticationError,
+            self._reader('gcm', ciphertext[:-1] + b'\x00').read)
+        self.assertRaises(
+            errors.StateSizeError, self._reader('gcm', ciphertext[:11]).read)
+
+    def test_wrong_size(self):
+        """Tests reading data of size not multiple of block size."""
+        reader = self._reader('ecb', bytes(self.size + 1))
+
+        self.assertRaises(errors.StateSizeError, reader.read)
+
+    def test_flush(self):
+        """Tests flushing whole blocks of written data."""
+        raw = _KeptIO()
+        writer = streams.EncryptingWriter(raw, self.key, 'ctr', bytes(16))
+        writer.write(b'data')
+        writer.flush()
+
+        self.assertEqual(4, len(raw.getvalue()))
+
+        writer.close()
+
+        self.assertRaises(ValueError, writer.flush)
+
+    def test_closed(self):
+        """Tests closing wrappers with raw files."""
+        raw = _KeptIO()
+        writer = streams.EncryptingWriter(raw, self.key)
+        reader = self._reader('ecb', self._encrypt('ecb', b''))
+
+        self.assertTrue(writer.writable())
+        self.assertTrue(reader.readable())
+
+        writer.close()
+        writer.close()
+        reader.close()
+        reader.close()
+
+        self.assertTrue(raw.closed)
+        self.assertRaises(ValueError, writer.write, b'data')
+        self.assertRaises(ValueError, writer.tell)
+        self.assertRaises(ValueError, reader.read)
+
+    def test_close_error(self):
+        """Tests closing raw file when final data is wrong."""
+        raw = _KeptIO()
+        writer = streams.EncryptingWriter(
+            raw, Key(bytes(32)), 'xts', bytes(16))
+        writer.write(b'short')
+
+        self.assertRaises(errors.StateSizeError, writer.close)
+        self.assertTrue(writer.closed)
+        self.assertTrue(raw.closed)
+
+    def test_compose(self):
+        """Tests tar archive compressed by gzip through wrappers."""
+        raw = _KeptIO()
+        info = tarfile.TarInfo('data')
+        info.size = len(self.plaintext)
+
+        with streams.EncryptingWriter(raw, self.key) as writer:
+            with gzip.GzipFile(fileobj=writer, mode='wb') as compressed:
+                with tarfile.open(fileobj=compressed, mode='w') as archive:
+                    archive.addfile(info, io.BytesIO(self.plaintext))
+
+        raw = io.BytesIO(raw.value)
+        with streams.DecryptingReader(raw, self.key) as reader:
+            with tarfile.open(fileobj=reader, mode='r|gz') as archive:
+                member = archive.next()
+
+                self.assertEqual(
+                    self.plaintext, archive.extractfile(member).read())
+
+
+@mock.patch('aes.streams.CHUNK_SIZE', 100)
+class TestAESStreamsAsync(base.BaseTestCase):
+    """Tests for encrypting and decrypting asyncio streams."""
+
+    def setUp(self):
+        self.key = Key(bytes(range(16)))
+        self.plaintext = bytes(range(256)) * 3 + b'tail'
+
+    def _run(self, function, data, **options):
+        """Returns writer after running function over data."""
+        async def run():
+            reader = asyncio.StreamReader()
+            reader.feed_data(data)
+            reader.feed_eof()
+            writer = _Writer()
+
+            await function(reader, writer, self.key, **options)
+
+            return writer
+
+        return asyncio.run(run())
+
+    def test_streams(self):
+        """Tests encrypting and decrypting streams in every mode."""
+        with futures.ThreadPoolExecutor(1) as executor:
+            for mode in sorted(modes.MODES):
+                iv = bytes(modes.get(mode).IV_SIZE or 0) or None
+                key = Key(bytes(range(32))) if mode == 'xts' else self.key
+                cipher = Cipher(key, mode, iv, scheme=(
+                    padding.BIT if mode in ('cbc', 'ecb') else None))
+                encryptor = cipher.encryptor()
+                expected = (
+                    encryptor.update(self.plaintext) + encryptor.finalize())
+                expected += getattr(encryptor, 'tag', None) or b''
+
+                with self.subTest(mode=mode):
+                    self.key = key
+                    encrypted = self._run(
+                        streams.encrypt_stream, self.plaintext,
+                        executor=executor, mode=mode, iv=iv)
+                    decrypted = self._run(
+                        streams.decrypt_stream, expected, mode=mode, iv=iv)
+
+                    self.assertEqual(expected, encrypted.data)
+                    self.assertEqual(self.plaintext, decrypted.data)
+                    self.assertEqual(
+                        -(-len(self.plaintext) // 100) + 1, encrypted.drained)
+
+    @mock.patch.dict('aes.streams._KEYS')
+    def test_streams_processes(self):
+        """Tests sending only states of contexts to process pool."""
+        xts_key = Key(bytes(range(32)))
+        streams.initialize(self.key, xts.load_key(xts_key))
+
+        for mode, key, iv in (
+                ('ctr', self.key, bytes(16)),
+                ('gcm', self.key, bytes(12)),
+                ('xts', xts_key, bytes(16))
+        ):
+            encryptor = Cipher(key, mode, iv).encryptor()
+            expected = encryptor.update(self.plaintext) + encryptor.finalize()
+            expected += getattr(encryptor, 'tag', None) or b''
+
+            with self.subTest(mode=mode), _InlinePool() as executor:
+                self.key = key
+                encrypted = self._run(
+                    streams.encrypt_stream, self.plaintext,
+                    executor=executor, mode=mode, iv=iv)
+
+                self.assertEqual(expected, encrypted.data)
+                self.assertEqual(8, len(executor.contexts))
+                for context in executor.contexts:
+                    self.assertIsInstance(context, bytes)
+                    self.assertLess(len(context), 1024)
+
+    def test_streams_processes_no_key(self):
+        """Tests process pool without key given to workers."""
+        with _InlinePool() as executor:
+            self.assertRaises(
+                pickle.UnpicklingError, self._run, streams.encrypt_stream,
+                self.plaintext, executor=executor)
+
+    def test_empty(self):
+        """Tests encrypting and decrypting empty streams."""
+        encrypted = self._run(streams.encrypt_stream, b'')
+        decrypted = self._run(streams.decrypt_stream, bytes(encrypted.data))
+
+        self.assertEqual(self.size, len(encrypted.data))
+        self.assertEqual(b'', decrypted.data)
+
+    def test_wrong_tag(self):
+        """Tests decrypting stream with wrong or missing tag."""
+        options = {'mode': 'gcm', 'iv': bytes(12)}
+        encrypted = bytes(
+            self._run(streams.encrypt_stream, self.plaintext, **options).data)
+
+        self.assertRaises(
+            errors.AuthenticationError, self._run, streams.decrypt_stream,
+            encrypted[:-1] + b'\x00', **options)
+        self.assertRaises(
+            errors.StateSizeError, self._run, streams.decrypt_stream,
+            encrypted[:15], **options)
+
+
+class TestAESStreamsSeekableReader(base.BaseTestCase):
+    """Tests for seekable decrypting reader."""
+
+    def setUp(self):
+        self.key = Key(bytes(range(16)))
+        self.iv = bytes(range(16, 32))
+        self.plaintext = bytes(range(256)) * 3 + b'tail'
+
+    def _encrypt(self, mode, iv=None, scheme=None):
+        """Returns plaintext encrypted in mode."""
+        encryptor = Cipher(self.key, mode, iv, scheme=scheme).encryptor()
+
+        return encryptor.update(self.plaintext) + encryptor.finalize()
+
+    def _reader(self, mode='ecb', iv=None, scheme=None, raw=None):
+        """Returns reader over plaintext encrypted in mode."""
+        if raw is None:
+            raw = io.BytesIO(self._encrypt(
+                mode, iv, scheme if mode == 'ctr' else scheme or 'bit'))
+
+        return streams.SeekableReader(raw, self.key, mode, iv, scheme=scheme)
+
+    def test_read_ranges(self):
+        """Tests reading ranges in all seekable modes."""
+        for mode, iv, scheme in (
+                ('cbc', self.iv, None),
+                ('ctr', self.iv, None),
+                ('ecb', None, padding.BIT),
+                ('ecb', None, padding.PKCS7)
+        ):
+            reader = self._reader(mode, iv, scheme)
+
+            for start in range(0, len(self.plaintext) + 20, 37):
+                for size in (1, 15, 16, 17, 100, 1000):
+                    with self.subTest(mode=mode, start=start, size=size):
+                        reader.seek(start)
+
+                        self.assertEqual(
+                            self.plaintext[start:start + size],
+                            reader.read(size)
+                        )
+
+    def test_read_all(self):
+        """Tests reading whole data in chunks."""
+        reader = self._reader('ctr', self.iv)
+
+        with mock.patch('aes.streams.CHUNK_SIZE', 100):
+            self.assertEqual(100, len(reader.read(1000)))
+            self.assertEqual(self.plaintext[100:], reader.read())
+            self.assertEqual(b'', reader.read())
+
+    def test_read_range_only(self):
+        """Tests reading only blocks covering range."""
+        for mode, iv in (('cbc', self.iv), ('ctr', self.iv), ('ecb', None)):
+            raw = _CountingIO(self._encrypt(
+                mode, iv, None if mode == 'ctr' else 'bit'))
+            reader = self._reader(mode, iv, raw=raw)
+            self.assertEqual(len(self.plaintext), reader.size)
+            raw.count = 0
+
+            with self.subTest(mode=mode):
+                reader.seek(self.size * 10 + 5)
+
+                self.assertEqual(
+                    self.plaintext[self.size * 10 + 5:self.size * 11 + 5],
+                    reader.read(self.size)
+                )
+                self.assertLessEqual(raw.count, 3 * self.size)
+
+    def test_readinto(self):
+        """Tests reading into buffer."""
+        reader = self._reader()
+        buffer = bytearray(20)
+        reader.seek(-10, io.SEEK_END)
+
+        self.assertEqual(10, reader.readinto(buffer))
+        self.assertEqual(self.plaintext[-10:], buffer[:10])
+        self.assertEqual(0, reader.readinto(buffer))
+
+    def test_seek(self):
+        """Tests seeking relative to all positions."""
+        reader = self._reader()
+
+        self.assertEqual(10, reader.seek(10))
+        self.assertEqual(15, reader.seek(5, io.SEEK_CUR))
+        self.assertEqual(15, reader.tell())
+        self.assertEqual(
+            len(self.plaintext) - 1, reader.seek(-1, io.SEEK_END))
+        self.assertEqual(self.plaintext[-1:], reader.read())
+        self.assertEqual(len(self.plaintext) + 5, reader.seek(5, io.SEEK_END))
+        self.assertEqual(b'', reader.read())
+
+    def test_seek_invalid(self):
+        """Tests seeking to negative position or with invalid whence."""
+        reader = self._reader()
+
+        self.assertRaises(ValueError, reader.seek, -1)
+        self.assertRaises(ValueError, reader.seek, -1, io.SEEK_CUR)
+        self.assertRaises(ValueError, reader.seek, 0, 3)
+
+    def test_invalid_arguments(self):
+        """Tests rejecting unsupported mode, wrong IV and padding."""
+        raw = io.BytesIO()
+
+        self.assertRaises(
+            ValueError, streams.SeekableReader, raw, self.key, 'gcm',
+            bytes(12))
+        self.assertRaises(
+            errors.IVSizeError, streams.SeekableReader, raw, self.key, 'ctr')
+        self.assertRaises(
+            errors.IVSizeError, streams.SeekableReader, raw, self.key, 'ecb',
+            self.iv)
+        self.assertRaises(
+            ValueError, streams.SeekableReader, raw, self.key, 'ctr',
+            self.iv, scheme=padding.BIT)
+
+    def test_wrong_size(self):
+        """Tests file of size not multiple of block size."""
+        for data in (b'', bytes(self.size + 1)):
+            reader = self._reader(raw=io.BytesIO(data))
+
+            with self.subTest(size=len(data)):
+                self.assertRaises(errors.StateSizeError, reader.read)
+
+    def test_truncated(self):
+        """Tests reading raw data ending in partial block."""
+        raw = io.BytesIO(self._encrypt('ecb', scheme=padding.BIT))
+        reader = self._reader(raw=raw)
+        reader.seek(reader.size - 1)
+        raw.truncate(len(raw.getvalue()) - 1)
+
+        self.assertRaises(errors.StateSizeError, reader.read)
+
+    def test_wrong_padding(self):
+        """Tests file with malformed padding."""
+        raw = io.BytesIO(self._encrypt('ecb', scheme=padding.PKCS7))
+        reader = self._reader(scheme=padding.BIT, raw=raw)
+
+        self.assertRaises(padding.PaddingError, reader.read)
+
+    def test_close(self):
+        """Tests closing reader with raw file."""
+        raw = io.BytesIO()
+        reader = self._reader('ctr', self.iv, raw=raw)
+
+        self.assertTrue(reader.readable())
+        self.assertTrue(reader.seekable())
+
+        reader.close()
+        reader.close()
+
+        self.assertTrue(raw.closed)
+        self.assertTrue(reader.closed)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -39,6 +39,17 @@ class TestAESUtils(base.BaseTestCase):
         ]
         self.word = random.choices(range(256), k=4)
 
+    @staticmethod
+    def _multiply(first, second):
+        result = 0x00
+        while second:
+            if second & 0x01:
+                result ^= first
+            first = (first << 1) ^ (0x11B if first & 0x80 else 0x00)
+            second >>= 1
+
+        return result
+
     def test_galois_mul(self):
         """Tests multiplication in Galois Field."""
         for vector, expected in zip(self.input_vectors, self.output_vectors):
@@ -52,6 +63,24 @@ class TestAESUtils(base.BaseTestCase):
                 self.assertEqual(
                     expected, utils.galois_mul(vector, inverse=True))
 
+    def test_galois_mul_random(self):
+        """Tests multiplication in Galois Field of random vectors."""
+        matrices = {
+            False: constants.FORWARD_MIX_COLUMNS,
+            True: constants.INVERSE_MIX_COLUMNS
+        }
+        for inverse, matrix in matrices.items():
+            for _ in range(self.tests):
+                vector = random.choices(range(256), k=4)
+                expected = [0x00] * 4
+                for row_idx, row in enumerate(matrix):
+                    for multiplier, elem in zip(row, vector):
+                        expected[row_idx] ^= self._multiply(multiplier, elem)
+
+                with self.subTest(inverse=inverse, vector=vector):
+                    self.assertEqual(
+                        expected, utils.galois_mul(vector, inverse=inverse))
+
     @mock.patch('aes.utils.xor_vectors')
     def test_next_word(self, xor_vectors_mock):
         """Tests getting next word."""
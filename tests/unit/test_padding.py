@@ -1,5 +1,6 @@
 """Module for testing padding."""
 
+import io
 import pathlib
 import unittest
 
@@ -23,6 +24,18 @@ class TestPadding(base.BaseTestCase):
 
                 self.assertFalse(len(data) % self.size)
 
+    def test_add_pkcs7(self):
+        """Tests adding PKCS#7 padding."""
+        for size in range(self.tests):
+            data = bytearray(self._generate_data(size))
+
+            with self.subTest(size=size):
+                padding.add(data, self.size, scheme=padding.PKCS7)
+
+                count = self.size - size % self.size
+                self.assertEqual(size + count, len(data))
+                self.assertEqual(bytes((count,)) * count, data[size:])
+
     def test_add_to_file(self):
         """Tests adding padding to file."""
         file_mock = mock.MagicMock(spec=pathlib.Path)
@@ -31,20 +44,20 @@ class TestPadding(base.BaseTestCase):
 
         file_handler_mock = open_mock.return_value
         for size in range(self.size):
-            file_handler_mock.tell.return_value = size + 1
+            file_handler_mock.seek.return_value = size
 
-            with self.subTest(size=size):
-                open_mock.reset_mock()
+            for scheme in padding.SCHEMES:
+                with self.subTest(size=size, scheme=scheme):
+                    open_mock.reset_mock()
 
-                with mock.patch('builtins.open', open_mock):
-                    padding.add(file_mock, self.size)
+                    with mock.patch('builtins.open', open_mock):
+                        padding.add(file_mock, self.size, scheme=scheme)
 
-                open_mock.assert_called_once_with(file_mock, 'ab')
-                file_handler_mock.write.assert_any_call(b'\x01')
-                file_handler_mock.tell.assert_called_once()
-                zeros_padding = b'\x00' * (
-                    self.size - file_handler_mock.tell() % self.size)
-                file_handler_mock.write.assert_any_call(zeros_padding)
+                    open_mock.assert_called_once_with(file_mock, 'ab')
+                    file_handler_mock.seek.assert_called_once_with(
+                        0, io.SEEK_END)
+                    file_handler_mock.write.assert_called_once_with(
+                        padding.generate(size, self.size, scheme=scheme))
 
     def test_add_to_non_bytes(self):
         """Tests adding padding to non-bytes."""
@@ -62,35 +75,87 @@ class TestPadding(base.BaseTestCase):
                 self.assertEqual(size, len(data))
 
     def test_remove_from_file(self):
-        """Tests removing padding from file."""
+        """Tests removing padding from file with a single read."""
         file_mock = mock.MagicMock(spec=pathlib.Path)
 
+        for size in range(self.tests):
+            for scheme in padding.SCHEMES:
+                data = bytearray(self._generate_data(size))
+                padding.add(data, self.size, scheme=scheme)
+                tail = bytes(data[-padding.MAX_SIZE - 1:])
+
+                open_mock = mock.mock_open(read_data=tail)
+
+                file_handler_mock = open_mock.return_value
+                file_handler_mock.seek.return_value = len(data)
+
+                with self.subTest(size=size, scheme=scheme):
+                    with mock.patch('builtins.open', open_mock):
+                        padding.remove(
+                            file_mock, scheme=scheme, size=self.size)
+
+                    open_mock.assert_called_once_with(file_mock, 'rb+')
+                    file_handler_mock.seek.assert_called_with(
+                        max(len(data) - self.size - 1, 0))
+                    file_handler_mock.read.assert_called_once_with()
+                    file_handler_mock.truncate.assert_called_once_with(size)
+
+    def test_remove_malformed(self):
+        """Tests removing malformed padding."""
+        samples = {
+            padding.BIT: (b'', bytes(self.size), b'\x02' + bytes(3)),
+            padding.PKCS7: (b'', bytes(self.size), b'\x01\x03\x03')
+        }
+        for scheme, datas in samples.items():
+            for data in datas:
+                with self.subTest(scheme=scheme, data=data):
+                    self.assertRaises(
+                        padding.PaddingError,
+                        padding.remove,
+                        bytearray(data),
+                        scheme=scheme
+                    )
+
+    def test_remove_pkcs7_over_size(self):
+        """Tests removing PKCS#7 padding longer than block."""
+        data = bytes((self.size + 1,)) * (self.size + 1)
+
+        self.assertRaises(
+            padding.PaddingError,
+            padding.remove,
+            bytearray(data),
+            scheme=padding.PKCS7,
+            size=self.size
+        )
+
+        padded = bytearray(data)
+        padding.remove(padded, scheme=padding.PKCS7)
+
+        self.assertEqual(b'', padded)
+
+    def test_remove_pkcs7(self):
+        """Tests removing PKCS#7 padding."""
         for size in range(self.tests):
             data = self._generate_data(size)
-            data += b'\x01'
-            zeros = (self.size - (size + 1) % self.size)
-            data += b'\x00' * zeros
-
-            open_mock = mock.mock_open(file_mock, data)
-
-            file_handler_mock = open_mock.return_value
-            file_handler_mock.tell.return_value = size + 1
+            padded = bytearray(data)
+            padding.add(padded, self.size, scheme=padding.PKCS7)
 
             with self.subTest(size=size):
-                open_mock.reset_mock()
-
-                with mock.patch('builtins.open', open_mock):
-                    padding.remove(file_mock)
+                padding.remove(padded, scheme=padding.PKCS7)
 
-                open_mock.assert_called_once_with(file_mock, 'ab+')
-                file_handler_mock.seek.assert_any_call(-1, 1)
-                file_handler_mock.read.assert_called_with(1)
-                file_handler_mock.truncate.assert_called_with(size)
+                self.assertEqual(data, padded)
 
     def test_remove_from_non_bytes(self):
         """Tests removing padding from non-bytes."""
         self.assertRaises(NotImplementedError, padding.remove, 42)
 
+    def test_unknown_scheme(self):
+        """Tests padding with unknown scheme."""
+        self.assertRaises(
+            ValueError, padding.generate, 0, self.size, scheme='zero')
+        self.assertRaises(
+            ValueError, padding.measure, b'\x01', scheme='zero')
+
 
 if __name__ == "__main__":
     unittest.main()
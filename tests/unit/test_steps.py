@@ -35,13 +35,13 @@ class TestSteps(base.BaseTestCase):
         steps.add_round_key(
             self.state, self.key.schedule, current_round=current_round)
 
+        round_key = self.key.schedule[current_round]
+
         for row_id, row in enumerate(previous):
             for col_id, elem in enumerate(row):
-                key_schedule_col_id = 4 * current_round + col_id
-
                 with self.subTest(ids=(row_id, col_id)):
                     self.assertEqual(
-                        elem ^ self.key.schedule[row_id][key_schedule_col_id],
+                        elem ^ round_key[4 * col_id + row_id],
                         self.state[row_id][col_id]
                     )
 
@@ -1,79 +1,545 @@
 """Module for testing AES tool actions."""
 
+import io
+import itertools
 import pathlib
+import tempfile
 import unittest
 
 from unittest import mock
 
 from aes import constants
 from aes import errors
+from aes import modes
+from aes.key import Key
+from aes.modes import gcm
+from aes.modes import xts
 from tool import actions
 
+import padding
+
 import base
 
+_KEY = Key(bytes(4 * constants.NB))
+
 
 class TestToolActions(base.BaseTestCase):
     """Tests for AES tool actions."""
 
-    @mock.patch('padding.remove')
-    @mock.patch('aes.decrypt')
-    @mock.patch('aes.state.State.load')
-    @mock.patch('aes.key.Key.load')
-    def test_tool_decrypt(
-            self,
-            key_load_mock,
-            state_load_mock,
-            decrypt_mock,
-            padding_remove_mock
-    ):
-        """Tests decrypting file."""
-        file_mock = mock.MagicMock(spec=pathlib.Path)
+    # pylint: disable=too-many-public-methods
 
-        key_file_mock = mock.MagicMock(spec=pathlib.Path)
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.file = pathlib.Path(directory.name, 'file')
+
+    @staticmethod
+    def _generate_options(schemes):
+        """Returns pairs of schemes and mapped flags."""
+        return itertools.product(schemes, (False, True))
+
+    def test_tool_check_chunk_size(self):
+        """Tests checking chunk sizes."""
+        for size in (16, 4 * constants.NB << 10, actions.DEFAULT_CHUNK_SIZE):
+            with self.subTest(size=size):
+                actions.check_chunk_size(size)
+
+        for size in (-16, 0, 1, 17, 4 * constants.NB + 8):
+            with self.subTest(size=size):
+                self.assertRaises(
+                    errors.ChunkSizeError, actions.check_chunk_size, size)
+
+    @mock.patch('aes.engines.get')
+    @mock.patch('aes.key.Key.load', return_value=_KEY)
+    def test_tool_decrypt(self, key_load_mock, engines_get_mock):
+        """Tests decrypting file in place with padding schemes."""
+        engines_get_mock.return_value.decrypt_blocks.side_effect = _invert
+
+        for scheme, mapped in self._generate_options(padding.SCHEMES):
+            for size in range(0, self.tests, 7):
+                data = self._generate_data(size)
+                padded = bytearray(data)
+                padding.add(padded, self.size, scheme=scheme)
+
+                with self.subTest(scheme=scheme, mapped=mapped, size=size):
+                    self._write_data(self.file, _invert(padded))
+
+                    actions.decrypt(
+                        self.file,
+                        'key',
+                        chunk_size=32,
+                        mapped=mapped,
+                        scheme=scheme
+                    )
+
+                    self.assertEqual(data, self._read_data(self.file))
+                    key_load_mock.assert_called_with('key', cached=True)
+
+    @mock.patch('aes.engines.get')
+    @mock.patch('aes.key.Key.load', return_value=_KEY)
+    def test_tool_decrypt_malformed_padding(self, _, engines_get_mock):
+        """Tests decrypting file with malformed padding."""
+        engines_get_mock.return_value.decrypt_blocks.side_effect = _invert
+
+        for scheme, mapped in self._generate_options(padding.SCHEMES):
+            self._write_data(self.file, bytes(2 * self.size))
+
+            with self.subTest(scheme=scheme, mapped=mapped):
+                self.assertRaises(
+                    padding.PaddingError,
+                    actions.decrypt,
+                    self.file,
+                    'key',
+                    mapped=mapped,
+                    scheme=scheme
+                )
+
+    @mock.patch('aes.engines.get')
+    @mock.patch('aes.key.Key.load', return_value=_KEY)
+    def test_tool_decrypt_wrong_size(self, _, engines_get_mock):
+        """Tests decrypting file of not whole blocks."""
+        engines_get_mock.return_value.decrypt_blocks.side_effect = _invert
+
+        for scheme, mapped in self._generate_options(actions.SCHEMES):
+            for size in (0, 15, 17, 42):
+                if scheme == actions.CIPHERTEXT_STEALING and size > self.size:
+                    continue
+
+                self._write_data(self.file, bytes(size))
+
+                with self.subTest(scheme=scheme, mapped=mapped, size=size):
+                    self.assertRaises(
+                        errors.StateSizeError,
+                        actions.decrypt,
+                        self.file,
+                        'key',
+                        mapped=mapped,
+                        scheme=scheme
+                    )
+
+    @mock.patch('aes.engines.get')
+    @mock.patch('aes.key.Key.load', return_value=_KEY)
+    def test_tool_decrypt_stream(self, key_load_mock, engines_get_mock):
+        """Tests decrypting stream by chunks."""
         key_mock = key_load_mock.return_value
+        decrypt_blocks_mock = engines_get_mock.return_value.decrypt_blocks
+        chunk_size = None
 
-        state_mock = mock.MagicMock()
-        state_load_mock.side_effect = [state_mock, None]
+        def process(data, key):
+            self.assertIs(key_mock, key)
+            self.assertLessEqual(len(data), chunk_size + 8 * constants.NB)
+            return bytes(data)
 
-        actions.decrypt(file_mock, key_file_mock)
+        decrypt_blocks_mock.side_effect = process
 
-        key_load_mock.assert_called_once_with(key_file_mock)
-        self.assertEqual(2, state_load_mock.call_count)
-        state_load_mock.assert_any_call(file_mock, 0)
-        state_load_mock.assert_any_call(file_mock, 4 * constants.NB)
-        decrypt_mock.assert_called_once_with(state_mock, key_mock)
-        state_mock.dump.assert_called_once_with(file_mock, 0)
-        padding_remove_mock.assert_called_once_with(file_mock)
+        for size in range(self.tests):
+            data = self._generate_data(size)
+            padded = bytearray(data)
+            padding.add(padded, 4 * constants.NB)
 
-    @mock.patch('aes.encrypt')
-    @mock.patch('aes.state.State.load')
-    @mock.patch('aes.key.Key.load')
-    @mock.patch('padding.add')
-    def test_tool_encrypt(
+            for chunk_size in (16, 32, 48):
+                source, target = io.BytesIO(padded), io.BytesIO()
+
+                with self.subTest(size=size, chunk_size=chunk_size):
+                    actions.decrypt_stream(
+                        source, target, 'key', chunk_size=chunk_size)
+
+                    self.assertEqual(data, target.getvalue())
+
+    @mock.patch('aes.engines.get')
+    @mock.patch('aes.key.Key.load', return_value=_KEY)
+    def test_tool_decrypt_stream_wrong_size(
             self,
-            padding_add_mock,
             key_load_mock,
-            state_load_mock,
-            encrypt_mock
+            engines_get_mock
     ):
-        """Tests encrypting file."""
-        file_mock = mock.MagicMock(spec=pathlib.Path)
+        """Tests decrypting stream of not whole blocks."""
+        for size in (0, 15, 17, 42):
+            source, target = io.BytesIO(bytes(size)), io.BytesIO()
+
+            with self.subTest(size=size):
+                self.assertRaises(
+                    errors.StateSizeError,
+                    actions.decrypt_stream,
+                    source,
+                    target,
+                    'key'
+                )
+
+        key_load_mock.assert_called_with('key', cached=True)
+        engines_get_mock.return_value.decrypt_blocks.assert_not_called()
+
+    @mock.patch('aes.engines.get')
+    @mock.patch('aes.key.Key.load', return_value=_KEY)
+    def test_tool_decrypt_to(self, key_load_mock, engines_get_mock):
+        """Tests decrypting file into output and in place atomically."""
+        engines_get_mock.return_value.decrypt_blocks.side_effect = _invert
+        output = self.file.with_name('output')
+
+        for scheme in padding.SCHEMES:
+            data = self._generate_data(self.tests)
+            padded = bytearray(data)
+            padding.add(padded, self.size, scheme=scheme)
+
+            for output_path in (output, self.file):
+                self._write_data(self.file, _invert(padded))
+
+                with self.subTest(scheme=scheme, output=output_path):
+                    actions.decrypt_to(
+                        self.file,
+                        output_path,
+                        'key',
+                        chunk_size=32,
+                        scheme=scheme
+                    )
+
+                    self.assertEqual(data, self._read_data(output_path))
+                    self.assertEqual(
+                        {self.file, output}, set(self.file.parent.iterdir()))
+                    key_load_mock.assert_called_with('key', cached=True)
+
+    @mock.patch('aes.engines.get')
+    @mock.patch('aes.key.Key.load', return_value=_KEY)
+    def test_tool_decrypt_to_failure(self, _, engines_get_mock):
+        """Tests failed decrypting leaves output untouched."""
+        engines_get_mock.return_value.decrypt_blocks.side_effect = _invert
+        self._write_data(self.file, bytes(2 * self.size))
 
+        self.assertRaises(
+            padding.PaddingError,
+            actions.decrypt_to,
+            self.file,
+            self.file,
+            'key'
+        )
+        self.assertEqual(bytes(2 * self.size), self._read_data(self.file))
+        self.assertEqual([self.file], list(self.file.parent.iterdir()))
+
+    @mock.patch('aes.key.Key.load', return_value=_KEY)
+    def test_tool_decrypt_wrong_chunk_size(self, key_load_mock):
+        """Tests decrypting file with wrong chunk size."""
+        file_mock = mock.MagicMock(spec=pathlib.Path)
         key_file_mock = mock.MagicMock(spec=pathlib.Path)
+
+        self.assertRaises(
+            errors.ChunkSizeError,
+            actions.decrypt,
+            file_mock,
+            key_file_mock,
+            chunk_size=42
+        )
+        key_load_mock.assert_not_called()
+
+    @mock.patch('aes.engines.get')
+    @mock.patch('aes.key.Key.load', return_value=_KEY)
+    def test_tool_encrypt(self, key_load_mock, engines_get_mock):
+        """Tests encrypting file in place with padding schemes."""
+        engines_get_mock.return_value.encrypt_blocks.side_effect = _invert
+
+        for scheme, mapped in self._generate_options(padding.SCHEMES):
+            for size in range(0, self.tests, 7):
+                data = self._generate_data(size)
+                padded = bytearray(data)
+                padding.add(padded, self.size, scheme=scheme)
+
+                with self.subTest(scheme=scheme, mapped=mapped, size=size):
+                    self._write_data(self.file, data)
+
+                    actions.encrypt(
+                        self.file,
+                        'key',
+                        chunk_size=32,
+                        mapped=mapped,
+                        scheme=scheme
+                    )
+
+                    self.assertEqual(
+                        _invert(padded), self._read_data(self.file))
+                    key_load_mock.assert_called_with('key', cached=True)
+
+    @mock.patch('aes.engines.get')
+    @mock.patch('aes.key.Key.load', return_value=_KEY)
+    def test_tool_encrypt_stealing(self, _, engines_get_mock):
+        """Tests ciphertext stealing keeps file size and reverts."""
+        engines_get_mock.return_value.encrypt_blocks.side_effect = _invert
+        engines_get_mock.return_value.decrypt_blocks.side_effect = _invert
+
+        options = self._generate_options((actions.CIPHERTEXT_STEALING,))
+        for scheme, mapped in options:
+            for size in range(self.size, self.tests, 7):
+                data = self._generate_data(size)
+
+                with self.subTest(mapped=mapped, size=size):
+                    self._write_data(self.file, data)
+
+                    actions.encrypt(
+                        self.file, 'key', mapped=mapped, scheme=scheme)
+                    encrypted = self._read_data(self.file)
+                    actions.decrypt(
+                        self.file, 'key', mapped=mapped, scheme=scheme)
+
+                    self.assertEqual(size, len(encrypted))
+                    self.assertNotEqual(data, encrypted)
+                    self.assertEqual(data, self._read_data(self.file))
+
+    @mock.patch('aes.engines.get')
+    @mock.patch('aes.key.Key.load', return_value=_KEY)
+    def test_tool_encrypt_stealing_short(self, _, engines_get_mock):
+        """Tests ciphertext stealing of less than a block."""
+        engines_get_mock.return_value.encrypt_blocks.side_effect = _invert
+
+        options = self._generate_options((actions.CIPHERTEXT_STEALING,))
+        for scheme, mapped in options:
+            for size in (0, 1, self.size - 1):
+                self._write_data(self.file, bytes(size))
+
+                with self.subTest(mapped=mapped, size=size):
+                    self.assertRaises(
+                        errors.StateSizeError,
+                        actions.encrypt,
+                        self.file,
+                        'key',
+                        mapped=mapped,
+                        scheme=scheme
+                    )
+
+    @mock.patch('aes.engines.get')
+    @mock.patch('aes.key.Key.load', return_value=_KEY)
+    def test_tool_encrypt_stream(self, key_load_mock, engines_get_mock):
+        """Tests encrypting stream by chunks."""
         key_mock = key_load_mock.return_value
+        encrypt_blocks_mock = engines_get_mock.return_value.encrypt_blocks
+        chunk_size = None
+
+        def process(data, key):
+            self.assertIs(key_mock, key)
+            self.assertLessEqual(len(data), chunk_size + 8 * constants.NB)
+            return bytes(data)
+
+        encrypt_blocks_mock.side_effect = process
+
+        for size in range(self.tests):
+            data = self._generate_data(size)
+            padded = bytearray(data)
+            padding.add(padded, 4 * constants.NB)
+
+            for chunk_size in (16, 32, 48):
+                source, target = io.BytesIO(data), io.BytesIO()
+
+                with self.subTest(size=size, chunk_size=chunk_size):
+                    actions.encrypt_stream(
+                        source, target, 'key', chunk_size=chunk_size)
+
+                    self.assertEqual(padded, target.getvalue())
+                    key_load_mock.assert_called_with('key', cached=True)
+
+    @mock.patch('aes.engines.get')
+    @mock.patch('aes.key.Key.load', return_value=_KEY)
+    def test_tool_encrypt_to(self, key_load_mock, engines_get_mock):
+        """Tests encrypting file into output keeping its mode."""
+        engines_get_mock.return_value.encrypt_blocks.side_effect = _invert
+        output = self.file.with_name('output')
+
+        for scheme in padding.SCHEMES:
+            data = self._generate_data(self.tests)
+            padded = bytearray(data)
+            padding.add(padded, self.size, scheme=scheme)
+            self._write_data(self.file, data)
+            self.file.chmod(0o640)
+
+            with self.subTest(scheme=scheme):
+                actions.encrypt_to(
+                    self.file, output, 'key', chunk_size=32, scheme=scheme)
+
+                self.assertEqual(data, self._read_data(self.file))
+                self.assertEqual(_invert(padded), self._read_data(output))
+                self.assertEqual(
+                    self.file.stat().st_mode, output.stat().st_mode)
+                key_load_mock.assert_called_with('key', cached=True)
+
+    @mock.patch('aes.key.Key.load', return_value=_KEY)
+    def test_tool_encrypt_wrong_chunk_size(self, key_load_mock):
+        """Tests encrypting file with wrong chunk size."""
+        file_mock = mock.MagicMock(spec=pathlib.Path)
+        key_file_mock = mock.MagicMock(spec=pathlib.Path)
+
+        self.assertRaises(
+            errors.ChunkSizeError,
+            actions.encrypt,
+            file_mock,
+            key_file_mock,
+            chunk_size=0
+        )
+        key_load_mock.assert_not_called()
+
+    @mock.patch('aes.key.Key.load', return_value=_KEY)
+    def test_tool_encrypt_modes(self, _):
+        """Tests encrypting and decrypting file with modes of operation."""
+        for mode, mapped in self._generate_options(
+                ('cbc', 'cfb', 'ctr', 'gcm', 'ofb')
+        ):
+            iv = self._generate_data(modes.get(mode).IV_SIZE)
+
+            for size in range(0, self.tests, 7):
+                data = self._generate_data(size)
+                self._write_data(self.file, data)
+
+                with self.subTest(mode=mode, mapped=mapped, size=size):
+                    for action in (actions.encrypt, actions.decrypt):
+                        action(
+                            self.file,
+                            'key',
+                            chunk_size=32,
+                            mapped=mapped,
+                            mode=mode,
+                            iv=iv
+                        )
 
-        state_mock = mock.MagicMock()
-        state_load_mock.side_effect = [state_mock, None]
+                    self.assertEqual(data, self._read_data(self.file))
 
-        actions.encrypt(file_mock, key_file_mock)
+    def test_tool_encrypt_units(self):
+        """Tests encrypting and decrypting file by data units."""
+        key_file = self.file.with_name('key')
+        self._write_data(key_file, self._generate_data(32))
+        iv = xts.unit_tweak(42)
 
-        padding_add_mock.assert_called_once_with(file_mock, 4 * constants.NB)
-        key_load_mock.assert_called_once_with(key_file_mock)
-        self.assertEqual(2, state_load_mock.call_count)
-        state_load_mock.assert_any_call(file_mock, 0)
-        state_load_mock.assert_any_call(file_mock, 4 * constants.NB)
-        encrypt_mock.assert_called_once_with(state_mock, key_mock)
-        state_mock.dump.assert_called_once_with(file_mock, 0)
+        for mapped in (False, True):
+            for size in range(self.size, self.tests, 7):
+                data = self._generate_data(size)
+                self._write_data(self.file, data)
+                options = {
+                    'chunk_size': 48,
+                    'mapped': mapped,
+                    'mode': 'xts',
+                    'iv': iv,
+                    'unit_size': 2 * self.size
+                }
+
+                with self.subTest(mapped=mapped, size=size):
+                    if 0 < size % (2 * self.size) < self.size:
+                        for action in (actions.encrypt, actions.decrypt):
+                            self.assertRaises(
+                                errors.StateSizeError,
+                                action,
+                                self.file,
+                                key_file,
+                                **options
+                            )
+
+                            self.assertEqual(data, self._read_data(self.file))
+                        continue
+
+                    for action in (actions.encrypt, actions.decrypt):
+                        action(self.file, key_file, **options)
+
+                    self.assertEqual(data, self._read_data(self.file))
+
+    def test_tool_encrypt_units_short(self):
+        """Tests processing data ending with unit shorter than block."""
+        key_file = self.file.with_name('key')
+        self._write_data(key_file, self._generate_data(32))
+        output = self.file.with_name('output')
+        data = self._generate_data(2 * self.size + 1)
+        self._write_data(self.file, data)
+        options = {'mode': 'xts', 'iv': xts.unit_tweak(0)}
+
+        for action in (actions.decrypt_to, actions.encrypt_to):
+            with self.subTest(action=action):
+                self.assertRaises(
+                    errors.StateSizeError, action, self.file, output,
+                    key_file, unit_size=2 * self.size, **options)
+
+                self.assertFalse(output.exists())
+
+        for action in (actions.decrypt_stream, actions.encrypt_stream):
+            with self.subTest(action=action):
+                source = io.BytesIO(bytes(self.size) + data)
+                target = io.BytesIO()
+                source.seek(self.size)
+
+                self.assertRaises(
+                    errors.StateSizeError, action, source, target,
+                    key_file, unit_size=2 * self.size, **options)
+
+                self.assertEqual(b'', target.getvalue())
+                self.assertEqual(self.size, source.tell())
+
+                source.seek(0)
+                action(source, target, key_file, unit_size=2 * self.size,
+                       **options)
+
+                self.assertEqual(
+                    self.size + len(data), len(target.getvalue()))
+
+    @mock.patch('aes.key.Key.load', return_value=_KEY)
+    def test_tool_decrypt_authenticated(self, _):
+        """Tests decrypting tampered or truncated authenticated files."""
+        iv = self._generate_data(gcm.IV_SIZE)
+        data = self._generate_data(self.tests)
+
+        for mapped in (False, True):
+            self._write_data(self.file, data)
+            actions.encrypt(self.file, 'key', mode='gcm', iv=iv)
+            encrypted = bytearray(self._read_data(self.file))
+            encrypted[0 if mapped else -1] ^= 1
+
+            with self.subTest(mapped=mapped):
+                for content, error in (
+                        (encrypted, errors.AuthenticationError),
+                        (encrypted[:gcm.TAG_SIZE - 1], errors.StateSizeError)
+                ):
+                    self._write_data(self.file, content)
+
+                    self.assertRaises(
+                        error,
+                        actions.decrypt,
+                        self.file,
+                        'key',
+                        mapped=mapped,
+                        mode='gcm',
+                        iv=iv
+                    )
+                    self.assertEqual(content, self._read_data(self.file))
+
+    @mock.patch('aes.key.Key.load', return_value=_KEY)
+    def test_tool_encrypt_wrong_mode_scheme(self, _):
+        """Tests encrypting with padding scheme not suiting mode."""
+        iv = bytes(4 * constants.NB)
+
+        for mode, scheme in (
+                ('cbc', actions.CIPHERTEXT_STEALING),
+                ('ctr', padding.BIT)
+        ):
+            self._write_data(self.file, bytes(iv))
+
+            with self.subTest(mode=mode, scheme=scheme):
+                self.assertRaises(
+                    ValueError,
+                    actions.encrypt,
+                    self.file,
+                    'key',
+                    scheme=scheme,
+                    mode=mode,
+                    iv=iv
+                )
+
+    @mock.patch('tool.parallel.process')
+    def test_tool_jobs(self, process_mock):
+        """Tests decrypting and encrypting file by jobs."""
+        for action, options in (
+                (actions.decrypt, {'inverse': True}),
+                (actions.encrypt, {})
+        ):
+            process_mock.reset_mock()
+
+            with self.subTest(action=action.__name__):
+                action(self.file, 'key', chunk_size=32, jobs=2, mode='ecb')
+
+                process_mock.assert_called_once_with(
+                    self.file, 'key', jobs=2, chunk_size=32, mode='ecb',
+                    **options)
+                self.assertRaises(
+                    ValueError, action, self.file, 'key', mapped=True, jobs=2)
 
     @mock.patch('secrets.token_bytes')
     def test_tool_generate(self, token_bytes_mock):
@@ -82,7 +548,7 @@ class TestToolActions(base.BaseTestCase):
 
         key_file_mock = mock.MagicMock(spec=pathlib.Path)
 
-        for size in constants.ALLOWED_KEY_SIZES:
+        for size in constants.ALLOWED_KEY_SIZES | constants.XTS_KEY_SIZES:
             open_mock = mock.mock_open(key_file_mock)
 
             file_handler_mock = open_mock.return_value
@@ -119,5 +585,13 @@ class TestToolActions(base.BaseTestCase):
             file_handler_mock.assert_not_called()
 
 
+def _invert(data, *_):
+    """Inverts bits of whole blocks instead of real cipher."""
+    if len(data) % (4 * constants.NB):
+        raise errors.StateSizeError()
+
+    return bytes(byte ^ 0xFF for byte in data)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -8,13 +8,27 @@ import unittest
 from unittest import mock
 
 from tool import __main__
+from tool import actions
 
 from aes import constants
 
 import base
 
-
-class TestMain(base.BaseTestCase):
+_WRONG_MODE_ARGUMENTS = (
+    '--iv {iv}',
+    '-m cbc',
+    '-m cbc --iv 00',
+    '-m cbc --iv zz',
+    '-m cbc --iv {iv} -p cts',
+    '-m ctr --iv {iv} -p bit',
+    '-m gcm --iv {iv}',
+    '--unit-size 512',
+    '-m xts --iv {iv} --unit-size 42',
+    '-m unknown --iv {iv}',
+)
+
+
+class TestMain(base.BaseTestCase):  # pylint: disable=too-many-public-methods
     """Tests for AES tool main."""
 
     @classmethod
@@ -41,7 +55,261 @@ class TestMain(base.BaseTestCase):
 
         __main__.main(*command)
 
-        decrypt_mock.assert_called_once_with(self.file, self.key)
+        decrypt_mock.assert_called_once_with(
+            self.file,
+            self.key,
+            chunk_size=actions.DEFAULT_CHUNK_SIZE,
+            mapped=False,
+            scheme=None,
+            mode=actions.DEFAULT_MODE,
+            iv=None
+        )
+
+    @mock.patch('tool.actions.decrypt')
+    def test_main_decrypt_chunk_size(self, decrypt_mock):
+        """Tests decrypting with chunk size."""
+        command = f'decrypt -c 4096 {self.file.name} {self.key.name}'.split()
+
+        __main__.main(*command)
+
+        decrypt_mock.assert_called_once_with(
+            self.file,
+            self.key,
+            chunk_size=4096,
+            mapped=False,
+            scheme=None,
+            mode=actions.DEFAULT_MODE,
+            iv=None
+        )
+
+    @mock.patch('tool.actions.decrypt')
+    def test_main_decrypt_wrong_chunk_size(self, decrypt_mock):
+        """Tests decrypting with wrong chunk sizes."""
+        for size in ('0', '42', 'MiB'):
+            command = (
+                f'decrypt --chunk-size {size} {self.file.name} {self.key.name}'
+            ).split()
+
+            with self.subTest(size=size):
+                self.assertRaises(SystemExit, __main__.main, *command)
+
+        decrypt_mock.assert_not_called()
+
+    @mock.patch('tool.actions.decrypt')
+    def test_main_decrypt_mmap(self, decrypt_mock):
+        """Tests decrypting memory-mapped file."""
+        command = f'decrypt --mmap {self.file.name} {self.key.name}'.split()
+
+        __main__.main(*command)
+
+        decrypt_mock.assert_called_once_with(
+            self.file,
+            self.key,
+            chunk_size=actions.DEFAULT_CHUNK_SIZE,
+            mapped=True,
+            scheme=None,
+            mode=actions.DEFAULT_MODE,
+            iv=None
+        )
+
+    @mock.patch('sys.stdout')
+    @mock.patch('sys.stdin')
+    @mock.patch('tool.actions.decrypt_stream')
+    def test_main_decrypt_stream(
+            self,
+            decrypt_stream_mock,
+            stdin_mock,
+            stdout_mock
+    ):
+        """Tests decrypting stdin to stdout."""
+        command = f'decrypt -c 32 - {self.key.name}'.split()
+
+        __main__.main(*command)
+
+        decrypt_stream_mock.assert_called_once_with(
+            stdin_mock.buffer,
+            stdout_mock.buffer,
+            self.key,
+            chunk_size=32,
+            scheme=None,
+            mode=actions.DEFAULT_MODE,
+            iv=None
+        )
+
+    @mock.patch('tool.actions.decrypt_stream')
+    def test_main_decrypt_stream_mmap(self, decrypt_stream_mock):
+        """Tests decrypting stdin to stdout with memory mapping."""
+        command = f'decrypt --mmap - {self.key.name}'.split()
+
+        self.assertRaises(SystemExit, __main__.main, *command)
+        decrypt_stream_mock.assert_not_called()
+
+    @mock.patch('tool.actions.decrypt')
+    def test_main_decrypt_padding(self, decrypt_mock):
+        """Tests decrypting with padding schemes."""
+        for scheme in actions.SCHEMES:
+            command = (
+                f'decrypt -p {scheme} {self.file.name} {self.key.name}'
+            ).split()
+
+            with self.subTest(scheme=scheme):
+                decrypt_mock.reset_mock()
+
+                __main__.main(*command)
+
+                decrypt_mock.assert_called_once_with(
+                    self.file,
+                    self.key,
+                    chunk_size=actions.DEFAULT_CHUNK_SIZE,
+                    mapped=False,
+                    scheme=scheme,
+                    mode=actions.DEFAULT_MODE,
+                    iv=None
+                )
+
+        command = f'decrypt -p zero {self.file.name} {self.key.name}'.split()
+
+        with self.subTest(scheme='zero'):
+            decrypt_mock.reset_mock()
+
+            self.assertRaises(SystemExit, __main__.main, *command)
+            decrypt_mock.assert_not_called()
+
+    @mock.patch('tool.actions.decrypt')
+    def test_main_decrypt_mode(self, decrypt_mock):
+        """Tests decrypting with modes of operation."""
+        iv = self._generate_data(4 * constants.NB)
+
+        for mode in ('cbc', 'cfb', 'ctr', 'ofb'):
+            command = (
+                f'decrypt -m {mode} --iv {iv.hex()} '
+                f'{self.file.name} {self.key.name}'
+            ).split()
+
+            with self.subTest(mode=mode):
+                decrypt_mock.reset_mock()
+
+                __main__.main(*command)
+
+                decrypt_mock.assert_called_once_with(
+                    self.file,
+                    self.key,
+                    chunk_size=actions.DEFAULT_CHUNK_SIZE,
+                    mapped=False,
+                    scheme=None,
+                    mode=mode,
+                    iv=iv
+                )
+
+    @mock.patch('tool.actions.decrypt')
+    @mock.patch('tool.actions.decrypt_to')
+    def test_main_decrypt_authenticated(self, decrypt_to_mock, decrypt_mock):
+        """Tests decrypting authenticated file in place atomically."""
+        iv = self._generate_data(12)
+        command = (
+            f'decrypt -m gcm --iv {iv.hex()} {self.file.name} {self.key.name}'
+        ).split()
+
+        __main__.main(*command)
+
+        decrypt_to_mock.assert_called_once_with(
+            self.file,
+            self.file,
+            self.key,
+            chunk_size=actions.DEFAULT_CHUNK_SIZE,
+            scheme=None,
+            mode='gcm',
+            iv=iv
+        )
+
+        self.assertRaises(
+            SystemExit, __main__.main, 'decrypt', '--mmap', *command[1:])
+        decrypt_mock.assert_not_called()
+
+    @mock.patch('sys.stdout')
+    @mock.patch('sys.stdin')
+    @mock.patch('tool.actions.decrypt_stream')
+    def test_main_decrypt_authenticated_stream(
+            self,
+            decrypt_stream_mock,
+            stdin_mock,
+            stdout_mock
+    ):
+        """Tests decrypting authenticated stdin to stdout."""
+        iv = self._generate_data(12)
+        command = f'decrypt -m gcm --iv {iv.hex()} - {self.key.name}'.split()
+
+        __main__.main(*command)
+
+        decrypt_stream_mock.assert_called_once_with(
+            stdin_mock.buffer,
+            stdout_mock.buffer,
+            self.key,
+            chunk_size=actions.DEFAULT_CHUNK_SIZE,
+            scheme=None,
+            mode='gcm',
+            iv=iv
+        )
+
+    @mock.patch('tool.actions.decrypt')
+    def test_main_decrypt_wrong_mode(self, decrypt_mock):
+        """Tests decrypting with arguments not suiting mode."""
+        iv = self._generate_data(4 * constants.NB).hex()
+
+        for arguments in _WRONG_MODE_ARGUMENTS:
+            command = (
+                f'decrypt {arguments.format(iv=iv)} '
+                f'{self.file.name} {self.key.name}'
+            ).split()
+
+            with self.subTest(arguments=arguments):
+                self.assertRaises(SystemExit, __main__.main, *command)
+
+        decrypt_mock.assert_not_called()
+
+    @mock.patch('tool.actions.decrypt_to')
+    def test_main_decrypt_to(self, decrypt_to_mock):
+        """Tests decrypting into output or atomically in place."""
+        output = pathlib.Path('output')
+        options = {'-o output': output, '--atomic': self.file}
+
+        for option, output_path in options.items():
+            command = f'decrypt {option} {self.file.name} {self.key.name}'
+
+            with self.subTest(option=option):
+                decrypt_to_mock.reset_mock()
+
+                __main__.main(*command.split())
+
+                decrypt_to_mock.assert_called_once_with(
+                    self.file,
+                    output_path,
+                    self.key,
+                    chunk_size=actions.DEFAULT_CHUNK_SIZE,
+                    scheme=None,
+                    mode=actions.DEFAULT_MODE,
+                    iv=None
+                )
+
+    @mock.patch('tool.actions.decrypt_to')
+    @mock.patch('tool.actions.decrypt_stream')
+    @mock.patch('tool.actions.decrypt')
+    def test_main_decrypt_to_conflicts(self, *decrypt_mocks):
+        """Tests decrypting with conflicting output options."""
+        options = ('--mmap -o output', '--atomic -o output', '--mmap --atomic')
+        commands = [
+            f'decrypt {option} {self.file.name} {self.key.name}'
+            for option in options
+        ]
+        commands.append(f'decrypt -o output - {self.key.name}')
+        commands.append(f'decrypt --atomic - {self.key.name}')
+
+        for command in commands:
+            with self.subTest(command=command):
+                self.assertRaises(SystemExit, __main__.main, *command.split())
+
+        for decrypt_mock in decrypt_mocks:
+            decrypt_mock.assert_not_called()
 
     @mock.patch('tool.actions.decrypt')
     def test_main_decrypt_no_file(self, decrypt_mock):
@@ -66,7 +334,276 @@ class TestMain(base.BaseTestCase):
 
         __main__.main(*command)
 
-        encrypt_mock.assert_called_once_with(self.file, self.key)
+        encrypt_mock.assert_called_once_with(
+            self.file,
+            self.key,
+            chunk_size=actions.DEFAULT_CHUNK_SIZE,
+            mapped=False,
+            scheme=None,
+            mode=actions.DEFAULT_MODE,
+            iv=None
+        )
+
+    @mock.patch('tool.actions.encrypt')
+    def test_main_encrypt_chunk_size(self, encrypt_mock):
+        """Tests encrypting with chunk size."""
+        command = f'encrypt -c 4096 {self.file.name} {self.key.name}'.split()
+
+        __main__.main(*command)
+
+        encrypt_mock.assert_called_once_with(
+            self.file,
+            self.key,
+            chunk_size=4096,
+            mapped=False,
+            scheme=None,
+            mode=actions.DEFAULT_MODE,
+            iv=None
+        )
+
+    @mock.patch('tool.actions.encrypt')
+    def test_main_encrypt_wrong_chunk_size(self, encrypt_mock):
+        """Tests encrypting with wrong chunk sizes."""
+        for size in ('0', '42', 'MiB'):
+            command = (
+                f'encrypt --chunk-size {size} {self.file.name} {self.key.name}'
+            ).split()
+
+            with self.subTest(size=size):
+                self.assertRaises(SystemExit, __main__.main, *command)
+
+        encrypt_mock.assert_not_called()
+
+    @mock.patch('tool.actions.encrypt')
+    def test_main_encrypt_mmap(self, encrypt_mock):
+        """Tests encrypting memory-mapped file."""
+        command = f'encrypt --mmap {self.file.name} {self.key.name}'.split()
+
+        __main__.main(*command)
+
+        encrypt_mock.assert_called_once_with(
+            self.file,
+            self.key,
+            chunk_size=actions.DEFAULT_CHUNK_SIZE,
+            mapped=True,
+            scheme=None,
+            mode=actions.DEFAULT_MODE,
+            iv=None
+        )
+
+    @mock.patch('sys.stdout')
+    @mock.patch('sys.stdin')
+    @mock.patch('tool.actions.encrypt_stream')
+    def test_main_encrypt_stream(
+            self,
+            encrypt_stream_mock,
+            stdin_mock,
+            stdout_mock
+    ):
+        """Tests encrypting stdin to stdout."""
+        command = f'encrypt -c 32 - {self.key.name}'.split()
+
+        __main__.main(*command)
+
+        encrypt_stream_mock.assert_called_once_with(
+            stdin_mock.buffer,
+            stdout_mock.buffer,
+            self.key,
+            chunk_size=32,
+            scheme=None,
+            mode=actions.DEFAULT_MODE,
+            iv=None
+        )
+
+    @mock.patch('tool.actions.encrypt_stream')
+    def test_main_encrypt_stream_mmap(self, encrypt_stream_mock):
+        """Tests encrypting stdin to stdout with memory mapping."""
+        command = f'encrypt --mmap - {self.key.name}'.split()
+
+        self.assertRaises(SystemExit, __main__.main, *command)
+        encrypt_stream_mock.assert_not_called()
+
+    @mock.patch('tool.actions.encrypt')
+    def test_main_encrypt_padding(self, encrypt_mock):
+        """Tests encrypting with padding schemes."""
+        for scheme in actions.SCHEMES:
+            command = (
+                f'encrypt -p {scheme} {self.file.name} {self.key.name}'
+            ).split()
+
+            with self.subTest(scheme=scheme):
+                encrypt_mock.reset_mock()
+
+                __main__.main(*command)
+
+                encrypt_mock.assert_called_once_with(
+                    self.file,
+                    self.key,
+                    chunk_size=actions.DEFAULT_CHUNK_SIZE,
+                    mapped=False,
+                    scheme=scheme,
+                    mode=actions.DEFAULT_MODE,
+                    iv=None
+                )
+
+        command = f'encrypt -p zero {self.file.name} {self.key.name}'.split()
+
+        with self.subTest(scheme='zero'):
+            encrypt_mock.reset_mock()
+
+            self.assertRaises(SystemExit, __main__.main, *command)
+            encrypt_mock.assert_not_called()
+
+    @mock.patch('tool.actions.encrypt')
+    def test_main_encrypt_mode(self, encrypt_mock):
+        """Tests encrypting with modes of operation."""
+        iv = self._generate_data(4 * constants.NB)
+
+        for mode in ('cbc', 'cfb', 'ctr', 'ofb'):
+            command = (
+                f'encrypt -m {mode} --iv {iv.hex()} '
+                f'{self.file.name} {self.key.name}'
+            ).split()
+
+            with self.subTest(mode=mode):
+                encrypt_mock.reset_mock()
+
+                __main__.main(*command)
+
+                encrypt_mock.assert_called_once_with(
+                    self.file,
+                    self.key,
+                    chunk_size=actions.DEFAULT_CHUNK_SIZE,
+                    mapped=False,
+                    scheme=None,
+                    mode=mode,
+                    iv=iv
+                )
+
+    @mock.patch('tool.actions.encrypt')
+    def test_main_encrypt_wrong_mode(self, encrypt_mock):
+        """Tests encrypting with arguments not suiting mode."""
+        iv = self._generate_data(4 * constants.NB).hex()
+
+        for arguments in _WRONG_MODE_ARGUMENTS:
+            command = (
+                f'encrypt {arguments.format(iv=iv)} '
+                f'{self.file.name} {self.key.name}'
+            ).split()
+
+            with self.subTest(arguments=arguments):
+                self.assertRaises(SystemExit, __main__.main, *command)
+
+        encrypt_mock.assert_not_called()
+
+    @mock.patch('tool.actions.encrypt')
+    def test_main_encrypt_unit_size(self, encrypt_mock):
+        """Tests encrypting by data units of given size."""
+        iv = self._generate_data(4 * constants.NB)
+        command = (
+            f'encrypt -m xts --iv {iv.hex()} --unit-size 512 '
+            f'{self.file.name} {self.key.name}'
+        ).split()
+
+        __main__.main(*command)
+
+        encrypt_mock.assert_called_once_with(
+            self.file,
+            self.key,
+            chunk_size=actions.DEFAULT_CHUNK_SIZE,
+            mapped=False,
+            scheme=None,
+            mode='xts',
+            iv=iv,
+            unit_size=512
+        )
+
+    @mock.patch('tool.actions.encrypt')
+    def test_main_encrypt_jobs(self, encrypt_mock):
+        """Tests encrypting file by jobs."""
+        command = f'encrypt -j 4 {self.file.name} {self.key.name}'.split()
+
+        __main__.main(*command)
+
+        encrypt_mock.assert_called_once_with(
+            self.file,
+            self.key,
+            chunk_size=actions.DEFAULT_CHUNK_SIZE,
+            mapped=False,
+            scheme=None,
+            mode=actions.DEFAULT_MODE,
+            iv=None,
+            jobs=4
+        )
+
+    @mock.patch('tool.actions.encrypt_stream')
+    @mock.patch('tool.actions.encrypt')
+    def test_main_encrypt_wrong_jobs(self, *encrypt_mocks):
+        """Tests encrypting by wrong number of jobs or in wrong mode."""
+        iv = self._generate_data(4 * constants.NB).hex()
+
+        for arguments in (
+                '-j 0 FILE',
+                '-j many FILE',
+                '-j 2 --mmap FILE',
+                '-j 2 -p cts FILE',
+                f'-j 2 -m cbc --iv {iv} FILE',
+                '-j 2 -'
+        ):
+            command = (
+                f'encrypt {arguments.replace("FILE", self.file.name)} '
+                f'{self.key.name}'
+            ).split()
+
+            with self.subTest(arguments=arguments):
+                self.assertRaises(SystemExit, __main__.main, *command)
+
+        for encrypt_mock in encrypt_mocks:
+            encrypt_mock.assert_not_called()
+
+    @mock.patch('tool.actions.encrypt_to')
+    def test_main_encrypt_to(self, encrypt_to_mock):
+        """Tests encrypting into output or atomically in place."""
+        output = pathlib.Path('output')
+        options = {'-o output': output, '--atomic': self.file}
+
+        for option, output_path in options.items():
+            command = f'encrypt {option} {self.file.name} {self.key.name}'
+
+            with self.subTest(option=option):
+                encrypt_to_mock.reset_mock()
+
+                __main__.main(*command.split())
+
+                encrypt_to_mock.assert_called_once_with(
+                    self.file,
+                    output_path,
+                    self.key,
+                    chunk_size=actions.DEFAULT_CHUNK_SIZE,
+                    scheme=None,
+                    mode=actions.DEFAULT_MODE,
+                    iv=None
+                )
+
+    @mock.patch('tool.actions.encrypt_to')
+    @mock.patch('tool.actions.encrypt_stream')
+    @mock.patch('tool.actions.encrypt')
+    def test_main_encrypt_to_conflicts(self, *encrypt_mocks):
+        """Tests encrypting with conflicting output options."""
+        options = ('--mmap -o output', '--atomic -o output', '--mmap --atomic')
+        commands = [
+            f'encrypt {option} {self.file.name} {self.key.name}'
+            for option in options
+        ]
+        commands.append(f'encrypt -o output - {self.key.name}')
+        commands.append(f'encrypt --atomic - {self.key.name}')
+
+        for command in commands:
+            with self.subTest(command=command):
+                self.assertRaises(SystemExit, __main__.main, *command.split())
+
+        for encrypt_mock in encrypt_mocks:
+            encrypt_mock.assert_not_called()
 
     @mock.patch('tool.actions.encrypt')
     def test_main_encrypt_no_file(self, encrypt_mock):
@@ -87,7 +624,7 @@ class TestMain(base.BaseTestCase):
     @mock.patch('tool.actions.generate')
     def test_main_generate(self, generate_mock):
         """Tests generating keys."""
-        for size in constants.ALLOWED_KEY_SIZES:
+        for size in constants.ALLOWED_KEY_SIZES | constants.XTS_KEY_SIZES:
             command = f'generate -s {size} {self.key.name}'.split()
 
             with self.subTest(size=size):
@@ -0,0 +1,178 @@
+"""Module for testing AES tool parallel processing."""
+
+import io
+import pathlib
+import tempfile
+import unittest
+
+from concurrent import futures
+from unittest import mock
+
+import padding
+
+from aes import errors
+from aes.cipher import Cipher
+from aes.key import Key
+from tool import parallel
+
+import base
+
+
+@mock.patch(
+    'concurrent.futures.ProcessPoolExecutor', futures.ThreadPoolExecutor)
+class TestToolParallel(base.BaseTestCase):
+    """Tests for processing file by ranges in worker processes."""
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.file = pathlib.Path(directory.name, 'file')
+        self.key = Key(self._generate_data(16))
+        self.iv = self._generate_data(16)
+
+    def test_process(self):
+        """Tests encrypting and decrypting file by jobs in both modes."""
+        for mode, iv, scheme in (
+                ('ctr', self.iv, None),
+                ('ecb', None, None),
+                ('ecb', None, padding.PKCS7)
+        ):
+            cipher = Cipher(
+                self.key, mode, iv, scheme=scheme or (
+                    padding.BIT if mode == 'ecb' else None))
+
+            for size in (0, 1, 16, 100, 1000):
+                for jobs in (1, 3):
+                    data = self._generate_data(size)
+                    self._write_data(self.file, data)
+                    encryptor = cipher.encryptor()
+
+                    with self.subTest(mode=mode, size=size, jobs=jobs):
+                        parallel.process(
+                            self.file, self.key, jobs=jobs, chunk_size=32,
+                            mode=mode, iv=iv, scheme=scheme)
+
+                        self.assertEqual(
+                            encryptor.update(data) + encryptor.finalize(),
+                            self._read_data(self.file))
+
+                        parallel.process(
+                            self.file, self.key, jobs=jobs, chunk_size=32,
+                            inverse=True, mode=mode, iv=iv, scheme=scheme)
+
+                        self.assertEqual(data, self._read_data(self.file))
+
+    def test_process_options(self):
+        """Tests processing with key data and options of mode."""
+        data = self._generate_data(100)
+        self._write_data(self.file, data)
+        cipher = Cipher(self.key, 'ctr', self.iv, counter_size=1)
+
+        parallel.process(
+            self.file, self.key.data, jobs=2, chunk_size=16, mode='ctr',
+            iv=self.iv, counter_size=1)
+
+        self.assertEqual(
+            cipher.encryptor().update(data), self._read_data(self.file))
+
+    def test_process_wrong_arguments(self):
+        """Tests processing with wrong jobs, mode, padding or iv."""
+        data = self._generate_data(100)
+        self._write_data(self.file, data)
+
+        for jobs, options in (
+                (0, {}),
+                (2, {'mode': 'cbc', 'iv': self.iv}),
+                (2, {'mode': 'ctr', 'iv': self.iv, 'scheme': padding.BIT}),
+                (2, {'scheme': 'cts'})
+        ):
+            with self.subTest(jobs=jobs, options=options):
+                self.assertRaises(
+                    ValueError, parallel.process, self.file, self.key,
+                    jobs=jobs, chunk_size=16, **options)
+
+                self.assertEqual(data, self._read_data(self.file))
+
+        self.assertRaises(
+            errors.IVSizeError, parallel.process, self.file, self.key,
+            jobs=2, chunk_size=16, iv=self.iv)
+        self.assertEqual(data, self._read_data(self.file))
+
+    def test_process_wrong_size(self):
+        """Tests decrypting file of wrong size in ECB mode."""
+        for size in (0, 17):
+            self._write_data(self.file, bytes(size))
+
+            with self.subTest(size=size):
+                self.assertRaises(
+                    errors.StateSizeError, parallel.process, self.file,
+                    self.key, jobs=2, chunk_size=16, inverse=True)
+
+    def test_process_padding_untouched(self):
+        """Tests padding does not change file before workers finish."""
+        data = self._generate_data(100)
+        encryptor = Cipher(self.key, scheme=padding.PKCS7).encryptor()
+        encrypted = encryptor.update(data) + encryptor.finalize()
+
+        for inverse, content in ((False, data), (True, encrypted)):
+            self._write_data(self.file, content)
+
+            with self.subTest(inverse=inverse), mock.patch(
+                    'tool.parallel._process', side_effect=OSError
+            ):
+                self.assertRaises(
+                    OSError, parallel.process, self.file, self.key, jobs=2,
+                    chunk_size=16, inverse=inverse, scheme=padding.PKCS7)
+
+                self.assertEqual(content, self._read_data(self.file))
+
+    def test_process_wrong_padding(self):
+        """Tests decrypting malformed padding before touching file."""
+        data = Cipher(self.key).encryptor().update(bytes(32))
+        self._write_data(self.file, data)
+
+        for scheme in padding.SCHEMES:
+            with self.subTest(scheme=scheme):
+                self.assertRaises(
+                    padding.PaddingError, parallel.process, self.file,
+                    self.key, jobs=2, chunk_size=16, inverse=True,
+                    scheme=scheme)
+
+                self.assertEqual(data, self._read_data(self.file))
+
+    def test_process_partial_io(self):
+        """Tests reading and writing raw file by parts."""
+        # pylint: disable=protected-access
+        file = mock.MagicMock(spec=io.RawIOBase)
+        file.readinto.side_effect = lambda buffer: len(buffer[:3])
+        file.write.side_effect = lambda data: len(data[:3])
+
+        parallel._read(file, memoryview(bytearray(10)))
+        parallel._write(file, bytes(10))
+
+        self.assertEqual(4, file.readinto.call_count)
+        self.assertEqual(4, file.write.call_count)
+
+        file.readinto.side_effect = (3, 0)
+
+        self.assertRaises(
+            errors.StateSizeError, parallel._read, file,
+            memoryview(bytearray(10)))
+
+    def test_ranges(self):
+        """Tests splitting file into block-aligned ranges."""
+        for size, jobs, expected in (
+                (0, 4, []),
+                (10, 4, [(0, 10)]),
+                (64, 4, [(0, 16), (16, 16), (32, 16), (48, 16)]),
+                (100, 3, [(0, 48), (48, 48), (96, 4)])
+        ):
+            with self.subTest(size=size, jobs=jobs):
+                # pylint: disable=protected-access
+                offsets, sizes = parallel._ranges(size, jobs)
+
+                self.assertEqual(expected, list(zip(offsets, sizes)))
+
+
+if __name__ == '__main__':
+    unittest.main()